@@ -12,10 +12,9 @@ from core.exceptions import (
 from cli.cli_exceptions import CommandExecError
 from cli.command_parser import Command
 from cli.board_view import render_game
-from cli.hint_engine import suggest_move  # heurístico, no muta estado
-
-import json
-from dataclasses import asdict, is_dataclass
+from cli.hint_engine import suggest_move  # búsqueda sobre una copia, no muta estado
+from cli.save_load import DEFAULT_SAVE_PATH, load_from_path, save_to_path
+from storage import StorageError
 
 
 class CommandRunner:
@@ -54,11 +53,18 @@ class CommandRunner:
         if cmd.name == "undo":
             return (False, self._do_undo())
 
+        if cmd.name == "redo":
+            return (False, self._do_redo())
+
         if cmd.name == "save":
             # El parser avanzado debería setear cmd.path; si no existe, elegimos uno por defecto
-            path = getattr(cmd, "path", None) or "saved_game.json"
+            path = getattr(cmd, "path", None) or DEFAULT_SAVE_PATH
             return (False, self._do_save(path))
 
+        if cmd.name == "load":
+            path = getattr(cmd, "path", None) or DEFAULT_SAVE_PATH
+            return (False, self._do_load(path))
+
         # Comando desconocido (no debería llegar si el parser valida bien)
         raise CommandExecError(f"Comando no soportado: {cmd.name}")
 
@@ -127,7 +133,7 @@ class CommandRunner:
 
     def _do_hint(self) -> str:
         """
-        Heurística no intrusiva: NO muta el estado del juego.
+        Sugerencia no intrusiva: NO muta el estado del juego.
         """
         try:
             suggestion = suggest_move(self.game)
@@ -138,54 +144,58 @@ class CommandRunner:
 
     def _do_undo(self) -> str:
         """
-        Deshacer el último movimiento si el motor lo soporta.
+        Deshacer el último movimiento del turno si el motor lo soporta.
         Si no existe, devolvemos un mensaje claro.
         """
         if not hasattr(self.game, "undo_last_move"):
             return "Deshacer no está disponible en este motor."
 
         try:
-            self.game.undo_last_move()
+            undone = self.game.undo_last_move()
+        except BackgammonException as ex:
+            raise CommandExecError(str(ex)) from ex
+        if undone is False:
+            return "No hay movimientos para deshacer en este turno."
+        return self._after_history_change("Se deshizo el último movimiento.")
+
+    def _do_redo(self) -> str:
+        """Rehacer el último movimiento deshecho (si el motor lo soporta)."""
+        if not hasattr(self.game, "redo"):
+            return "Rehacer no está disponible en este motor."
+
+        try:
+            redone = self.game.redo()
         except BackgammonException as ex:
             raise CommandExecError(str(ex)) from ex
+        if not redone:
+            return "No hay movimientos para rehacer."
+        return self._after_history_change("Se rehízo el movimiento.")
 
+    def _after_history_change(self, msg: str) -> str:
         st = self.game.state()
         view = render_game(self.game)
         return (
-            f"Se deshizo el último movimiento. Dados: {tuple(st.dice_values)} "
+            f"{msg} Dados: {tuple(st.dice_values)} "
             f"(movimientos: {st.moves_left})\n\n{view}"
         )
 
     def _do_save(self, path: str) -> str:
         """
-        Guarda un snapshot mínimo del estado. Intenta serializar con sentido común
-        sin acoplarse a detalles internos.
+        Guarda el estado completo de la partida (tablero, dados, turno y
+        resultado) con storage.save_game; .bgs/.bin usa el formato binario.
         """
-        st = self.game.state()
-
-        def _to_dict(obj):
-            if is_dataclass(obj):
-                return asdict(obj)
-            if isinstance(obj, (list, tuple)):
-                return list(obj)
-            if hasattr(obj, "__dict__"):
-                # SimpleNamespace u objetos simples
-                return dict(vars(obj))
-            return obj
-
-        payload = {
-            "state": _to_dict(st),
-        }
-
-        # Si el objeto result existe, guardamos un resumen para depuración
-        result = getattr(self.game, "result", None)
-        if result is not None:
-            payload["result"] = _to_dict(result)
-
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        try:
+            return save_to_path(self.game, path)
+        except OSError as ex:
+            raise CommandExecError(f"No se pudo guardar en {path}: {ex}") from ex
 
-        return f"Partida guardada en: {path}"
+    def _do_load(self, path: str) -> str:
+        """Restaura una partida guardada sobre el juego actual."""
+        try:
+            msg = load_from_path(self.game, path)
+        except (OSError, StorageError) as ex:
+            raise CommandExecError(f"No se pudo cargar {path}: {ex}") from ex
+        return f"{msg}\n\n{render_game(self.game)}"
 
     # ------------------ UI helpers ------------------
 
@@ -196,9 +206,11 @@ class CommandRunner:
             "  move <from> <steps>         -> mover una ficha (ej: 'move 13 5' o 'move bar 4')\n"
             "  end                         -> terminar el turno (si corresponde)\n"
             "  show / status               -> mostrar el tablero\n"
-            "  hint                        -> sugerencia de jugada (heurística)\n"
-            "  undo                        -> deshacer último movimiento (si el motor lo permite)\n"
-            "  save [ruta]                 -> guardar snapshot del estado (si el parser provee path)\n"
+            "  hint                        -> sugerencia de jugada (búsqueda 2-ply)\n"
+            "  undo                        -> deshacer el último movimiento del turno\n"
+            "  redo                        -> rehacer el último movimiento deshecho\n"
+            "  save [ruta]                 -> guardar la partida (.json, o binario con .bgs/.bin)\n"
+            "  load [ruta]                 -> retomar una partida guardada\n"
             "  help (h, ?)                 -> esta ayuda\n"
             "  quit (q, exit)              -> salir\n"
         )
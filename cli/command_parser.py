@@ -11,7 +11,9 @@ Parser de comandos para la CLI de Backgammon.
   move <from> <steps>        # <from>: 1..24 o 'bar' ; steps: 1..6
   hint
   undo
+  redo
   save [ruta]                # opcionalmente una ruta de salida
+  load [ruta]                # retoma una partida guardada
 
 - Errores:
   CommandParseError (subclase de core.exceptions.CommandParseError si está disponible)
@@ -42,7 +44,7 @@ class Command:
     # Para move:
     from_pos: Optional[int] = None
     steps: Optional[int] = None
-    # Para save:
+    # Para save / load:
     path: Optional[str] = None
 
 
@@ -137,6 +139,12 @@ def parse_command(raw: str) -> Command:
             raise CommandParseError("Uso: undo")
         return Command(name="undo")
 
+    # redo
+    if cmd == "redo":
+        if len(parts) != 1:
+            raise CommandParseError("Uso: redo")
+        return Command(name="redo")
+
     # save [path]
     if cmd == "save":
         if len(parts) > 2:
@@ -144,5 +152,12 @@ def parse_command(raw: str) -> Command:
         path = parts[1] if len(parts) == 2 else None
         return Command(name="save", path=path)
 
+    # load [path]
+    if cmd == "load":
+        if len(parts) > 2:
+            raise CommandParseError("Uso: load [ruta]")
+        path = parts[1] if len(parts) == 2 else None
+        return Command(name="load", path=path)
+
     # Desconocido
     raise CommandParseError(f"Comando desconocido: {cmd}. Escribí 'help' para ver opciones.")
@@ -1,14 +1,35 @@
 # -*- coding: utf-8 -*-
 """
-Motor de hints MUY simple y no intrusivo (no modifica estado).
-La idea es dar una sugerencia razonable sin depender de APIs internas del motor.
+Motor de hints no intrusivo (no modifica estado).
+Con un turno en curso sugiere la jugada completa elegida por la búsqueda
+de core.search (2-ply por defecto, menos de un segundo por decisión: si la
+pasada de 2-ply no entra en HINT_TIME_LIMIT se usa la de 1-ply); si el
+motor no la soporta, cae a una sugerencia textual simple. Los hints
+comparten una tabla de transposición, así que repetir el hint (o pedirlo
+tras un undo) no vuelve a buscar lo ya calculado; en la apertura la jugada
+sale del libro (core.opening_book) sin buscar.
 """
-__all__ = ["suggest_move"]
+__all__ = ["HINT_DEPTH", "HINT_TIME_LIMIT", "suggest_move", "format_play"]
 
 from typing import Any
 
+from core.game import GameRuleError
+from core.opening_book import default_book
+from core.transposition import TranspositionTable
 
-def suggest_move(game) -> str:
+HINT_DEPTH = 2
+HINT_TIME_LIMIT = 0.9       # segundos por decisión (deja margen para generar y formatear)
+_TABLE = TranspositionTable(max_bytes=8 * 1024 * 1024)
+
+
+def format_play(play) -> str:
+    """Jugada como comandos de la CLI: 'move 13 6, move 8 5' (BAR = 'bar')."""
+    if not play:
+        return "sin movimientos posibles"
+    return ", ".join(f"move {'bar' if f == 0 else f} {s}" for f, s in play)
+
+
+def suggest_move(game, depth: int = HINT_DEPTH) -> str:
     st = game.state()
 
     def _get(obj, *names, default=None):
@@ -27,6 +48,16 @@ def suggest_move(game) -> str:
     if not dice or moves_left == 0:
         return "No hay movimientos activos. Tir\u00E1 los dados con 'roll'."
 
+    if hasattr(game, "analyze"):
+        try:
+            result = game.analyze(depth, table=_TABLE, book=default_book(),
+                                  time_limit=HINT_TIME_LIMIT)
+        except (GameRuleError, AttributeError):
+            # motores o tableros sin soporte para la búsqueda
+            result = None
+        if result is not None:
+            return f"{format_play(result.play)} (equity {result.equity:+.3f}, {result.depth}-ply)"
+
     top = sorted(dice, reverse=True)[0]
 
     try:
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Guardar / cargar partidas desde la CLI (comandos `save [ruta]` y `load [ruta]`).
+
+Delegan en storage.save_game / storage.load_game; la carga restaura el
+estado sobre la misma instancia de BackgammonGame que usa el runner.
+"""
+
+from __future__ import annotations
+
+from storage import load_game, save_game
+
+DEFAULT_SAVE_PATH = "saved_game.json"
+
+__all__ = ["DEFAULT_SAVE_PATH", "save_to_path", "load_from_path"]
+
+
+def save_to_path(game, path: str | None = None) -> str:
+    """Guarda `game` y devuelve el mensaje para el usuario."""
+    path = path or DEFAULT_SAVE_PATH
+    save_game(game, path)
+    return f"Partida guardada en: {path}"
+
+
+def load_from_path(game, path: str | None = None) -> str:
+    """
+    Carga la partida de `path` sobre `game` (en el lugar).
+    Lanza FileNotFoundError o StorageError si no se puede.
+    """
+    path = path or DEFAULT_SAVE_PATH
+    load_game(path, game=game)
+    return f"Partida cargada desde: {path}"
@@ -12,7 +12,16 @@ from .exceptions import (
     CheckerNotMovableException,
 )
 from core.constants import BAR, OFF, HOME_RANGE, opponent
+from core.move_check import MoveCheck, MoveToken, classify_move
+from core.zobrist import point_key
 
+# Orden de búsqueda del punto más atrasado: (posición, rango). El rango es el
+# punto del tablero, con el BAR detrás de todo (25 para white, 0 para black).
+_BACK_ORDER = {
+    "white": ((BAR, 25),) + tuple((p, p) for p in range(24, 0, -1)),
+    "black": ((BAR, 0),) + tuple((p, p) for p in range(1, 25)),
+}
+_NO_BACK = {"white": 0, "black": 25}     # rango sin fichas en juego
 
 
 class Board:
@@ -44,8 +53,24 @@ class Board:
         # Inicializar todos los puntos vacíos
         for i in range(26):  # 0 (bar) a 25 (off)
             self.__points[i] = []
+        # Clave Zobrist de la posición, mantenida incrementalmente por los mutadores
+        self._zobrist = 0
+        # Fichas fuera del tablero listas para reutilizar (ver _take_checker)
+        self._spare = {"white": [], "black": []}
+        # Contadores por color, también incrementales (ver _track)
+        self._pips = {"white": 0, "black": 0}
+        self._off = {"white": 0, "black": 0}
+        self._bar = {"white": 0, "black": 0}
+        self._on_board = {"white": 0, "black": 0}
+        self._outside_home = {"white": 0, "black": 0}
+        # Punto más atrasado de cada color y caché de is_race (ver _track)
+        self._back = dict(_NO_BACK)
+        self._back_dirty = {"white": False, "black": False}
+        self._race: Optional[bool] = None
          # Configurar posiciones iniciales estándar
         self._setup_initial_position()
+        self.recompute_zobrist_key()
+        self.recompute_counters()
     
     def _setup_initial_position(self) -> None:
         """
@@ -58,36 +83,36 @@ class Board:
         # Jugador 1 (blanco) - se mueve hacia puntos menores (24->1)
         # 2 fichas en punto 24
         for _ in range(2):
-            self.__points[24].append(Checker("white", 24))
+            self.__points[24].append(self._take_checker("white", 24))
         
         # 5 fichas en punto 13
         for _ in range(5):
-            self.__points[13].append(Checker("white", 13))
+            self.__points[13].append(self._take_checker("white", 13))
         
         # 3 fichas en punto 8
         for _ in range(3):
-            self.__points[8].append(Checker("white", 8))
+            self.__points[8].append(self._take_checker("white", 8))
         
         # 5 fichas en punto 6
         for _ in range(5):
-            self.__points[6].append(Checker("white", 6))
+            self.__points[6].append(self._take_checker("white", 6))
         
         # Jugador 2 (negro) - se mueve hacia puntos mayores (1->24)
         # 2 fichas en punto 1
         for _ in range(2):
-            self.__points[1].append(Checker("black", 1))
+            self.__points[1].append(self._take_checker("black", 1))
         
         # 5 fichas en punto 12
         for _ in range(5):
-            self.__points[12].append(Checker("black", 12))
+            self.__points[12].append(self._take_checker("black", 12))
         
         # 3 fichas en punto 17
         for _ in range(3):
-            self.__points[17].append(Checker("black", 17))
+            self.__points[17].append(self._take_checker("black", 17))
         
         # 5 fichas en punto 19
         for _ in range(5):
-            self.__points[19].append(Checker("black", 19))
+            self.__points[19].append(self._take_checker("black", 19))
     
     def get_point(self, position: int) -> List[Checker]:
         """
@@ -118,15 +143,25 @@ class Board:
             raise InvalidPositionException(f"Posición {position} no es válida.")
         return sum(1 for ch in self.__points[position] if ch.get_color() == color)
 
+    def counts(self, color: str) -> Tuple[int, ...]:
+        """
+    Conteos de 'color' en las 26 posiciones (0=BAR, 1..24, 25=OFF).
+    Es la vista que usan core.movegen y los motores de análisis.
+    """
+        return tuple(
+            sum(1 for ch in self.__points[p] if ch.get_color() == color)
+            for p in range(26)
+        )
+
     # Alias común que algunas UIs usan
     def count_point(self, position: int, color: str) -> int:
         return self.count_at(position, color)
 
     def count_bar(self, color: str) -> int:
         """
-    Cantidad de fichas de 'color' en el BAR (0).
+    Cantidad de fichas de 'color' en el BAR (0). O(1).
     """
-        return len(self.get_checkers_in_bar(color))
+        return self._bar.get(color, 0)
 
     
     def is_valid_position(self, position: int) -> bool:
@@ -201,7 +236,7 @@ class Board:
     # ✅ 0 = BAR y 25 = OFF: siempre permitir y no aplicar capturas/bloqueos
         if position in (0, 25):
             checker.set_position(position)
-            self.__points[position].append(checker)
+            self._push_checker(position, checker)
             return None
 
     # del resto igual que antes:
@@ -214,12 +249,12 @@ class Board:
     # Captura si hay exactamente 1 rival (blot)
         if (len(point_checkers) == 1 and 
            point_checkers[0].get_color() != checker.get_color()):
-           captured_checker = point_checkers.pop()
+           captured_checker = self._pop_checker(position)
            captured_checker.set_position(0)
-           self.__points[0].append(captured_checker)
+           self._push_checker(0, captured_checker)
 
         checker.set_position(position)
-        self.__points[position].append(checker)
+        self._push_checker(position, checker)
         return captured_checker
 
     def remove_checker(self, position: int) -> Optional[Checker]:
@@ -241,7 +276,7 @@ class Board:
         if not self.__points[position]:
             return None
         
-        return self.__points[position].pop()
+        return self._pop_checker(position)
     
     def get_checkers_in_bar(self, player_color: str) -> List[Checker]:
         """
@@ -283,20 +318,9 @@ class Board:
         Returns:
             bool: True si todas las fichas están en el home board, False en caso contrario
         """
-        home_start, home_end = self.get_home_board_range(player_color)
-        
-        # Verificar que no haya fichas en el bar
-        if self.get_checkers_in_bar(player_color):
-            return False
-        
-        # Verificar que no haya fichas fuera del home board
-        for position in range(1, 25):
-            if position < home_start or position > home_end:
-                checkers = self.__points[position]
-                if any(checker.get_color() == player_color for checker in checkers):
-                    return False
-        
-        return True
+        self.get_home_board_range(player_color)  # valida el color
+        # Sin fichas en el bar ni fuera del home board (contadores O(1))
+        return self._bar[player_color] == 0 and self._outside_home[player_color] == 0
     
     def count_checkers(self, player_color: str) -> Dict[str, int]:
         """
@@ -309,25 +333,11 @@ class Board:
             Dict[str, int]: Diccionario con conteos por área
         """
         counts = {
-            "board": 0,
-            "bar": 0,
-            "off": 0,
-            "total": 0
+            "board": self._on_board.get(player_color, 0),
+            "bar": self._bar.get(player_color, 0),
+            "off": self._off.get(player_color, 0),
         }
-        
-        # Contar fichas en el tablero (puntos 1-24)
-        for position in range(1, 25):
-            checkers = self.__points[position]
-            counts["board"] += sum(1 for checker in checkers if checker.get_color() == player_color)
-        
-        # Contar fichas en el bar
-        counts["bar"] = len(self.get_checkers_in_bar(player_color))
-        
-        # Contar fichas fuera del tablero
-        counts["off"] = len(self.get_checkers_off_board(player_color))
-        
         counts["total"] = counts["board"] + counts["bar"] + counts["off"]
-        
         return counts
     
     def __str__(self) -> str:
@@ -494,9 +504,9 @@ class Board:
         if not self.can_capture(position, color):
             return None
 
-        captured = self.__points[position].pop()
+        captured = self._pop_checker(position)
         captured.position = BAR  # enviar al BAR
-        self.__points[BAR].append(captured)
+        self._push_checker(BAR, captured)
         return captured
 
 
@@ -509,13 +519,16 @@ class Board:
     Si el destino tiene blot rival, lo captura y lo envía al BAR.
     Devuelve (from_pos, to_pos, captured_checker|None).
     """
+        if self.is_race():
+            return self._race_move(color, from_pos, steps)
+
         # 1) Validación de movimiento (dirección, rango, bloqueo, etc.)
         to_pos = self.validate_basic_move(color, from_pos, steps)
 
         # 2) Quitar ficha del origen (preferimos el tope; si no, buscamos desde el final)
         origin_stack = self.__points[from_pos]
         if origin_stack and origin_stack[-1].get_color() == color:
-            checker = origin_stack.pop()
+            checker = self._pop_checker(from_pos)
         else:
             found_idx = None
             for i in range(len(origin_stack) - 1, -1, -1):
@@ -524,18 +537,35 @@ class Board:
                     break
             if found_idx is None:
                 raise ValueError("No hay ficha propia en el punto de origen.")
-            checker = origin_stack.pop(found_idx)
+            checker = self._pop_checker(from_pos, found_idx)
 
         # 3) Captura si hay blot rival en el destino
         captured = self._capture_at(to_pos, color)
 
         # 4) Colocar la ficha movida
         checker.position = to_pos
-        self.__points[to_pos].append(checker)
+        self._push_checker(to_pos, checker)
 
         return (from_pos, to_pos, captured)
 
     
+    def _race_move(self, color: str, from_pos: int, steps: int):
+        """
+    move_checker sin contacto: el destino nunca tiene fichas rivales, así
+    que no se mira bloqueo ni captura. En un punto hay un solo color.
+    """
+        self._validate_color(color)
+        if not (1 <= from_pos <= 24):
+            raise InvalidPositionException("El origen debe estar en 1..24.")
+        stack = self.__points[from_pos]
+        if not stack or stack[-1].get_color() != color:
+            raise ValueError("No hay ficha propia en el punto de origen.")
+        to_pos = self._target_from(color, from_pos, steps)
+        checker = self._pop_checker(from_pos)
+        checker.position = to_pos
+        self._push_checker(to_pos, checker)
+        return (from_pos, to_pos, None)
+
     #M2-04 — Reingreso desde el BAR
 
     def has_checkers_in_bar(self, color: str) -> bool:
@@ -569,15 +599,15 @@ class Board:
 
          # Tomar ficha del BAR
         bar_stack = self.__points[0]
-        checker = next(ch for ch in bar_stack if ch.get_color() == color)
-        bar_stack.remove(checker)
+        idx = next(i for i, ch in enumerate(bar_stack) if ch.get_color() == color)
+        checker = self._pop_checker(0, idx)
 
         # Captura si hay blot rival
         captured = self._capture_at(destination, color)
 
          # Colocar ficha en destino
         checker.position = destination
-        self.__points[destination].append(checker)
+        self._push_checker(destination, checker)
 
         return (0, destination, captured)
     
@@ -661,10 +691,10 @@ class Board:
         # Buscar una ficha del color en el origen
         idx = next((i for i, ch in enumerate(pile) if ch.get_color() == color), None)
         if idx is None:
-            raise NoCheckersAtPositionException(f"No hay ficha del color {color} en {from_pos}.")
-        checker = pile.pop(idx)
+            raise NoCheckersAtPositionException(color, from_pos)
+        checker = self._pop_checker(from_pos, idx)
         checker.set_position(OFF)
-        self.__points[OFF].append(checker)
+        self._push_checker(OFF, checker)
         return (from_pos, OFF, None)
 
    
@@ -676,17 +706,57 @@ class Board:
         - Si el destino cae fuera (blanco <1 | negro >24) y se puede bear off, hace bear_off_checker.
         - Si el destino cae dentro (1..24), usa move_checker normal.
         """
-        # ¿Dentro del tablero?
-        try:
-            # Intentamos validar como movimiento normal
-            to_pos = self._target_from(color, from_pos, steps)
-            # si _target_from no explota, estaríamos en 1..24 (M4: _target_from ya no bloquea por 'fuera de 1..24')
-            # En tu implementación actual _target_from lanza si no está en 1..24 (M2).
-            # Así que si lanza, iremos al except y probamos bearing off.
+        if not isinstance(steps, int) or steps <= 0 or steps > 6:
+            raise ValueError("Los pasos deben ser un entero entre 1 y 6.")
+        to_pos = from_pos - steps if color == "white" else from_pos + steps
+        if 1 <= to_pos <= 24:
             return self.move_checker(color, from_pos, steps)
-        except InvalidPositionException:
-            # Destino afuera de 1..24 => intentar bearing off
-            return self.bear_off_checker(color, from_pos, steps)
+        # Destino afuera de 1..24 => bearing off
+        return self.bear_off_checker(color, from_pos, steps)
+
+    # ---------------- Predicados sin excepciones ----------------
+
+    def is_legal_move(self, color: str, from_pos: int, steps: int) -> bool:
+        """
+        Equivalente a validate_basic_move pero devuelve bool en lugar de lanzar:
+        ficha propia en from_pos (1..24) y destino en 1..24 no bloqueado.
+        """
+        if color not in ("white", "black"):
+            return False
+        if not isinstance(steps, int) or not (1 <= steps <= 6):
+            return False
+        if not isinstance(from_pos, int) or not self._has_checker_of_color(from_pos, color):
+            return False
+        to_pos = from_pos - steps if color == "white" else from_pos + steps
+        if not (1 <= to_pos <= 24):
+            return False
+        return not self.is_point_blocked(to_pos, color)
+
+    def is_legal_reentry(self, color: str, steps: int) -> bool:
+        """Equivalente a validate_reentry (destino no bloqueado) sin excepciones."""
+        if color not in ("white", "black"):
+            return False
+        if not isinstance(steps, int) or not (1 <= steps <= 6):
+            return False
+        destination = 25 - steps if color == "white" else steps
+        return not self.is_point_blocked(destination, color)
+
+    def is_legal_bear_off(self, color: str, from_pos: int, steps: int) -> bool:
+        """Hay ficha propia en from_pos y can_bear_off_from lo permite (sin excepciones)."""
+        if color not in ("white", "black"):
+            return False
+        if not isinstance(steps, int) or not (1 <= steps <= 6):
+            return False
+        if not isinstance(from_pos, int) or not self._has_checker_of_color(from_pos, color):
+            return False
+        return self.can_bear_off_from(color, from_pos, steps)
+
+    def classify_move(self, color: str, from_pos: int, steps: int) -> MoveCheck:
+        """
+        Clasifica el movimiento (normal / hit / reenter / bear_off / illegal con motivo)
+        sin lanzar excepciones. Ver core.move_check.classify_move.
+        """
+        return classify_move(self, color, from_pos, steps)
 
     # ---------------- Helpers públicos de testing ----------------
 
@@ -707,11 +777,17 @@ class Board:
         if not self.is_valid_position(position):
             raise InvalidPositionException(f"Posición {position} no es válida.")
 
-        # Vaciar el punto
-        self.__points[position].clear()
+        # Vaciar el punto (las fichas quitadas vuelven al repuesto)
+        for c in ("white", "black"):
+            n = self._color_count(position, c)
+            self._zobrist ^= point_key(c, position, n)
+            self._track(c, position, -n)
+        self._recycle_point(position)
         # Agregar 'count' fichas del color
         for _ in range(max(0, count)):
-            self.__points[position].append(Checker(color, position))
+            self.__points[position].append(self._take_checker(color, position))
+        self._zobrist ^= point_key(color, position, max(0, count))
+        self._track(color, position, max(0, count))
 
 
     def count_off(self, color: str) -> int:
@@ -724,15 +800,265 @@ class Board:
     Returns:
         int: Número de fichas fuera del tablero (en posición 25)
     """
-        return len(self.get_checkers_off_board(color))
+        return self._off.get(color, 0)
+
+
+
+
 
 
 
 
 
 
+    
+    # ---------------- Clave Zobrist (hash incremental de la posición) ----------------
+
+    def _color_count(self, position: int, color: str) -> int:
+        # Conteo directo sobre la pila (no usa count_at, que los tests pueden reemplazar)
+        return sum(1 for ch in self.__points[position] if ch.get_color() == color)
+
+    def _stacked(self, position: int, color: str) -> int:
+        """
+        Fichas de `color` en `position` en O(1): en el BAR y OFF (que mezclan
+        colores) salen de los contadores incrementales; un punto 1..24 tiene
+        un solo color, así que basta el largo de la pila.
+        """
+        if position == BAR:
+            return self._bar[color]
+        if position == OFF:
+            return self._off[color]
+        stack = self.__points[position]
+        return len(stack) if stack and stack[0].get_color() == color else 0
+
+    def _push_checker(self, position: int, checker: Checker) -> None:
+        """Apila `checker` en `position` actualizando la clave Zobrist."""
+        color = checker.get_color()
+        n = self._stacked(position, color)
+        self._zobrist ^= point_key(color, position, n) ^ point_key(color, position, n + 1)
+        self._track(color, position, 1)
+        self.__points[position].append(checker)
+
+    def _pop_checker(self, position: int, index: int = -1) -> Checker:
+        """Quita la ficha `index` de `position` actualizando la clave Zobrist."""
+        color = self.__points[position][index].get_color()
+        n = self._stacked(position, color)
+        checker = self.__points[position].pop(index)
+        self._zobrist ^= point_key(color, position, n) ^ point_key(color, position, n - 1)
+        self._track(color, position, -1)
+        return checker
+
+    def zobrist_key(self) -> int:
+        """
+        Clave Zobrist de 64 bits de la posición (sin el turno).
+        Se mantiene en O(1) por movimiento; dos tableros con las mismas
+        cantidades por punto tienen la misma clave.
+        """
+        return self._zobrist
+
+    def recompute_zobrist_key(self) -> int:
+        """
+        Recalcula la clave desde cero y la guarda. Sólo hace falta si se
+        modificaron los puntos por fuera de los métodos del tablero.
+        """
+        key = 0
+        for position in range(26):
+            for color in ("white", "black"):
+                key ^= point_key(color, position, self._color_count(position, color))
+        self._zobrist = key
+        return key
 
+    # ---------------- make / unmake y snapshots ----------------
 
+    def make_move(self, color: str, from_pos: int, steps: int) -> MoveToken:
+        """
+        Aplica UN movimiento (reingreso si from_pos == BAR, normal o bearing off)
+        y devuelve un MoveToken para revertirlo con unmake_move.
+        Lanza las mismas excepciones que reenter_checker / move_or_bear_off.
+        """
+        if from_pos == BAR:
+            _, to_pos, captured = self.reenter_checker(color, steps)
+        else:
+            _, to_pos, captured = self.move_or_bear_off(color, from_pos, steps)
+        return MoveToken(color, from_pos, to_pos, captured is not None)
 
+    def unmake_move(self, token: MoveToken) -> None:
+        """
+        Revierte exactamente el movimiento de `token` (debe ser el último aplicado):
+        la ficha vuelve a su origen y, si hubo captura, el blot rival sale del BAR.
+        """
+        color, from_pos, to_pos, hit = token
+        pile = self.__points[to_pos]
+        idx = next((i for i in range(len(pile) - 1, -1, -1) if pile[i].get_color() == color), None)
+        if idx is None:
+            raise NoCheckersAtPositionException(color, to_pos)
+        checker = self._pop_checker(to_pos, idx)
+        checker.set_position(from_pos)
+        self._push_checker(from_pos, checker)
+        if hit:
+            opp = opponent(color)
+            bar = self.__points[BAR]
+            idx = next((i for i in range(len(bar) - 1, -1, -1) if bar[i].get_color() == opp), None)
+            if idx is None:
+                raise NoCheckersAtPositionException(opp, BAR)
+            captured = self._pop_checker(BAR, idx)
+            captured.set_position(to_pos)
+            self._push_checker(to_pos, captured)
+
+    def snapshot(self) -> bytes:
+        """
+        Posición empaquetada en 52 bytes: cantidades blancas 0..25 y luego negras 0..25.
+        Es hashable y se restaura con restore().
+        """
+        return bytes(self.counts("white")) + bytes(self.counts("black"))
 
-    
\ No newline at end of file
+    def restore(self, snapshot: bytes) -> None:
+        """
+        Restaura una posición de snapshot() reutilizando los objetos Checker
+        existentes (sólo se crean fichas nuevas si faltan).
+        """
+        if len(snapshot) != 52:
+            raise ValueError("El snapshot debe tener 52 bytes (26 por color).")
+        self._recycle_checkers()
+        for offset, color in ((0, "white"), (26, "black")):
+            for position in range(26):
+                for _ in range(snapshot[offset + position]):
+                    self.__points[position].append(self._take_checker(color, position))
+        self.recompute_zobrist_key()
+        self.recompute_counters()
+
+    def to_id(self, on_roll: str = "white") -> str:
+        """Position ID de 14 caracteres (formato GNU Backgammon, ver core.position_id)."""
+        from core.position_id import position_id
+        return position_id(self, on_roll)
+
+    @classmethod
+    def from_id(cls, pid: str, on_roll: str = "white") -> "Board":
+        """Tablero con la posición del Position ID `pid`."""
+        from core.position_id import position_from_id
+        white, black = position_from_id(pid, on_roll)
+        board = cls()
+        board.restore(bytes(white) + bytes(black))
+        return board
+
+    def reset(self) -> None:
+        """
+        Vuelve a la posición inicial estándar en el lugar, reutilizando las
+        fichas existentes (sin crear objetos nuevos).
+        """
+        self._recycle_checkers()
+        self._setup_initial_position()
+        self.recompute_zobrist_key()
+        self.recompute_counters()
+
+    # ---------------- Repuesto de fichas ----------------
+
+    def _take_checker(self, color: str, position: int) -> Checker:
+        """Ficha de `color` en `position`, reutilizando una del repuesto si hay."""
+        spare = self._spare[color]
+        if spare:
+            checker = spare.pop()
+            checker._position = position
+            return checker
+        return Checker.unchecked(color, position)
+
+    def _recycle_point(self, position: int) -> None:
+        """Vacía `position` mandando sus fichas al repuesto (no toca contadores ni Zobrist)."""
+        stack = self.__points[position]
+        for checker in stack:
+            self._spare[checker.get_color()].append(checker)
+        stack.clear()
+
+    def _recycle_checkers(self) -> None:
+        """Vacía todo el tablero mandando las fichas al repuesto."""
+        for position in range(26):
+            self._recycle_point(position)
+
+    # ---------------- Contadores incrementales (pips, off, bar, home) ----------------
+
+    def _track(self, color: str, position: int, delta: int) -> None:
+        """Suma `delta` fichas de `color` en `position` a los contadores del color."""
+        if position == OFF:
+            self._off[color] += delta
+            return
+        rank = position if position != BAR else _BACK_ORDER[color][0][1]
+        back = self._back[color]
+        if delta > 0:
+            if (rank > back) if color == "white" else (rank < back):
+                # Ficha detrás de la última: puede volver a haber contacto
+                self._back[color] = rank
+                self._back_dirty[color] = False
+                self._race = None
+        elif delta < 0 and rank == back:
+            # Puede haberse vaciado el punto más atrasado: se recalcula al pedirlo
+            self._back_dirty[color] = True
+            if self._race is False:
+                self._race = None
+        if position == BAR:
+            self._bar[color] += delta
+            self._pips[color] += 25 * delta
+            return
+        self._on_board[color] += delta
+        self._pips[color] += delta * (position if color == "white" else 25 - position)
+        home_start, home_end = HOME_RANGE[color]
+        if position < home_start or position > home_end:
+            self._outside_home[color] += delta
+
+    def recompute_counters(self) -> None:
+        """
+        Recalcula los contadores desde las pilas. Sólo hace falta si se
+        modificaron los puntos por fuera de los métodos del tablero.
+        """
+        for counter in (self._pips, self._off, self._bar, self._on_board, self._outside_home):
+            for color in counter:
+                counter[color] = 0
+        self._back = dict(_NO_BACK)
+        self._back_dirty = {"white": False, "black": False}
+        self._race = None
+        for position in range(26):
+            for color in ("white", "black"):
+                n = self._color_count(position, color)
+                if n:
+                    self._track(color, position, n)
+
+    def _rearmost(self, color: str) -> int:
+        """Rango del punto más atrasado de `color` (ver _BACK_ORDER)."""
+        if self._back_dirty[color]:
+            self._back_dirty[color] = False
+            self._back[color] = next(
+                (rank for position, rank in _BACK_ORDER[color] if self._color_count(position, color)),
+                _NO_BACK[color],
+            )
+        return self._back[color]
+
+    def is_race(self) -> bool:
+        """
+        True si ya no hay contacto: todas las fichas blancas están delante de
+        todas las negras, así que no quedan golpes ni bloqueos posibles.
+        Se cachea y sólo se recalcula cuando una ficha queda detrás de la
+        última de su color o se vacía el punto más atrasado.
+        """
+        if self._race is None:
+            self._race = self._rearmost("white") < self._rearmost("black")
+        return self._race
+
+    def pip_count(self, color: str) -> int:
+        """Pip count de `color` (las fichas en el BAR cuentan 25). O(1)."""
+        return self._pips[color]
+
+    def count_on_board(self, color: str) -> int:
+        """Fichas de `color` en los puntos 1..24. O(1)."""
+        return self._on_board[color]
+
+    def count_remaining(self, color: str) -> int:
+        """Fichas de `color` que faltan sacar (tablero + BAR). O(1)."""
+        return self._on_board[color] + self._bar[color]
+
+    def count_outside_home(self, color: str) -> int:
+        """Fichas de `color` en el tablero fuera de su home board (sin contar el BAR). O(1)."""
+        return self._outside_home[color]
+
+    def count_in_home_of(self, color: str, home_color: str) -> int:
+        """Fichas de `color` dentro del home board de `home_color` (6 puntos)."""
+        home_start, home_end = HOME_RANGE[home_color]
+        return sum(self._color_count(p, color) for p in range(home_start, home_end + 1))
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+Contrato mínimo de estado del tablero para detectar victoria y calcular el
+resultado (single / gammon / backgammon) en tiempo constante.
+
+Board y CompactBoard cumplen BoardState con contadores propios. Cualquier
+otro objeto (dobles de test, tableros parciales o con métodos reemplazados
+en la instancia) se envuelve en BoardStateAdapter, que concentra las
+estrategias de respaldo basadas en hasattr/try que antes vivían en
+BackgammonGame.
+"""
+
+from typing import Protocol, Tuple, runtime_checkable
+
+from core.constants import OFF
+
+__all__ = ["BoardState", "BoardStateAdapter", "as_board_state", "determine_outcome"]
+
+TOTAL_CHECKERS = 15
+
+# Métodos que, si se reemplazan en la instancia, invalidan los contadores nativos
+_SHADOWABLE = (
+    "count_off", "count_bar", "count_remaining", "count_in_home_of",
+    "count_at", "count_checkers", "get_point", "get_checkers_in_bar", "get_home_board_range",
+)
+
+
+@runtime_checkable
+class BoardState(Protocol):
+    """Consultas O(1) que el juego necesita para cerrar la partida."""
+
+    def count_off(self, color: str) -> int:
+        """Fichas de `color` ya borneadas."""
+        ...
+
+    def count_bar(self, color: str) -> int:
+        """Fichas de `color` en el BAR."""
+        ...
+
+    def count_remaining(self, color: str) -> int:
+        """Fichas de `color` que faltan sacar (tablero + BAR)."""
+        ...
+
+    def count_in_home_of(self, color: str, home_color: str) -> int:
+        """Fichas de `color` dentro del home board de `home_color`."""
+        ...
+
+
+def _checker_color(ch):
+    """Color de una ficha: atributo .color o método .get_color()."""
+    color = getattr(ch, "color", None)
+    if color is None and hasattr(ch, "get_color"):
+        try:
+            color = ch.get_color()
+        except Exception:
+            color = None
+    return color
+
+
+class BoardStateAdapter:
+    """
+    BoardState sobre un tablero arbitrario, probando varias estrategias en
+    orden y tolerando métodos ausentes o que fallen.
+    """
+
+    def __init__(self, board):
+        self.board = board
+
+    def _count_on_board(self, color: str) -> int:
+        """Fichas de `color` en 1..24 recorriendo get_point (0 si no se puede)."""
+        if not hasattr(self.board, "get_point"):
+            return 0
+        try:
+            total = 0
+            for p in range(1, 25):
+                total += sum(1 for ch in (self.board.get_point(p) or []) if _checker_color(ch) == color)
+            return total
+        except Exception:
+            return 0
+
+    def count_bar(self, color: str) -> int:
+        """len(get_checkers_in_bar) y, si da 0 o no existe, count_bar."""
+        in_bar = 0
+        if hasattr(self.board, "get_checkers_in_bar"):
+            try:
+                in_bar = len(self.board.get_checkers_in_bar(color) or [])
+            except Exception:
+                in_bar = 0
+        if in_bar == 0 and hasattr(self.board, "count_bar"):
+            try:
+                in_bar = int(self.board.count_bar(color))
+            except Exception:
+                pass
+        return in_bar
+
+    def count_off(self, color: str) -> int:
+        """
+        Estrategias:
+          1) board.count_off(color)
+          2) board.count_at(OFF, color)
+          3) board.count_checkers(color)['off']
+          4) Deducción: 15 - (en_tablero + en_BAR)
+        """
+        if hasattr(self.board, "count_off"):
+            try:
+                return int(self.board.count_off(color))
+            except Exception:
+                pass
+        if hasattr(self.board, "count_at"):
+            try:
+                return int(self.board.count_at(OFF, color))
+            except Exception:
+                pass
+        if hasattr(self.board, "count_checkers"):
+            try:
+                d = self.board.count_checkers(color) or {}
+                if isinstance(d, dict) and "off" in d:
+                    return int(d.get("off", 0))
+            except Exception:
+                pass
+        return max(0, TOTAL_CHECKERS - (self._count_on_board(color) + self.count_bar(color)))
+
+    def count_remaining(self, color: str) -> int:
+        """Fichas en 1..24 (get_point) más las del BAR."""
+        left = self._count_on_board(color)
+        if hasattr(self.board, "get_checkers_in_bar"):
+            try:
+                left += len(self.board.get_checkers_in_bar(color) or [])
+            except Exception:
+                pass
+        elif hasattr(self.board, "count_bar"):
+            try:
+                left += int(self.board.count_bar(color))
+            except Exception:
+                pass
+        return left
+
+    def count_in_home_of(self, color: str, home_color: str) -> int:
+        """Fichas de `color` en el home de `home_color` (get_home_board_range + get_point)."""
+        home_start, home_end = self.board.get_home_board_range(home_color)
+        return sum(
+            1
+            for p in range(home_start, home_end + 1)
+            for ch in self.board.get_point(p)
+            if _checker_color(ch) == color
+        )
+
+    def determine_outcome(self, winner_color: str, loser_color: str) -> Tuple[str, int]:
+        """
+        Versión de respaldo de determine_outcome: el 'off' del perdedor sale
+        de count_checkers y el BAR de get_checkers_in_bar, como en los
+        tableros que sólo exponen esa interfaz.
+        """
+        loser_counts = self.board.count_checkers(loser_color)
+        if loser_counts.get("off", 0) > 0:
+            return ("single", 1)
+        has_bar = self.board.get_checkers_in_bar(loser_color) != []
+        if has_bar or self.count_in_home_of(loser_color, winner_color):
+            return ("backgammon", 3)
+        return ("gammon", 2)
+
+
+_native_types = {}
+
+
+def as_board_state(board):
+    """
+    Devuelve `board` si cumple BoardState con sus propios métodos; si no (o
+    si alguno fue reemplazado en la instancia), un BoardStateAdapter.
+    """
+    if isinstance(board, BoardStateAdapter):
+        return board
+    cls = type(board)
+    native = _native_types.get(cls)
+    if native is None:
+        native = _native_types[cls] = isinstance(board, BoardState)
+    if native:
+        overrides = getattr(board, "__dict__", None)
+        if not overrides or not any(name in overrides for name in _SHADOWABLE):
+            return board
+    return BoardStateAdapter(board)
+
+
+def determine_outcome(state, winner_color: str, loser_color: str) -> Tuple[str, int]:
+    """
+    single / gammon / backgammon y sus puntos, a partir de los contadores:
+      - single: el perdedor ya borneó al menos una ficha -> 1
+      - backgammon: 0 off y fichas en el BAR o en el home del ganador -> 3
+      - gammon: 0 off, sin fichas en el BAR ni en el home del ganador -> 2
+    """
+    if isinstance(state, BoardStateAdapter):
+        return state.determine_outcome(winner_color, loser_color)
+    if state.count_off(loser_color) > 0:
+        return ("single", 1)
+    if state.count_bar(loser_color) or state.count_in_home_of(loser_color, winner_color):
+        return ("backgammon", 3)
+    return ("gammon", 2)
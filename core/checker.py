@@ -10,6 +10,9 @@ class Checker:
     BAR_POSITION = 0
     BEAR_OFF_POSITION = 25
 
+    # Sin __dict__ por instancia: los tableros crean y reciclan muchas fichas
+    __slots__ = ("_color", "_position")
+
     def __init__(self, color: str, position: int | None = None):
         # normalizar y validar color
         color = str(color).lower()
@@ -22,6 +25,17 @@ class Checker:
         if position is not None:
             self.set_position(position)
 
+    @classmethod
+    def unchecked(cls, color: str, position: int | None = None) -> "Checker":
+        """
+        Crea una ficha sin normalizar ni validar color/posición. Sólo para
+        código interno que ya trabaja con valores válidos (tableros).
+        """
+        checker = object.__new__(cls)
+        checker._color = color
+        checker._position = position
+        return checker
+
     # --------- API de propiedades "pythonic" ---------
     @property
     def color(self) -> str:
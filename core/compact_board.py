@@ -0,0 +1,613 @@
+"""
+Módulo con CompactBoard: motor de tablero basado en conteos enteros.
+
+Implementa la misma API pública que core.board.Board (la que usan
+BackgammonGame, la CLI y la GUI), pero en lugar de guardar listas de objetos
+Checker por punto guarda, para cada color, un arreglo fijo de 26 contadores
+(0 = BAR, 1..24 = puntos, 25 = OFF). Todas las consultas por punto son O(1)
+y el estado completo ocupa un par de bytearray de 26 bytes.
+"""
+
+from typing import List, Dict, Optional, Tuple
+from .checker import Checker
+from .exceptions import (
+    InvalidPositionException,
+    InvalidMoveException,
+    NoCheckersAtPositionException,
+)
+from core.board import _BACK_ORDER, _NO_BACK
+from core.constants import BAR, OFF, HOME_RANGE, opponent
+from core.move_check import MoveCheck, MoveToken, classify_move
+from core.zobrist import point_key
+
+
+# Posición inicial estándar: {posición: cantidad} por color
+INITIAL_POSITION: Dict[str, Dict[int, int]] = {
+    "white": {24: 2, 13: 5, 8: 3, 6: 5},
+    "black": {1: 2, 12: 5, 17: 3, 19: 5},
+}
+
+
+class CompactBoard:
+    """
+    Tablero de Backgammon respaldado por arreglos de conteo.
+
+    Cada color tiene un bytearray de 26 posiciones:
+    - índice 0: BAR (fichas capturadas)
+    - índices 1..24: puntos del tablero
+    - índice 25: OFF (fichas sacadas)
+
+    Las fichas no tienen identidad: los métodos que devuelven Checker
+    (get_point, get_checkers_in_bar, capturas, ...) los materializan a demanda.
+    """
+
+    BAR = 0
+    OFF = 25
+
+    __slots__ = ("_white", "_black", "_counts", "_zobrist", "_back", "_back_dirty", "_race")
+
+    def __init__(self, empty: bool = False):
+        """
+        Inicializa el tablero con la posición estándar del Backgammon.
+
+        Args:
+            empty (bool): Si es True, deja el tablero vacío (útil para tests/análisis)
+        """
+        self._white = bytearray(26)
+        self._black = bytearray(26)
+        self._counts: Dict[str, bytearray] = {"white": self._white, "black": self._black}
+        self._zobrist = 0
+        # Punto más atrasado de cada color y caché de is_race (ver Board._track)
+        self._back = dict(_NO_BACK)
+        self._back_dirty = {"white": False, "black": False}
+        self._race: Optional[bool] = None
+        if not empty:
+            self._setup_initial_position()
+
+    def _setup_initial_position(self) -> None:
+        """Configura las posiciones iniciales estándar (ver Board._setup_initial_position)."""
+        for color, layout in INITIAL_POSITION.items():
+            arr = self._counts[color]
+            for pos, n in layout.items():
+                arr[pos] = n
+        self.recompute_zobrist_key()
+
+    # ---------------- Construcción / copia ----------------
+
+    def reset(self) -> None:
+        """Vuelve a la posición inicial estándar en el lugar."""
+        self._white[:] = bytes(26)
+        self._black[:] = bytes(26)
+        self._setup_initial_position()
+
+    @classmethod
+    def from_board(cls, board) -> "CompactBoard":
+        """
+        Crea un CompactBoard con la misma distribución de fichas que `board`
+        (cualquier objeto que exponga count_at(pos, color)).
+        """
+        new = cls(empty=True)
+        for pos in range(26):
+            new._white[pos] = board.count_at(pos, "white")
+            new._black[pos] = board.count_at(pos, "black")
+        new.recompute_zobrist_key()
+        return new
+
+    def copy(self) -> "CompactBoard":
+        """Copia independiente del tablero (copia de los dos arreglos)."""
+        new = CompactBoard(empty=True)
+        new._white[:] = self._white
+        new._black[:] = self._black
+        new._zobrist = self._zobrist
+        new._back = dict(self._back)
+        new._back_dirty = dict(self._back_dirty)
+        new._race = self._race
+        return new
+
+    # ---------------- Consultas ----------------
+
+    def get_point(self, position: int) -> List[Checker]:
+        """
+        Obtiene las fichas en una posición específica.
+
+        Las fichas se crean a demanda: modificarlas no altera el tablero.
+
+        Raises:
+            InvalidPositionException: Si la posición no es válida
+        """
+        if not self.is_valid_position(position):
+            raise InvalidPositionException(f"Posición {position} no es válida. Debe estar entre 0 y 25.")
+        return (
+            [Checker.unchecked("white", position) for _ in range(self._white[position])]
+            + [Checker.unchecked("black", position) for _ in range(self._black[position])]
+        )
+
+    def count_at(self, position: int, color: str) -> int:
+        """Cantidad de fichas de 'color' en el punto 'position'."""
+        if not self.is_valid_position(position):
+            raise InvalidPositionException(f"Posición {position} no es válida.")
+        arr = self._counts.get(color)
+        return arr[position] if arr is not None else 0
+
+    def counts(self, color: str) -> Tuple[int, ...]:
+        """Conteos de 'color' en las 26 posiciones (0=BAR, 1..24, 25=OFF)."""
+        return tuple(self._counts[color])
+
+    def count_point(self, position: int, color: str) -> int:
+        return self.count_at(position, color)
+
+    def count_bar(self, color: str) -> int:
+        """Cantidad de fichas de 'color' en el BAR (0)."""
+        return self.count_at(BAR, color)
+
+    def is_valid_position(self, position: int) -> bool:
+        """True si la posición está en 0..25."""
+        return 0 <= position <= 25
+
+    def is_point_occupied_by_opponent(self, position: int, player_color: str) -> bool:
+        """Verifica si un punto está ocupado por el oponente."""
+        if not self.is_valid_position(position):
+            raise InvalidPositionException(f"Posición {position} no es válida.")
+        return self._counts[opponent(player_color)][position] > 0 and \
+            self._counts[player_color][position] == 0
+
+    def is_point_blocked(self, position: int, player_color: str) -> bool:
+        """Un punto está bloqueado para un jugador si tiene 2 o más fichas del oponente."""
+        if not self.is_valid_position(position):
+            raise InvalidPositionException(f"Posición {position} no es válida.")
+        return self._counts[opponent(player_color)][position] >= 2 and \
+            self._counts[player_color][position] == 0
+
+    def can_place_checker(self, position: int, player_color: str) -> bool:
+        """True si el jugador puede colocar una ficha en la posición."""
+        if not self.is_valid_position(position):
+            return False
+        if position in (BAR, OFF):
+            return True
+        return not self.is_point_blocked(position, player_color)
+
+    def place_checker(self, checker: Checker, position: int) -> Optional[Checker]:
+        """
+        Coloca una ficha (de su color) en la posición, capturando un blot rival.
+        Devuelve la ficha capturada o None.
+        """
+        if not self.is_valid_position(position):
+            raise InvalidPositionException(f"Posición {position} no es válida.")
+
+        color = checker.get_color()
+        if position in (BAR, OFF):
+            checker.set_position(position)
+            self._add(color, position, 1)
+            return None
+
+        if not self.can_place_checker(position, color):
+            raise InvalidPositionException(f"No se puede colocar ficha en posición {position}.")
+
+        captured = self._capture_at(position, color)
+        checker.set_position(position)
+        self._add(color, position, 1)
+        return captured
+
+    def remove_checker(self, position: int) -> Optional[Checker]:
+        """
+        Remueve una ficha de la posición (negra primero si el punto es mixto).
+        Devuelve la ficha removida o None si el punto está vacío.
+        """
+        if not self.is_valid_position(position):
+            raise InvalidPositionException(f"Posición {position} no es válida.")
+        for color, arr in (("black", self._black), ("white", self._white)):
+            if arr[position]:
+                self._add(color, position, -1)
+                return Checker.unchecked(color, position)
+        return None
+
+    def get_checkers_in_bar(self, player_color: str) -> List[Checker]:
+        """Fichas del jugador en el BAR (materializadas)."""
+        return [Checker.unchecked(player_color, BAR) for _ in range(self.count_at(BAR, player_color))]
+
+    def get_checkers_off_board(self, player_color: str) -> List[Checker]:
+        """Fichas del jugador fuera del tablero (materializadas)."""
+        return [Checker.unchecked(player_color, OFF) for _ in range(self.count_at(OFF, player_color))]
+
+    def get_home_board_range(self, player_color: str) -> Tuple[int, int]:
+        """Rango del home board según core/constants.py."""
+        return HOME_RANGE[player_color]
+
+    def all_checkers_in_home_board(self, player_color: str) -> bool:
+        """True si no hay fichas del color en el BAR ni fuera de su home board."""
+        arr = self._counts[player_color]
+        home_start, home_end = HOME_RANGE[player_color]
+        if arr[BAR]:
+            return False
+        return not any(arr[1:home_start]) and not any(arr[home_end + 1:OFF])
+
+    def count_checkers(self, player_color: str) -> Dict[str, int]:
+        """Cuenta las fichas del jugador por área: board, bar, off y total."""
+        arr = self._counts[player_color]
+        board = sum(arr[1:OFF])
+        counts = {"board": board, "bar": arr[BAR], "off": arr[OFF]}
+        counts["total"] = board + arr[BAR] + arr[OFF]
+        return counts
+
+    def count_checkers_at(self, position: int, color: Optional[str] = None) -> int:
+        """Cuenta fichas en 'position'. Si color no es None, filtra por color."""
+        if not self.is_valid_position(position):
+            raise InvalidPositionException(f"Posición {position} no es válida.")
+        if color is None:
+            return self._white[position] + self._black[position]
+        return self.count_at(position, color)
+
+    def count_off(self, color: str) -> int:
+        """Número de fichas borneadas (OFF) del color."""
+        return self.count_at(OFF, color)
+
+    def pip_count(self, color: str) -> int:
+        """Pip count de 'color' (las fichas en el BAR cuentan 25)."""
+        arr = self._counts[color]
+        if color == "white":
+            return 25 * arr[BAR] + sum(p * arr[p] for p in range(1, OFF))
+        return 25 * arr[BAR] + sum((25 - p) * arr[p] for p in range(1, OFF))
+
+    def count_on_board(self, color: str) -> int:
+        """Fichas de 'color' en los puntos 1..24."""
+        return sum(self._counts[color][1:OFF])
+
+    def count_remaining(self, color: str) -> int:
+        """Fichas de 'color' que faltan sacar (tablero + BAR)."""
+        return sum(self._counts[color][:OFF])
+
+    def count_outside_home(self, color: str) -> int:
+        """Fichas de 'color' en el tablero fuera de su home board (sin contar el BAR)."""
+        arr = self._counts[color]
+        home_start, home_end = HOME_RANGE[color]
+        return sum(arr[1:home_start]) + sum(arr[home_end + 1:OFF])
+
+    def count_in_home_of(self, color: str, home_color: str) -> int:
+        """Fichas de 'color' dentro del home board de 'home_color'."""
+        home_start, home_end = HOME_RANGE[home_color]
+        return sum(self._counts[color][home_start:home_end + 1])
+
+    def __str__(self) -> str:
+        """Representación visual (mismo formato que Board.__str__)."""
+        def cell(i: int) -> str:
+            if self._white[i]:
+                return f"{i:2d}(W{self._white[i]})"
+            if self._black[i]:
+                return f"{i:2d}(B{self._black[i]})"
+            return f"{i:2d}(--)"
+
+        lines = ["Tablero de Backgammon", "=" * 40]
+        lines.append("Upper: " + " ".join(cell(i) for i in range(13, 25)))
+        lines.append(f"BAR: W={self._white[BAR]}, B={self._black[BAR]}")
+        lines.append("Lower: " + " ".join(cell(i) for i in range(12, 0, -1)))
+        lines.append(f"OFF: W={self._white[OFF]}, B={self._black[OFF]}")
+        return "\n".join(lines)
+
+    # ---------- Helpers de dirección y destino ----------
+
+    def _validate_color(self, color: str) -> None:
+        if color not in ("white", "black"):
+            raise InvalidMoveException(f"Color inválido: {color}")
+
+    def _direction_for(self, color: str) -> int:
+        """white: -1 (24->1), black: +1 (1->24)"""
+        self._validate_color(color)
+        return -1 if color == "white" else +1
+
+    def _target_from(self, color: str, from_pos: int, steps: int) -> int:
+        """Calcula destino según color/dirección y pasos (valor del dado)."""
+        if not isinstance(steps, int) or steps <= 0 or steps > 6:
+            raise ValueError("Los pasos deben ser un entero entre 1 y 6.")
+        to_pos = from_pos - steps if color == "white" else from_pos + steps
+        if not (1 <= to_pos <= 24):
+            raise InvalidPositionException("El destino debe estar en 1..24 en M2.")
+        return to_pos
+
+    def _has_checker_of_color(self, position: int, color: str) -> bool:
+        """Hay al menos una ficha del color en 'position' (1..24)."""
+        if not (1 <= position <= 24):
+            return False
+        arr = self._counts.get(color)
+        return bool(arr is not None and arr[position])
+
+    def _is_blot(self, position: int, color: str) -> bool:
+        """Hay blot (1 ficha rival) en `position`."""
+        if not (1 <= position <= 24):
+            return False
+        return self._counts[opponent(color)][position] == 1 and self._counts[color][position] == 0
+
+    def _can_land_on(self, color: str, position: int) -> bool:
+        """Destino válido: vacío, propio o blot rival (no 2+ rivales)."""
+        if not (1 <= position <= 24):
+            return False
+        return self._counts[opponent(color)][position] < 2
+
+    # ---------- Validación y movimientos ----------
+
+    def validate_basic_move(self, color: str, from_pos: int, steps: int) -> int:
+        """Mismas reglas y excepciones que Board.validate_basic_move."""
+        self._validate_color(color)
+        if not (1 <= from_pos <= 24):
+            raise InvalidPositionException("El origen debe estar en 1..24.")
+        if not self._counts[color][from_pos]:
+            raise ValueError("No hay ficha propia en el punto de origen.")
+        to_pos = self._target_from(color, from_pos, steps)
+        if self.is_point_blocked(to_pos, color):
+            raise ValueError("El destino está bloqueado por el oponente.")
+        return to_pos
+
+    def can_capture(self, position: int, color: str) -> bool:
+        """¿Hay exactamente 1 ficha rival (blot) en `position`?"""
+        if not self.is_valid_position(position):
+            return False
+        if position in (BAR, OFF):
+            return False
+        return self._is_blot(position, color)
+
+    def _capture_at(self, position: int, color: str):
+        """
+        Efectúa la captura en `position` si hay blot rival: el blot pasa al BAR.
+        Devuelve la ficha capturada (materializada) o None.
+        """
+        if not self.is_valid_position(position):
+            raise InvalidPositionException(position)
+        if not self.can_capture(position, color):
+            return None
+        opp = opponent(color)
+        self._add(opp, position, -1)
+        self._add(opp, BAR, 1)
+        return Checker.unchecked(opp, BAR)
+
+    def move_checker(self, color: str, from_pos: int, steps: int):
+        """
+        Mueve UNA ficha de `color` desde `from_pos` con `steps` (1..6),
+        capturando un blot rival si lo hay.
+        Devuelve (from_pos, to_pos, captured_checker|None).
+        """
+        to_pos = self.validate_basic_move(color, from_pos, steps)
+        self._add(color, from_pos, -1)
+        captured = self._capture_at(to_pos, color)
+        self._add(color, to_pos, 1)
+        return (from_pos, to_pos, captured)
+
+    def has_checkers_in_bar(self, color: str) -> bool:
+        arr = self._counts.get(color)
+        return bool(arr is not None and arr[BAR])
+
+    def validate_reentry(self, color: str, steps: int) -> int:
+        """Destino de reingreso desde el BAR o InvalidMoveException."""
+        if steps < 1 or steps > 6:
+            raise InvalidMoveException("Valor inválido del dado")
+        destination = 25 - steps if color == "white" else steps
+        if self.is_point_blocked(destination, color):
+            raise InvalidMoveException(f"Entrada bloqueada en posición {destination}", destination)
+        return destination
+
+    def reenter_checker(self, color: str, steps: int):
+        """Mueve una ficha desde el BAR al tablero según steps (1..6)."""
+        if not self.has_checkers_in_bar(color):
+            raise InvalidMoveException("No hay fichas para reingresar desde el BAR")
+        destination = self.validate_reentry(color, steps)
+        self._add(color, BAR, -1)
+        captured = self._capture_at(destination, color)
+        self._add(color, destination, 1)
+        return (0, destination, captured)
+
+    # ---------------- Bearing off ----------------
+
+    def _in_home_board(self, color: str, position: int) -> bool:
+        start, end = HOME_RANGE[color]
+        return start <= position <= end
+
+    def _has_checkers_beyond(self, color: str, from_pos: int) -> bool:
+        """¿Hay fichas propias más lejos que from_pos dentro del home? (regla de overshoot)"""
+        home_start, home_end = HOME_RANGE[color]
+        arr = self._counts[color]
+        if color == "white":
+            return any(arr[from_pos + 1:home_end + 1])
+        return any(arr[home_start:from_pos])
+
+    def can_bear_off_from(self, color: str, from_pos: int, steps: int) -> bool:
+        """Mismas reglas que Board.can_bear_off_from (exacto u overshoot)."""
+        if not self.all_checkers_in_home_board(color):
+            return False
+        if not self._in_home_board(color, from_pos):
+            return False
+        if color == "white":
+            to_pos = from_pos - steps
+            if to_pos == 0:
+                return True
+            if to_pos < 1:
+                return not self._has_checkers_beyond(color, from_pos)
+            return False
+        to_pos = from_pos + steps
+        if to_pos == 25:
+            return True
+        if to_pos > 24:
+            return not self._has_checkers_beyond(color, from_pos)
+        return False
+
+    def bear_off_checker(self, color: str, from_pos: int, steps: int):
+        """
+        Saca UNA ficha desde 'from_pos' usando 'steps' (1..6).
+        Devuelve (from_pos, OFF, None).
+        """
+        if not self.can_bear_off_from(color, from_pos, steps):
+            raise InvalidMoveException("No se puede hacer bearing off desde esa posición con ese dado.")
+        if not self._counts[color][from_pos]:
+            raise NoCheckersAtPositionException(color, from_pos)
+        self._add(color, from_pos, -1)
+        self._add(color, OFF, 1)
+        return (from_pos, OFF, None)
+
+    def move_or_bear_off(self, color: str, from_pos: int, steps: int):
+        """Movimiento normal si el destino cae en 1..24; si no, bearing off."""
+        if not isinstance(steps, int) or steps <= 0 or steps > 6:
+            raise ValueError("Los pasos deben ser un entero entre 1 y 6.")
+        to_pos = from_pos - steps if color == "white" else from_pos + steps
+        if 1 <= to_pos <= 24:
+            return self.move_checker(color, from_pos, steps)
+        return self.bear_off_checker(color, from_pos, steps)
+
+    # ---------------- Predicados sin excepciones ----------------
+
+    def is_legal_move(self, color: str, from_pos: int, steps: int) -> bool:
+        """validate_basic_move como predicado: nunca lanza."""
+        arr = self._counts.get(color)
+        if arr is None or not isinstance(steps, int) or not (1 <= steps <= 6):
+            return False
+        if not isinstance(from_pos, int) or not (1 <= from_pos <= 24) or not arr[from_pos]:
+            return False
+        to_pos = from_pos - steps if color == "white" else from_pos + steps
+        if not (1 <= to_pos <= 24):
+            return False
+        return self._counts[opponent(color)][to_pos] < 2 or arr[to_pos] > 0
+
+    def is_legal_reentry(self, color: str, steps: int) -> bool:
+        """validate_reentry como predicado: nunca lanza."""
+        arr = self._counts.get(color)
+        if arr is None or not isinstance(steps, int) or not (1 <= steps <= 6):
+            return False
+        destination = 25 - steps if color == "white" else steps
+        return self._counts[opponent(color)][destination] < 2 or arr[destination] > 0
+
+    def is_legal_bear_off(self, color: str, from_pos: int, steps: int) -> bool:
+        """Hay ficha propia en from_pos y can_bear_off_from lo permite."""
+        if color not in self._counts or not isinstance(steps, int) or not (1 <= steps <= 6):
+            return False
+        if not isinstance(from_pos, int) or not self._has_checker_of_color(from_pos, color):
+            return False
+        return self.can_bear_off_from(color, from_pos, steps)
+
+    def classify_move(self, color: str, from_pos: int, steps: int) -> MoveCheck:
+        """Ver core.move_check.classify_move."""
+        return classify_move(self, color, from_pos, steps)
+
+    # ---------------- Helpers de testing ----------------
+
+    def set_count_at(self, position: int, color: str, count: int) -> None:
+        """
+        Fuerza la cantidad de fichas de 'color' en 'position'
+        (vacía el punto de ambos colores, igual que Board.set_count_at).
+        """
+        if not self.is_valid_position(position):
+            raise InvalidPositionException(f"Posición {position} no es válida.")
+        self._add("white", position, -self._white[position])
+        self._add("black", position, -self._black[position])
+        self._add(color, position, max(0, count))
+
+    # ---------------- Clave Zobrist ----------------
+
+    def _add(self, color: str, position: int, delta: int) -> None:
+        """
+        Suma `delta` fichas de `color` en `position` actualizando la clave
+        Zobrist y el punto más atrasado del color (igual que Board._track).
+        """
+        arr = self._counts[color]
+        n = arr[position]
+        self._zobrist ^= point_key(color, position, n) ^ point_key(color, position, n + delta)
+        arr[position] = n + delta
+        if position == OFF:
+            return
+        rank = position if position != BAR else _BACK_ORDER[color][0][1]
+        back = self._back[color]
+        if delta > 0:
+            if (rank > back) if color == "white" else (rank < back):
+                self._back[color] = rank
+                self._back_dirty[color] = False
+                self._race = None
+        elif delta < 0 and rank == back and not arr[position]:
+            self._back_dirty[color] = True
+            if self._race is False:
+                self._race = None
+
+    def zobrist_key(self) -> int:
+        """Clave Zobrist de 64 bits de la posición (sin el turno); igual a la de Board."""
+        return self._zobrist
+
+    def recompute_zobrist_key(self) -> int:
+        """
+        Recalcula la clave desde los arreglos de conteo y la guarda. Como se
+        llama tras escribir los arreglos en bloque, también marca para
+        recalcular el punto más atrasado de cada color.
+        """
+        key = 0
+        for color, arr in self._counts.items():
+            for position, n in enumerate(arr):
+                key ^= point_key(color, position, n)
+        self._zobrist = key
+        self._back_dirty = {"white": True, "black": True}
+        self._race = None
+        return key
+
+    # ---------------- Carrera ----------------
+
+    def _rearmost(self, color: str) -> int:
+        """Rango del punto más atrasado de `color` (ver Board._rearmost)."""
+        if self._back_dirty[color]:
+            self._back_dirty[color] = False
+            arr = self._counts[color]
+            self._back[color] = next(
+                (rank for position, rank in _BACK_ORDER[color] if arr[position]), _NO_BACK[color],
+            )
+        return self._back[color]
+
+    def is_race(self) -> bool:
+        """
+        True si ya no hay contacto (ver Board.is_race). Se cachea y sólo se
+        recalcula cuando una ficha queda detrás de la última de su color o se
+        vacía el punto más atrasado.
+        """
+        if self._race is None:
+            self._race = self._rearmost("white") < self._rearmost("black")
+        return self._race
+
+    # ---------------- make / unmake y snapshots ----------------
+
+    def make_move(self, color: str, from_pos: int, steps: int) -> MoveToken:
+        """Aplica UN movimiento y devuelve el MoveToken para unmake_move (ver Board.make_move)."""
+        if from_pos == BAR:
+            _, to_pos, captured = self.reenter_checker(color, steps)
+        else:
+            _, to_pos, captured = self.move_or_bear_off(color, from_pos, steps)
+        return MoveToken(color, from_pos, to_pos, captured is not None)
+
+    def unmake_move(self, token: MoveToken) -> None:
+        """Revierte exactamente el movimiento de `token` (debe ser el último aplicado)."""
+        color, from_pos, to_pos, hit = token
+        if not self._counts[color][to_pos]:
+            raise NoCheckersAtPositionException(color, to_pos)
+        self._add(color, to_pos, -1)
+        self._add(color, from_pos, 1)
+        if hit:
+            opp = opponent(color)
+            if not self._counts[opp][BAR]:
+                raise NoCheckersAtPositionException(opp, BAR)
+            self._add(opp, BAR, -1)
+            self._add(opp, to_pos, 1)
+
+    def snapshot(self) -> bytes:
+        """Posición empaquetada en 52 bytes (mismo formato que Board.snapshot)."""
+        return bytes(self._white) + bytes(self._black)
+
+    def restore(self, snapshot: bytes) -> None:
+        """Restaura una posición de snapshot()."""
+        if len(snapshot) != 52:
+            raise ValueError("El snapshot debe tener 52 bytes (26 por color).")
+        self._white[:] = snapshot[:26]
+        self._black[:] = snapshot[26:]
+        self.recompute_zobrist_key()
+
+    def to_id(self, on_roll: str = "white") -> str:
+        """Position ID de 14 caracteres (ver Board.to_id)."""
+        from core.position_id import position_id
+        return position_id(self, on_roll)
+
+    @classmethod
+    def from_id(cls, pid: str, on_roll: str = "white") -> "CompactBoard":
+        """Tablero con la posición del Position ID `pid`."""
+        from core.position_id import position_from_id
+        white, black = position_from_id(pid, on_roll)
+        board = cls(empty=True)
+        board.restore(bytes(white) + bytes(black))
+        return board
@@ -38,6 +38,14 @@ class Dice:
         self._apply_roll(a, b)
         return (a, b)
 
+    def reset(self, seed: Optional[int] = None) -> None:
+        """Vuelve al estado inicial (sin tirada). Con `seed`, resiembra el generador."""
+        if seed is not None:
+            self._rng.seed(seed)
+        self.last_roll = None
+        self.available_moves.clear()
+        self.used_moves.clear()
+
     def reset_moves(self) -> None:
         if self.last_roll is None:
             self.available_moves.clear()
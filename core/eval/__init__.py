@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Evaluación de posiciones.
+
+- Evaluator: interfaz de los backends (equity en [-1, 1] para un color).
+- HeuristicEvaluator: pesos sobre rasgos clásicos, sin dependencias.
+- MLPEvaluator / batch_features: backend vectorizado con NumPy (opcional).
+- rank_plays / best_play: evalúan todas las jugadas de una tirada en lote.
+- BearoffEvaluator: valores exactos de core.bearoff en el endgame.
+- RaceEvaluator: pip count efectivo (con desperdicio) cuando no hay contacto.
+"""
+
+from core.eval.base import Evaluator
+from core.eval.batch import batch_features, best_play, rank_plays
+from core.eval.bearoff import BearoffEvaluator
+from core.eval.features import (
+    FEATURE_NAMES,
+    NUM_FEATURES,
+    extract_features,
+    features_dict,
+    has_contact,
+    pip_count,
+)
+from core.eval.heuristic import DEFAULT_WEIGHTS, HeuristicEvaluator
+from core.eval.mlp import MLPEvaluator
+from core.eval.race import RaceEvaluator, effective_pip_count
+
+__all__ = [
+    "Evaluator", "HeuristicEvaluator", "MLPEvaluator", "BearoffEvaluator", "RaceEvaluator",
+    "DEFAULT_WEIGHTS", "effective_pip_count",
+    "FEATURE_NAMES", "NUM_FEATURES", "extract_features", "features_dict",
+    "has_contact", "pip_count", "batch_features", "rank_plays", "best_play",
+]
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Interfaz común de los evaluadores de posición.
+
+Un evaluador devuelve la equity de una posición desde el punto de vista de
+`color`, en [-1, 1] (1 = victoria segura, -1 = derrota segura). Los backends
+sólo necesitan implementar evaluate; evaluate_batch tiene una versión por
+defecto que evalúa de a una, y los backends vectorizados la reemplazan.
+"""
+
+from typing import List, Sequence
+
+__all__ = ["Evaluator"]
+
+
+class Evaluator:
+    """Backend de evaluación. Subclases: HeuristicEvaluator, MLPEvaluator."""
+
+    name = "base"
+
+    def evaluate(self, board_or_position, color: str) -> float:
+        """Equity de la posición (tablero o posición empaquetada) para `color`."""
+        raise NotImplementedError
+
+    def evaluate_batch(self, positions: Sequence, color: str) -> List[float]:
+        """Equity de varias posiciones para `color`, en el mismo orden."""
+        return [self.evaluate(p, color) for p in positions]
+
+    def __call__(self, board_or_position, color: str) -> float:
+        return self.evaluate(board_or_position, color)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name!r})"
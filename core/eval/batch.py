@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Evaluación en lote de todas las jugadas de una tirada.
+
+batch_features arma con NumPy la matriz (N, NUM_FEATURES) de N posiciones a
+partir de sus conteos (mismos valores que extract_features). rank_plays
+genera todas las posiciones resultantes de una tirada (core.movegen), las
+evalúa en una sola llamada a evaluator.evaluate_batch y devuelve las jugadas
+ordenadas de mejor a peor.
+"""
+
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende del entorno
+    np = None
+
+from core.eval.features import as_position
+from core.movegen import Play, generate_play_positions
+
+__all__ = ["batch_features", "require_numpy", "rank_plays", "best_play"]
+
+# Índices para pasar los conteos de cada color a su marco relativo: [OFF, 1..24, BAR]
+_OWN_IDX = {"white": [25] + list(range(1, 25)) + [0], "black": [25] + list(range(24, 0, -1)) + [0]}
+
+
+def require_numpy() -> None:
+    if np is None:
+        raise ImportError("Este backend requiere numpy (pip install numpy).")
+
+
+def _side_features(own: "np.ndarray") -> "np.ndarray":
+    """Rasgos SIDE_FEATURES de N bandos (matriz (N, 26) en marco relativo)."""
+    board = own[:, 1:25]
+    made = board >= 2
+    prime = np.zeros(len(own), dtype=np.int64)
+    run = np.zeros(len(own), dtype=np.int64)
+    for i in range(24):
+        run = (run + 1) * made[:, i]
+        np.maximum(prime, run, out=prime)
+    return np.stack([
+        own @ np.arange(26),        # el índice relativo es la distancia (OFF = 0, BAR = 25)
+        own[:, 0],
+        own[:, 25],
+        (board == 1).sum(axis=1),
+        made.sum(axis=1),
+        made[:, 0:6].sum(axis=1),
+        prime,
+        made[:, 18:24].sum(axis=1),
+    ], axis=1)
+
+
+def batch_features(positions: Sequence, color: str) -> "np.ndarray":
+    """
+    Matriz (N, NUM_FEATURES) de rasgos de `positions` (tableros o posiciones
+    empaquetadas) desde el punto de vista de `color`. Igual a apilar
+    extract_features, pero vectorizado.
+    """
+    require_numpy()
+    if color not in _OWN_IDX:
+        raise ValueError(f"Color inválido: {color}")
+    other = "black" if color == "white" else "white"
+    arr = np.asarray([as_position(p) for p in positions], dtype=np.int64).reshape(-1, 2, 26)
+    mine_counts = arr[:, 0] if color == "white" else arr[:, 1]
+    their_counts = arr[:, 1] if color == "white" else arr[:, 0]
+
+    mine = _side_features(mine_counts[:, _OWN_IDX[color]])
+    theirs = _side_features(their_counts[:, _OWN_IDX[other]])
+
+    # Contacto en el marco de white: su ficha más atrasada (BAR = 25) contra
+    # la negra más adelantada (BAR negro = 0); los conteos negros ya están en ese marco
+    white = arr[:, 0][:, _OWN_IDX["white"]]
+    back = np.where(white[:, 1:26] > 0, np.arange(1, 26), 0).max(axis=1)
+    front = np.where(arr[:, 1, 0:25] > 0, np.arange(0, 25), 25).min(axis=1)
+    contact = (back > front).astype(np.int64)
+
+    return np.concatenate(
+        [mine, theirs, contact[:, None], (theirs[:, 0] - mine[:, 0])[:, None]], axis=1
+    )
+
+
+def rank_plays(board_or_position, color: str, dice: Sequence[int], evaluator) -> List[Tuple[Play, float]]:
+    """
+    Todas las jugadas legales de `color` con `dice` junto con la equity de la
+    posición resultante según `evaluator`, de mejor a peor (a igual equity se
+    respeta el orden del generador). Sin movimiento posible: [((), equity)].
+    """
+    results = generate_play_positions(board_or_position, color, dice)
+    plays = [play for play, _ in results]
+    scores = evaluator.evaluate_batch([pos for _, pos in results], color)
+    if np is not None and isinstance(scores, np.ndarray):
+        order = np.argsort(-scores, kind="stable")
+        return [(plays[i], float(scores[i])) for i in order]
+    ranked = sorted(zip(plays, scores), key=lambda item: -item[1])
+    return [(play, float(score)) for play, score in ranked]
+
+
+def best_play(board_or_position, color: str, dice: Sequence[int], evaluator) -> Play:
+    """La mejor jugada según `evaluator` (() si no hay movimiento posible)."""
+    results = generate_play_positions(board_or_position, color, dice)
+    if len(results) == 1:           # jugada forzada (o vacía): no hace falta evaluar
+        return results[0][0]
+    scores = evaluator.evaluate_batch([pos for _, pos in results], color)
+    if np is not None and isinstance(scores, np.ndarray):
+        return results[int(np.argmax(scores))][0]
+    return results[max(range(len(results)), key=scores.__getitem__)][0]
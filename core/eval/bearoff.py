@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Evaluador exacto de bearoff con respaldo para el resto de las posiciones.
+
+Las posiciones que recibe un evaluador son las que quedan después de la
+jugada de `color`, así que el que tira es el rival: la equity sale de
+BearoffDatabase.lookup(position, rival). Ignora gammons (en el bearoff puro
+son raros); fuera de la base usa el evaluador de respaldo.
+"""
+
+from core.constants import opponent
+from core.eval.base import Evaluator
+from core.eval.heuristic import HeuristicEvaluator
+
+__all__ = ["BearoffEvaluator"]
+
+
+class BearoffEvaluator(Evaluator):
+    """Consulta la base de bearoff si ambos bandos están en bearoff; si no, `fallback`."""
+
+    name = "bearoff"
+
+    def __init__(self, database, fallback=None):
+        self.database = database
+        self.fallback = fallback or HeuristicEvaluator()
+
+    def evaluate(self, board_or_position, color: str) -> float:
+        p_opponent = self.database.lookup(board_or_position, opponent(color))
+        if p_opponent is None:
+            return self.fallback.evaluate(board_or_position, color)
+        return 1.0 - 2.0 * p_opponent
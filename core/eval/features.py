@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Rasgos (features) de una posición para los evaluadores.
+
+Todo se calcula sobre la posición empaquetada de core.movegen
+((conteos blancos, conteos negros)) en el marco relativo de cada color:
+own[1..24] son sus puntos numerados por distancia a casa, own[25] su BAR y
+own[0] sus fichas borneadas. Así los mismos rasgos valen para ambos colores.
+"""
+
+from typing import Dict, Tuple
+
+from core.constants import opponent
+from core.movegen import Position, _to_relative, position_of
+
+__all__ = [
+    "SIDE_FEATURES", "FEATURE_NAMES", "NUM_FEATURES",
+    "as_position", "pip_count", "side_features", "has_contact",
+    "extract_features", "features_dict",
+]
+
+# Rasgos por bando, en este orden
+SIDE_FEATURES: Tuple[str, ...] = (
+    "pips",          # pip count (distancia total a casa, BAR = 25)
+    "off",           # fichas borneadas
+    "bar",           # fichas en el BAR
+    "blots",         # puntos con una sola ficha
+    "points",        # puntos hechos (2+ fichas)
+    "home_points",   # puntos hechos en el home propio
+    "prime",         # largo del prime más largo (puntos hechos consecutivos)
+    "anchors",       # puntos hechos en el home rival
+)
+# Vector completo: rasgos del que evalúa, rasgos del rival y dos globales
+FEATURE_NAMES: Tuple[str, ...] = (
+    tuple(f"own_{n}" for n in SIDE_FEATURES)
+    + tuple(f"opp_{n}" for n in SIDE_FEATURES)
+    + ("contact", "pip_diff")
+)
+NUM_FEATURES = len(FEATURE_NAMES)
+
+
+def as_position(board_or_position) -> Position:
+    """Acepta una posición empaquetada o cualquier tablero (ver movegen.position_of)."""
+    if isinstance(board_or_position, tuple):
+        return board_or_position
+    return position_of(board_or_position)
+
+
+def _pips(own) -> int:
+    return sum(i * own[i] for i in range(1, 26))
+
+
+def pip_count(board_or_position, color: str) -> int:
+    """Pip count de `color` (las fichas en el BAR cuentan 25)."""
+    own, _ = _to_relative(as_position(board_or_position), color)
+    return _pips(own)
+
+
+def side_features(own) -> Tuple[int, ...]:
+    """Rasgos SIDE_FEATURES de un bando dado en su marco relativo."""
+    made = [own[i] >= 2 for i in range(25)]
+    prime = run = 0
+    for i in range(1, 25):
+        run = run + 1 if made[i] else 0
+        prime = max(prime, run)
+    return (
+        _pips(own),
+        own[0],
+        own[25],
+        sum(1 for i in range(1, 25) if own[i] == 1),
+        sum(made[1:25]),
+        sum(made[1:7]),
+        prime,
+        sum(made[19:25]),
+    )
+
+
+def has_contact(board_or_position) -> bool:
+    """
+    True si todavía hay contacto: alguna ficha blanca (o en el BAR) está
+    detrás de alguna ficha negra. Sin contacto la partida es una carrera.
+    Los tableros con is_race() (Board y CompactBoard) lo resuelven en O(1).
+    """
+    if hasattr(board_or_position, "is_race"):
+        return not board_or_position.is_race()
+    own, opp = _to_relative(as_position(board_or_position), "white")
+    back = max((i for i in range(1, 26) if own[i]), default=0)
+    front = min((i for i in range(0, 25) if opp[i]), default=25)
+    return back > front
+
+
+def extract_features(board_or_position, color: str) -> Tuple[int, ...]:
+    """Vector de rasgos FEATURE_NAMES desde el punto de vista de `color`."""
+    position = as_position(board_or_position)
+    own, _ = _to_relative(position, color)
+    theirs, _ = _to_relative(position, opponent(color))
+    mine_f = side_features(own)
+    theirs_f = side_features(theirs)
+    return mine_f + theirs_f + (int(has_contact(position)), theirs_f[0] - mine_f[0])
+
+
+def features_dict(board_or_position, color: str) -> Dict[str, int]:
+    """extract_features con nombres (útil para depurar y para la UI)."""
+    return dict(zip(FEATURE_NAMES, extract_features(board_or_position, color)))
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Evaluador heurístico: combinación lineal de diferencias de rasgos.
+
+Con contacto pesan blots, puntos, primes y anclas; sin contacto (carrera)
+sólo importan el pip count relativo y las fichas borneadas. Con NumPy,
+evaluate_batch puntúa todas las posiciones sobre la matriz de batch_features.
+"""
+
+import math
+from typing import Dict, Optional, Sequence
+
+from core.eval.base import Evaluator
+from core.eval.batch import batch_features, np
+from core.eval.features import SIDE_FEATURES, extract_features
+
+__all__ = ["DEFAULT_WEIGHTS", "HeuristicEvaluator"]
+
+# Pesos por rasgo: se aplican a (propio - rival)
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    "pips": -0.012,
+    "off": 0.08,
+    "bar": -0.15,
+    "blots": -0.10,
+    "points": 0.05,
+    "home_points": 0.08,
+    "prime": 0.10,
+    "anchors": 0.06,
+    "race": 2.5,       # carrera: escala de (pips rival - propios) / pips totales
+}
+
+_CONTACT_ONLY = {"blots", "points", "home_points", "prime", "anchors"}
+_N = len(SIDE_FEATURES)
+
+
+class HeuristicEvaluator(Evaluator):
+    """
+    Evaluador sin dependencias. `weights` reemplaza parcialmente a DEFAULT_WEIGHTS.
+    La suma ponderada se comprime a [-1, 1] con tanh.
+    """
+
+    name = "heuristic"
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None):
+        self.weights = dict(DEFAULT_WEIGHTS)
+        if weights:
+            unknown = set(weights) - set(DEFAULT_WEIGHTS)
+            if unknown:
+                raise ValueError(f"Pesos desconocidos: {sorted(unknown)}")
+            self.weights.update(weights)
+
+    def score(self, features) -> float:
+        """Suma ponderada (sin comprimir) de un vector de extract_features."""
+        mine, theirs, contact = features[:_N], features[_N:2 * _N], features[2 * _N]
+        total = 0.0
+        for i, name in enumerate(SIDE_FEATURES):
+            if not contact and name in _CONTACT_ONLY:
+                continue
+            total += self.weights[name] * (mine[i] - theirs[i])
+        if not contact:
+            pips = mine[0] + theirs[0]
+            if pips:
+                total += self.weights["race"] * (theirs[0] - mine[0]) / pips
+        return total
+
+    def evaluate(self, board_or_position, color: str) -> float:
+        features = extract_features(board_or_position, color)
+        if features[1] == 15:          # own_off: ya ganó
+            return 1.0
+        if features[_N + 1] == 15:     # opp_off: ya perdió
+            return -1.0
+        return math.tanh(self.score(features))
+
+    def evaluate_batch(self, positions: Sequence, color: str):
+        """Igual que evaluate para cada posición; vectorizado si hay NumPy."""
+        if np is None or len(positions) == 0:
+            return super().evaluate_batch(positions, color)
+        features = batch_features(positions, color).astype(np.float64)
+        mine, theirs, contact = features[:, :_N], features[:, _N:2 * _N], features[:, 2 * _N]
+        weights = np.array([self.weights[name] for name in SIDE_FEATURES])
+        in_race = np.array([name not in _CONTACT_ONLY for name in SIDE_FEATURES])
+        terms = (mine - theirs) * weights
+        total = np.where(contact[:, None] > 0, terms, terms * in_race).sum(axis=1)
+        pips = mine[:, 0] + theirs[:, 0]
+        race = self.weights["race"] * (theirs[:, 0] - mine[:, 0]) / np.maximum(pips, 1)
+        total += np.where((contact == 0) & (pips > 0), race, 0.0)
+        equity = np.tanh(total)
+        equity[mine[:, 1] == 15] = 1.0
+        equity[(theirs[:, 1] == 15) & (mine[:, 1] != 15)] = -1.0
+        return equity
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Backend MLP chico sobre la matriz de rasgos de core.eval.batch.
+
+MLPEvaluator pasa la matriz (N, NUM_FEATURES) normalizada por una capa
+oculta tanh y devuelve la equity de todas las posiciones en una sola
+multiplicación de matrices.
+
+NumPy es opcional: el resto de core.eval funciona sin él.
+"""
+
+from typing import Dict, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende del entorno
+    np = None
+
+from core.eval.base import Evaluator
+from core.eval.batch import batch_features, require_numpy
+from core.eval.features import FEATURE_NAMES, NUM_FEATURES
+
+__all__ = ["FEATURE_SCALE", "MLPEvaluator"]
+
+# Escala aproximada de cada rasgo para normalizar la entrada de la red
+FEATURE_SCALE = {
+    "pips": 167.0, "off": 15.0, "bar": 3.0, "blots": 5.0, "points": 8.0,
+    "home_points": 6.0, "prime": 6.0, "anchors": 3.0,
+}
+
+
+class MLPEvaluator(Evaluator):
+    """
+    Red de una capa oculta: equity = tanh(W2 · tanh(W1 · x + b1) + b2).
+
+    Sin pesos entrenados se inicializa con pesos aleatorios chicos (semilla
+    fija) más un sesgo lineal hacia la diferencia de pips, de modo que ya
+    prefiere posiciones razonables. Los pesos se guardan/cargan en .npz.
+    """
+
+    name = "mlp"
+
+    def __init__(self, hidden: int = 32, weights: Optional[Dict[str, "np.ndarray"]] = None, seed: int = 0):
+        require_numpy()
+        if weights is None:
+            weights = self._initial_weights(hidden, seed)
+        self.W1 = np.asarray(weights["W1"], dtype=np.float64)
+        self.b1 = np.asarray(weights["b1"], dtype=np.float64)
+        self.W2 = np.asarray(weights["W2"], dtype=np.float64)
+        self.b2 = np.asarray(weights["b2"], dtype=np.float64)
+        if self.W1.shape[0] != NUM_FEATURES or self.W2.shape != (self.W1.shape[1],):
+            raise ValueError("Dimensiones de pesos incompatibles con NUM_FEATURES.")
+        self.scale = np.array(
+            [FEATURE_SCALE.get(n.split("_", 1)[1], 1.0) for n in FEATURE_NAMES[:-2]] + [1.0, 167.0]
+        )
+
+    @staticmethod
+    def _initial_weights(hidden: int, seed: int) -> Dict[str, "np.ndarray"]:
+        rng = np.random.default_rng(seed)
+        W1 = rng.normal(0.0, 0.1, size=(NUM_FEATURES, hidden))
+        W1[FEATURE_NAMES.index("pip_diff"), 0] = 3.0    # unidad 0: ventaja en la carrera
+        W2 = rng.normal(0.0, 0.05, size=hidden)
+        W2[0] = 1.0
+        return {"W1": W1, "b1": np.zeros(hidden), "W2": W2, "b2": np.zeros(())}
+
+    def forward(self, features: "np.ndarray") -> "np.ndarray":
+        """Equity para una matriz de rasgos (N, NUM_FEATURES)."""
+        x = features / self.scale
+        return np.tanh(np.tanh(x @ self.W1 + self.b1) @ self.W2 + self.b2)
+
+    def evaluate_batch(self, positions: Sequence, color: str) -> "np.ndarray":
+        """Equity de todas las posiciones en una sola pasada (array de largo N)."""
+        if len(positions) == 0:
+            return np.zeros(0)
+        return self.forward(batch_features(positions, color))
+
+    def evaluate(self, board_or_position, color: str) -> float:
+        return float(self.evaluate_batch([board_or_position], color)[0])
+
+    def save(self, path: str) -> None:
+        np.savez(path, W1=self.W1, b1=self.b1, W2=self.W2, b2=self.b2)
+
+    @classmethod
+    def load(cls, path: str) -> "MLPEvaluator":
+        require_numpy()
+        with np.load(path) as data:
+            return cls(weights={k: data[k] for k in ("W1", "b1", "W2", "b2")})
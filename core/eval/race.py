@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Evaluador de carreras por pip count efectivo.
+
+Sin contacto sólo importa quién termina de sacar primero. El pip count
+crudo subestima lo que falta cuando hay fichas apiladas en los puntos bajos
+(un 6 que saca una ficha del punto 1 desperdicia 5 pips) o huecos en el
+home, así que se le suma un desperdicio (wastage) aproximado:
+  - por ficha en el home, según el punto (_POINT_WASTAGE);
+  - por punto vacío del home por debajo del más alto ocupado (_GAP_WASTAGE).
+La equity sale de la diferencia de pip count efectivo, descontando al que
+evalúa medio tiro (el rival es el que tira), comprimida con erf según el
+largo de la carrera. Con contacto delega en el evaluador de respaldo.
+"""
+
+import math
+from typing import List, Sequence
+
+from core.constants import opponent
+from core.eval.base import Evaluator
+from core.eval.features import _pips, as_position, has_contact
+from core.eval.heuristic import HeuristicEvaluator
+from core.movegen import _to_relative
+
+__all__ = ["RaceEvaluator", "effective_pip_count"]
+
+# Desperdicio por ficha en los puntos 1..6 del home (índice = punto relativo)
+_POINT_WASTAGE = (0.0, 2.5, 1.75, 1.0, 0.5, 0.25, 0.0)
+_GAP_WASTAGE = 0.5
+_ON_ROLL = 4.0          # medio tiro promedio (8.17 / 2) a favor del que tira
+_SPREAD = 0.9           # desvío de la diferencia final ~ _SPREAD * sqrt(pips totales)
+
+
+def _effective(own) -> float:
+    wastage = sum(_POINT_WASTAGE[i] * own[i] for i in range(1, 7))
+    highest = next((i for i in range(6, 0, -1) if own[i]), 0)
+    wastage += _GAP_WASTAGE * sum(1 for i in range(1, highest) if not own[i])
+    return _pips(own) + wastage
+
+
+def effective_pip_count(board_or_position, color: str) -> float:
+    """Pip count de `color` más el desperdicio estimado al sacar."""
+    own, _ = _to_relative(as_position(board_or_position), color)
+    return _effective(own)
+
+
+class RaceEvaluator(Evaluator):
+    """Evalúa carreras por pip count efectivo; con contacto usa `fallback`."""
+
+    name = "race"
+
+    def __init__(self, fallback=None):
+        self.fallback = fallback or HeuristicEvaluator()
+
+    def race_equity(self, board_or_position, color: str) -> float:
+        """Equity de carrera para `color` (después de su jugada: tira el rival)."""
+        position = as_position(board_or_position)
+        own, opp = _to_relative(position, color)
+        if own[0] == 15:
+            return 1.0
+        if opp[0] == 15:
+            return -1.0
+        mine = _effective(own)
+        theirs = _effective(_to_relative(position, opponent(color))[0])
+        spread = max(1.0, _SPREAD * math.sqrt(mine + theirs))
+        return math.erf((theirs - mine - _ON_ROLL) / (spread * math.sqrt(2.0)))
+
+    def evaluate(self, board_or_position, color: str) -> float:
+        if has_contact(board_or_position):
+            return self.fallback.evaluate(board_or_position, color)
+        return self.race_equity(board_or_position, color)
+
+    def evaluate_batch(self, positions: Sequence, color: str) -> List[float]:
+        """Carreras una por una; las posiciones con contacto, en lote al respaldo."""
+        result: List[float] = [0.0] * len(positions)
+        contact = []
+        for i, position in enumerate(positions):
+            if has_contact(position):
+                contact.append(i)
+            else:
+                result[i] = self.race_equity(position, color)
+        if contact:
+            scores = self.fallback.evaluate_batch([positions[i] for i in contact], color)
+            for i, score in zip(contact, scores):
+                result[i] = float(score)
+        return result
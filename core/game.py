@@ -17,7 +17,14 @@ class GameResult:
     points: int
 
 
+from core.board_state import BoardStateAdapter, as_board_state, determine_outcome
 from core.exceptions import BackgammonException
+from core.move_check import MoveToken
+from core.movegen import Play, generate_plays
+from core.search import ExpectimaxSearch, SearchResult
+from core.position_id import GAME_OVER, GAME_PLAYING, MatchInfo, match_id, position_id
+from core.zobrist import board_key, side_key
+from core.eval import HeuristicEvaluator, best_play, rank_plays
 
 class GameRuleError(BackgammonException):
     """Excepción ..."""
@@ -54,10 +61,75 @@ class BackgammonGame:
         self.game_over: bool = False
         self.result: Optional[GameResult] = None
         self._turn_start_dice: Tuple[int, ...] = tuple()
+        # Journal de eventos (storage.journal.GameJournal) o None
+        self.journal = None
+        # Deshacer / rehacer dentro del turno: (MoveToken, dado, índice del dado) y (from_pos, steps)
+        self._undo_stack: list = []
+        self._redo_stack: list = []
 
 
 
 
+    def reset(self, starting_color: Optional[str] = None, dice_seed: Optional[int] = None) -> None:
+        """
+    Prepara una partida nueva reutilizando board, dice y jugadores:
+    el tablero vuelve a la posición inicial (board.reset) y los dados quedan
+    sin tirada (dice.reset, resembrados con `dice_seed` si se da). Con un
+    journal conectado se escribe un checkpoint de la posición inicial, para
+    que la partida nueva no se reproduzca sobre el final de la anterior.
+    """
+        self.board.reset()
+        if hasattr(self.dice, "reset"):
+            self.dice.reset(dice_seed)
+        self.current_color = starting_color or self._order[0]
+        self.turn_number = 1
+        self._turn_active = False
+        self.game_over = False
+        self.result = None
+        self._turn_start_dice = tuple()
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+        if self.journal is not None:
+            self.journal.checkpoint(self)
+
+    def restore_state(self, board: bytes, current_color: str, turn_number: int, turn_active: bool,
+                      turn_start_dice=(), game_over: bool = False, result=None) -> None:
+        """
+    Vuelca un estado guardado (p. ej. por storage) sobre la partida: restaura
+    el tablero desde el snapshot `board` y el turno. Las pilas de deshacer /
+    rehacer se vacían, porque sus tokens pertenecen a la posición anterior.
+    Los dados los restaura quien llama. Con un journal conectado se escribe
+    un checkpoint de la posición restaurada.
+    """
+        self.board.restore(board)
+        self.current_color = current_color
+        self.turn_number = turn_number
+        self._turn_active = turn_active
+        self._turn_start_dice = tuple(turn_start_dice)
+        self.game_over = game_over
+        self.result = result
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+        if self.journal is not None:
+            self.journal.checkpoint(self)
+
+    def attach_journal(self, journal) -> None:
+        """
+    Registra desde ahora los eventos de la partida en `journal` (ver
+    storage.journal.GameJournal), empezando por un checkpoint del tablero.
+    None lo desconecta.
+    """
+        self.journal = journal
+        if journal is not None:
+            journal.checkpoint(self)
+
+    def _target_of(self, color: str, from_pos: int, steps: int) -> int:
+        """Destino de mover `steps` desde `from_pos` (BAR = entrada, fuera del tablero = OFF)."""
+        if from_pos == self.BAR:
+            return 25 - steps if color == "white" else steps
+        to_pos = from_pos - steps if color == "white" else from_pos + steps
+        return to_pos if 1 <= to_pos <= 24 else self.OFF
+
     # ---------------- Utils ----------------
     def _other_color(self, color: str) -> str:
         return "black" if color == "white" else "white"
@@ -77,9 +149,14 @@ class BackgammonGame:
         if self._turn_active:
             raise GameRuleError("El turno ya está activo.")
         self._turn_active = True
+        self._undo_stack.clear()
+        self._redo_stack.clear()
 
         if hasattr(self.dice, "roll"):
             self.dice.roll()
+        roll = getattr(self.dice, "last_roll", None)
+        if self.journal is not None and roll:
+            self.journal.record_roll(self.current_color, roll[0], roll[1])
 
         # guardamos una foto de los dados disponibles al inicio (informativo)
         self._turn_start_dice = tuple(self._get_available_moves())
@@ -126,6 +203,10 @@ class BackgammonGame:
                     )
 
         # 1) Ejecutar el movimiento en el board
+        color = self.current_color
+        state = as_board_state(self.board)
+        opp_bar = state.count_bar(self._other_color(color))
+        die_index = self._die_index(steps)
         if from_pos == self.BAR:
             self.board.reenter_checker(self.current_color, steps)
         else:
@@ -134,27 +215,76 @@ class BackgammonGame:
             else:
                 self.board.move_checker(self.current_color, from_pos, steps)
 
-        # 2) Consumir el dado
+        # 2) Consumir el dado y guardar el delta para deshacer
         self.dice.use_move(steps)
+        token = MoveToken(color, from_pos, self._target_of(color, from_pos, steps),
+                          state.count_bar(self._other_color(color)) > opp_bar)
+        self._push_undo(token, steps, die_index)
 
         # 3) Victoria inmediata si no quedan fichas en tablero ni en BAR
-        left = self._remaining_on_board_or_bar(self.current_color)
-        if left == 0:
+        if self._remaining_on_board_or_bar(self.current_color) == 0:
             self._finalize_game(winner_color=self.current_color)
-            return
-
-        # 4) (Opcional) fallback: si tu Board expone off correctamente y llega a 15, también cerrá.
+        # 4) Tableros sin contadores propios: cerrar también si informan 15 fichas OFF
+        #    (en Board/CompactBoard equivale al paso 3)
+        elif isinstance(as_board_state(self.board), BoardStateAdapter):
+            self._check_victory_after_move(self.current_color)
+
+    # ---------------- Deshacer / rehacer ----------------
+    def _die_index(self, steps: int) -> Optional[int]:
+        """Posición de `steps` en dice.available_moves (para devolverlo al mismo lugar)."""
+        moves = getattr(self.dice, "available_moves", None)
+        if isinstance(moves, list) and steps in moves:
+            return moves.index(steps)
+        return None
+
+    def _push_undo(self, token: MoveToken, steps: int, die_index: Optional[int]) -> None:
+        """Registra un movimiento nuevo: se puede deshacer y descarta lo rehacible."""
+        self._undo_stack.append((token, steps, die_index))
+        self._redo_stack.clear()
+        if self.journal is not None:
+            self.journal.record_move(token.color, token.from_pos, steps, token.to_pos, token.hit)
+
+    def can_undo(self) -> bool:
+        return bool(self._undo_stack) and self._turn_active and not self.game_over
+
+    def can_redo(self) -> bool:
+        return bool(self._redo_stack) and self._turn_active and not self.game_over
+
+    def undo_last_move(self) -> bool:
+        """
+    Deshace el último movimiento del turno en curso en O(1): revierte el
+    tablero con board.unmake_move (incluida la captura) y devuelve el dado a
+    dice.available_moves en su posición original. Devuelve False si no hay
+    nada que deshacer (turno sin movimientos, partida terminada o tablero
+    sin unmake_move).
+    """
+        if not self.can_undo() or not hasattr(self.board, "unmake_move"):
+            return False
+        token, steps, die_index = self._undo_stack.pop()
+        self.board.unmake_move(token)
+        moves = self.dice.available_moves
+        moves.insert(len(moves) if die_index is None else die_index, steps)
+        used = getattr(self.dice, "used_moves", None)
+        if isinstance(used, list) and steps in used:
+            del used[len(used) - 1 - used[::-1].index(steps)]
+        self._redo_stack.append((token.from_pos, steps))
+        if self.journal is not None:
+            self.journal.record_undo(token.color, token.from_pos, steps, token.to_pos, token.hit)
+        return True
+
+    def redo(self) -> bool:
+        """Vuelve a aplicar el último movimiento deshecho. False si no hay ninguno."""
+        if not self.can_redo():
+            return False
+        pending = self._redo_stack
+        from_pos, steps = pending.pop()
+        self._redo_stack = []
         try:
-            if self._get_off_count(self.current_color) == 15:
-                self._finalize_game(winner_color=self.current_color)
-                return
-        except Exception:
-            pass
-
-
+            self.apply_player_move(from_pos, steps)
+        finally:
+            self._redo_stack = pending
+        return True
 
-
-    
     def end_turn(self) -> None:
         if not self._turn_active:
             raise GameRuleError("No hay turno activo para terminar.")
@@ -176,10 +306,42 @@ class BackgammonGame:
             )
 
         self._turn_active = False
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+        ended = self.current_color
         self.current_color = self._other_color(self.current_color)
+        if self.journal is not None:
+            self.journal.record_end_turn(ended, self)
+
 
 
 
+    def apply_play(self, play, validate: bool = True) -> None:
+        """
+    Aplica una jugada completa (secuencia de (from_pos, steps), p. ej. una de
+    legal_plays()) del jugador actual.
+      - validate=True: cada paso pasa por apply_player_move (todas las reglas).
+      - validate=False: la jugada se asume legal (viene de core.movegen) y se
+        aplica con board.make_move consumiendo los dados, sin revalidar cada
+        paso. Es el camino rápido de los simuladores.
+    """
+        if validate or not hasattr(self.board, "make_move"):
+            for from_pos, steps in play:
+                if self.game_over:
+                    break
+                self.apply_player_move(from_pos, steps)
+            return
+
+        if not self._turn_active:
+            raise GameRuleError("No hay turno activo. Llamá a start_turn() primero.")
+        color = self.current_color
+        for from_pos, steps in play:
+            die_index = self._die_index(steps)
+            token = self.board.make_move(color, from_pos, steps)
+            self.dice.use_move(steps)
+            self._push_undo(token, steps, die_index)
+        if play and self._get_off_count(color) == 15:
+            self._finalize_game(winner_color=color)
 
     def state(self) -> TurnState:
         _av = self._get_available_moves()
@@ -209,6 +371,10 @@ class BackgammonGame:
             outcome=outcome,   # "single" | "gammon" | "backgammon"
             points=points,
         )
+        if self.journal is not None:
+            self.journal.record_game_over(winner_color, outcome, points)
+            self.journal.flush()
+
     def _determine_outcome(self, winner_color: str, loser_color: str) -> tuple[str, int]:
         """
     Determina single/gammon/backgammon y devuelve (outcome, points).
@@ -216,30 +382,33 @@ class BackgammonGame:
       - single: perdedor ya borneó ≥1 ficha (off > 0) -> 1 punto
       - backgammon: perdedor con 0 off y (≥1 en BAR o ≥1 dentro del home del ganador) -> 3 puntos
       - gammon: perdedor con 0 off y sin fichas en BAR ni en el home del ganador -> 2 puntos
+    Ver core.board_state.determine_outcome.
     """
-        loser_counts = self.board.count_checkers(loser_color)
-        if loser_counts.get("off", 0) > 0:
-            return ("single", 1)
-
-        # 0 off: ver BAR o fichas en el home del ganador
-        has_bar = self.board.get_checkers_in_bar(loser_color) != []
-        home_start, home_end = self.board.get_home_board_range(winner_color)
-        has_in_winner_home = any(
-            any(ch.get_color() == loser_color for ch in self.board.get_point(p))
-            for p in range(home_start, home_end + 1)
-        )
+        return determine_outcome(as_board_state(self.board), winner_color, loser_color)
 
-        if has_bar or has_in_winner_home:
-             return ("backgammon", 3)
-        return ("gammon", 2)
-
-    
     def _legal_single_move_exists(self, color: str, steps: int) -> bool:
         """
     ¿Existe una única jugada legal con 'steps' para 'color', sin tocar el estado?
-    Respeta prioridad de BAR. Usa solo validadores del Board.
+    Respeta prioridad de BAR. Usa los predicados is_legal_* del Board (sin
+    excepciones); si el Board no los expone, cae a los validadores que lanzan.
     """
-    # Si hay fichas en BAR, solo vale reingreso
+        board = self.board
+        if not hasattr(board, "is_legal_move"):
+            return self._legal_single_move_exists_by_validators(color, steps)
+
+        # Si hay fichas en BAR, solo vale reingreso
+        if self._has_bar(color):
+            return board.is_legal_reentry(color, steps)
+
+        # Si no hay en BAR: buscar cualquier origen 1..24 (movimiento normal o bearing off)
+        for pos in range(1, 25):
+            if board._has_checker_of_color(pos, color):
+                if board.is_legal_move(color, pos, steps) or board.is_legal_bear_off(color, pos, steps):
+                    return True
+        return False
+
+    def _legal_single_move_exists_by_validators(self, color: str, steps: int) -> bool:
+        """Camino de compatibilidad para boards sin predicados is_legal_*."""
         if self._has_bar(color):
             try:
                 self.board.validate_reentry(color, steps)
@@ -247,17 +416,13 @@ class BackgammonGame:
             except Exception:
                 return False
 
-        # Si no hay en BAR: buscar cualquier origen 1..24 con ficha propia que valide
-        # (movimiento normal o bearing off)
         for pos in range(1, 25):
             if self.board._has_checker_of_color(pos, color):
-            # Movimiento normal
                 try:
                     self.board.validate_basic_move(color, pos, steps)
                     return True
                 except Exception:
                     pass
-                # Bearing off
                 try:
                     if hasattr(self.board, "can_bear_off_from") and self.board.can_bear_off_from(color, pos, steps):
                         return True
@@ -278,6 +443,70 @@ class BackgammonGame:
         return False
     
 
+    def legal_plays(self) -> list[Play]:
+        """
+    Todas las jugadas legales del jugador actual con los dados disponibles
+    (ver core.movegen.generate_plays). No muta el estado.
+    """
+        return generate_plays(self.board, self.current_color, self._get_available_moves())
+
+    def rank_plays(self, evaluator=None) -> list[tuple[Play, float]]:
+        """
+    Jugadas legales del jugador actual ordenadas de mejor a peor según
+    `evaluator` (HeuristicEvaluator por defecto), evaluando todas las
+    posiciones resultantes en una sola llamada. No muta el estado.
+    """
+        evaluator = evaluator or HeuristicEvaluator()
+        return rank_plays(self.board, self.current_color, self._get_available_moves(), evaluator)
+
+    def best_play(self, evaluator=None) -> Play:
+        """
+    La mejor jugada (argmax) del jugador actual según `evaluator`;
+    () si no hay movimiento posible. No muta el estado.
+    """
+        evaluator = evaluator or HeuristicEvaluator()
+        return best_play(self.board, self.current_color, self._get_available_moves(), evaluator)
+
+    def analyze(self, depth: int = 1, evaluator=None, **options) -> SearchResult:
+        """
+    Búsqueda expectiminimax de `depth` plies sobre las jugadas del jugador
+    actual (ver core.search). Trabaja sobre una copia empaquetada de la
+    posición: no muta el estado.
+    """
+        search = ExpectimaxSearch(evaluator, depth, **options)
+        return search.analyze(self.board, self.current_color, self._get_available_moves())
+
+    def position_key(self) -> int:
+        """
+    Clave Zobrist de 64 bits de (posición, turno): la del tablero combinada
+    con la del color que mueve. Si el tablero no mantiene la clave
+    incrementalmente (zobrist_key), se calcula desde cero.
+    """
+        getter = getattr(self.board, "zobrist_key", None)
+        key = getter() if callable(getter) else board_key(self.board)
+        return key ^ side_key(self.current_color)
+
+    def position_id(self) -> str:
+        """Position ID del tablero con el jugador actual en turno (ver core.position_id)."""
+        return position_id(self.board, self.current_color)
+
+    def match_id(self) -> str:
+        """
+    Match ID con el jugador en turno, los dados de la tirada en curso (si el
+    turno está activo) y el estado de la partida. Sin cubo ni match.
+    """
+        roll = getattr(self.dice, "last_roll", None) if self._turn_active else None
+        info = MatchInfo(
+            on_roll=self.current_color,
+            dice=tuple(roll) if roll else (0, 0),
+            game_state=GAME_OVER if self.game_over else GAME_PLAYING,
+        )
+        return match_id(info)
+
+    def game_id(self) -> str:
+        """"<position id>:<match id>", como lo muestra GNU Backgammon."""
+        return f"{self.position_id()}:{self.match_id()}"
+
     def _get_available_moves(self):
         """
     Devuelve la lista de movimientos disponibles del dado, siendo MUY tolerante
@@ -328,169 +557,22 @@ class BackgammonGame:
         """
     Si 'color' tiene 15 fichas en OFF, termina la partida delegando
     el armado del resultado a _finalize_game.
-    Estrategia robusta para obtener 'off':
-      1) board.count_off(color)
-      2) board.count_at(OFF, color)
-      3) board.count_checkers(color)['off']
-      4) Deducción: 15 - (en_tablero + en_BAR) usando get_point() / get_checkers_in_bar()
     """
-        OFF = getattr(self, "OFF", 25)
-        off = None
-
-        # 1) count_off(color)
-        if hasattr(self.board, "count_off"):
-            try:
-                off = self.board.count_off(color)
-            except Exception:
-                off = None
-
-        # 2) count_at(OFF, color)
-        if off is None and hasattr(self.board, "count_at"):
-            try:
-                off = self.board.count_at(OFF, color)
-            except Exception:
-                off = None
-    
-        # 3) count_checkers(color).get("off", 0)
-        if off is None and hasattr(self.board, "count_checkers"):
-            try:
-                off = self.board.count_checkers(color).get("off", 0)
-            except Exception:
-                off = None
-
-        # 4) Deducción: 15 - (en_tablero + en_BAR)
-        if off is None:
-            on_board = 0
-            # usar get_point(p) y filtrar por color
-            if hasattr(self.board, "get_point"):
-                try:
-                    for p in range(1, 25):
-                        stack = self.board.get_point(p) or []
-                        on_board += sum(1 for ch in stack if getattr(ch, "get_color", lambda: None)() == color)
-                except Exception:
-                    on_board = 0
-            # contar en BAR
-            in_bar = 0
-            if hasattr(self.board, "get_checkers_in_bar"):
-                try:
-                    in_bar = len(self.board.get_checkers_in_bar(color) or [])
-                except Exception:
-                    in_bar = 0
-            off = max(0, 15 - (on_board + in_bar))
-
-        if off == 15:
+        if self._get_off_count(color) == 15:
             self._finalize_game(winner_color=color)
 
-
     def _get_off_count(self, color: str) -> int:
         """
-    Cuenta fichas borneadas (OFF) con múltiples estrategias:
-      1) board.count_off(color)
-      2) board.count_at(OFF, color)
-      3) board.count_checkers(color)['off']
-      4) Deducción: 15 - (en_tablero + en_BAR)
-         - en_tablero con get_point() y chequeo de color por atributo .color o método .get_color()
-         - en_BAR con get_checkers_in_bar(color) o count_bar(color)
+    Fichas borneadas (OFF) de 'color'. O(1) con Board/CompactBoard; otros
+    tableros pasan por las estrategias de BoardStateAdapter.
     """
-        OFF = getattr(self, "OFF", 25)
-
-        # 1) count_off(color)
-        if hasattr(self.board, "count_off"):
-            try:
-                return int(self.board.count_off(color))
-            except Exception:
-                pass
-    
-        # 2) count_at(OFF, color)
-        if hasattr(self.board, "count_at"):
-            try:
-                return int(self.board.count_at(OFF, color))
-            except Exception:
-                pass
-
-        # 3) count_checkers(color)
-        if hasattr(self.board, "count_checkers"):
-            try:
-                d = self.board.count_checkers(color) or {}
-                if isinstance(d, dict) and "off" in d:
-                    return int(d.get("off", 0))
-            except Exception:
-                pass
-
-    # 4) Deducción
-    # 4a) Fichas en tablero
-        on_board = 0
-        if hasattr(self.board, "get_point"):
-            try:
-                for p in range(1, 25):
-                    stack = self.board.get_point(p) or []
-                    for ch in stack:
-                        # soportar .color (atributo) o .get_color() (método)
-                        ch_color = getattr(ch, "color", None)
-                        if ch_color is None and hasattr(ch, "get_color"):
-                            try:
-                                ch_color = ch.get_color()
-                            except Exception:
-                                ch_color = None
-                        if ch_color == color:
-                            on_board += 1
-            except Exception:
-                on_board = 0
-
-        # 4b) Fichas en BAR
-        in_bar = 0
-        if hasattr(self.board, "get_checkers_in_bar"):
-            try:
-                in_bar = len(self.board.get_checkers_in_bar(color) or [])
-            except Exception:
-                in_bar = 0
-        if in_bar == 0 and hasattr(self.board, "count_bar"):
-            try:
-                in_bar = int(self.board.count_bar(color))
-            except Exception:
-                pass
-
-        off = 15 - (on_board + in_bar)
-        return off if off >= 0 else 0
-
+        return as_board_state(self.board).count_off(color)
 
     def _remaining_on_board_or_bar(self, color: str) -> int:
         """
     Devuelve cuántas fichas de 'color' quedan en tablero (1..24) + BAR.
-    No depende de count_off / count_at; usa get_point y get_checkers_in_bar / count_bar.
     """
-        left = 0
-
-    # Contar en tablero 1..24
-        if hasattr(self.board, "get_point"):
-            try:
-                for p in range(1, 25):
-                    stack = self.board.get_point(p) or []
-                    for ch in stack:
-                        ch_color = getattr(ch, "color", None)
-                        if ch_color is None and hasattr(ch, "get_color"):
-                            try:
-                                ch_color = ch.get_color()
-                            except Exception:
-                                ch_color = None
-                        if ch_color == color:
-                            left += 1
-            except Exception:
-                pass
-
-        # Contar en BAR
-        if hasattr(self.board, "get_checkers_in_bar"):
-            try:
-                left += len(self.board.get_checkers_in_bar(color) or [])
-            except Exception:
-                pass
-        elif hasattr(self.board, "count_bar"):
-            try:
-                left += int(self.board.count_bar(color))
-            except Exception:
-                pass
-
-        return left
+        return as_board_state(self.board).count_remaining(color)
 
 
 
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Clasificación de movimientos sin excepciones.
+
+`classify_move(board, color, from_pos, steps)` responde qué tipo de
+movimiento sería (normal, captura, reingreso, bearing off) o por qué es
+ilegal, sin lanzar excepciones ni mutar el tablero. Funciona con cualquier
+tablero que exponga los predicados is_legal_* (Board, CompactBoard).
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import NamedTuple, Optional
+
+from core.constants import BAR, OFF
+
+__all__ = ["MoveKind", "MoveCheck", "MoveToken", "classify_move"]
+
+
+class MoveKind(Enum):
+    NORMAL = "normal"
+    HIT = "hit"
+    REENTER = "reenter"
+    BEAR_OFF = "bear_off"
+    ILLEGAL = "illegal"
+
+
+@dataclass(frozen=True)
+class MoveCheck:
+    """
+    Resultado de classify_move.
+
+    Attributes:
+        kind: tipo de movimiento (MoveKind.ILLEGAL si no es legal)
+        to_pos: destino (OFF para bearing off) o None si es ilegal
+        hit: True si el movimiento captura un blot rival (normal o reingreso)
+        reason: motivo legible cuando kind es ILLEGAL
+    """
+    kind: MoveKind
+    to_pos: Optional[int] = None
+    hit: bool = False
+    reason: Optional[str] = None
+
+    @property
+    def is_legal(self) -> bool:
+        return self.kind is not MoveKind.ILLEGAL
+
+    def __bool__(self) -> bool:
+        return self.is_legal
+
+
+class MoveToken(NamedTuple):
+    """
+    Token de deshacer devuelto por Board.make_move / CompactBoard.make_move.
+    Alcanza con (color, origen, destino, hubo captura) para revertir exacto:
+    si hubo captura, el blot rival vuelve del BAR a `to_pos`.
+    """
+    color: str
+    from_pos: int
+    to_pos: int
+    hit: bool
+
+
+def _illegal(reason: str) -> MoveCheck:
+    return MoveCheck(MoveKind.ILLEGAL, reason=reason)
+
+
+def classify_move(board, color: str, from_pos: int, steps: int) -> MoveCheck:
+    """
+    Clasifica el movimiento de UNA ficha de `color` desde `from_pos` con `steps`.
+    Respeta la prioridad del BAR (from_pos == BAR para reingresar).
+    Nunca lanza excepciones por entradas inválidas: devuelve ILLEGAL con motivo.
+    """
+    if color not in ("white", "black"):
+        return _illegal(f"Color inválido: {color}")
+    if not isinstance(steps, int) or not (1 <= steps <= 6):
+        return _illegal("Los pasos deben ser un entero entre 1 y 6.")
+    if not isinstance(from_pos, int) or not (0 <= from_pos <= 24):
+        return _illegal("El origen debe ser BAR (0) o estar en 1..24.")
+
+    # Reingreso desde el BAR
+    if from_pos == BAR:
+        if not board.has_checkers_in_bar(color):
+            return _illegal("No hay fichas para reingresar desde el BAR")
+        to_pos = 25 - steps if color == "white" else steps
+        if not board.is_legal_reentry(color, steps):
+            return _illegal(f"Entrada bloqueada en posición {to_pos}")
+        return MoveCheck(MoveKind.REENTER, to_pos, hit=board.can_capture(to_pos, color))
+
+    if board.has_checkers_in_bar(color):
+        return _illegal("Debés reingresar desde el BAR antes de mover otras fichas.")
+    if not board._has_checker_of_color(from_pos, color):
+        return _illegal("No hay ficha propia en el punto de origen.")
+
+    to_pos = from_pos - steps if color == "white" else from_pos + steps
+    if 1 <= to_pos <= 24:
+        if not board.is_legal_move(color, from_pos, steps):
+            return _illegal("El destino está bloqueado por el oponente.")
+        if board.can_capture(to_pos, color):
+            return MoveCheck(MoveKind.HIT, to_pos, hit=True)
+        return MoveCheck(MoveKind.NORMAL, to_pos)
+
+    # El destino cae fuera del tablero: sólo puede ser bearing off
+    if board.is_legal_bear_off(color, from_pos, steps):
+        return MoveCheck(MoveKind.BEAR_OFF, OFF)
+    if not board.all_checkers_in_home_board(color):
+        return _illegal("No se puede sacar fichas: no todas están en el home board.")
+    return _illegal("No se puede sacar con ese dado: hay fichas más lejos en el home.")
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+Generador de jugadas legales para una tirada completa.
+
+Dado un tablero (o una posición empaquetada), un color y los dados
+disponibles, devuelve el conjunto deduplicado de jugadas legales. Cada jugada
+es una secuencia de pasos (from_pos, steps) aplicable con
+BackgammonGame.apply_player_move en ese orden.
+
+Reglas aplicadas:
+  - Prioridad del BAR (si hay fichas en BAR sólo se reingresa).
+  - Todos los órdenes de los dados (y los 4 movimientos en dobles).
+  - Regla de máximo de dados: sólo valen las jugadas que usan la mayor
+    cantidad posible de dados.
+  - Regla del dado más alto: si de dos dados distintos sólo se puede jugar
+    uno, debe ser el más alto (cuando sea posible).
+  - Bearing off exacto u overshoot (sin fichas más lejos en el home).
+
+Sin contacto (carrera) la búsqueda usa _race_step, que no mira las fichas
+rivales: ningún destino puede estar bloqueado ni tener un blot.
+
+Internamente se trabaja en un "marco relativo" al color que mueve, sin
+excepciones como control de flujo:
+  - own[1..24]: fichas propias, numeradas de modo que siempre se mueve hacia 0
+  - own[25]: BAR propio (se reingresa en 25 - dado)
+  - own[0]: fichas propias borneadas (OFF)
+  - opp[1..24]: fichas rivales en los mismos puntos; opp[0] BAR rival, opp[25] OFF rival
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from core.constants import BAR, OFF
+from core.exceptions import InvalidMoveException
+
+# (from_pos, steps) en coordenadas del tablero (BAR = 0)
+Step = Tuple[int, int]
+Play = Tuple[Step, ...]
+# (conteos blancos, conteos negros), 26 posiciones cada uno: 0=BAR, 1..24, 25=OFF
+Position = Tuple[Tuple[int, ...], Tuple[int, ...]]
+
+__all__ = [
+    "Step", "Play", "Position",
+    "position_of", "generate_plays", "generate_play_positions", "apply_play",
+]
+
+
+# ---------------------------------------------------------------------------
+# Conversión tablero <-> posición
+# ---------------------------------------------------------------------------
+
+def position_of(board) -> Position:
+    """
+    Extrae la posición empaquetada de un tablero. Usa board.counts(color) si
+    existe (Board/CompactBoard) y si no, count_at(pos, color) punto por punto.
+    """
+    counts = getattr(board, "counts", None)
+    if callable(counts):
+        return (tuple(counts("white")), tuple(counts("black")))
+    return (
+        tuple(board.count_at(p, "white") for p in range(26)),
+        tuple(board.count_at(p, "black") for p in range(26)),
+    )
+
+
+def _as_position(board_or_position) -> Position:
+    if isinstance(board_or_position, tuple):
+        return board_or_position
+    return position_of(board_or_position)
+
+
+def _to_relative(position: Position, color: str) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    white, black = position
+    if color == "white":
+        own = (white[OFF],) + tuple(white[1:25]) + (white[BAR],)
+        opp = (black[BAR],) + tuple(black[1:25]) + (black[OFF],)
+    elif color == "black":
+        own = (black[OFF],) + tuple(black[24:0:-1]) + (black[BAR],)
+        opp = (white[BAR],) + tuple(white[24:0:-1]) + (white[OFF],)
+    else:
+        raise InvalidMoveException(f"Color inválido: {color}")
+    return own, opp
+
+
+def _from_relative(own: Sequence[int], opp: Sequence[int], color: str) -> Position:
+    if color == "white":
+        white = (own[25],) + tuple(own[1:25]) + (own[0],)
+        black = (opp[0],) + tuple(opp[1:25]) + (opp[25],)
+    else:
+        black = (own[25],) + tuple(own[24:0:-1]) + (own[0],)
+        white = (opp[0],) + tuple(opp[24:0:-1]) + (opp[25],)
+    return (white, black)
+
+
+def _board_pos(rel: int, color: str) -> int:
+    """Índice relativo -> posición del tablero (25 relativo = BAR)."""
+    if rel == 25:
+        return BAR
+    return rel if color == "white" else 25 - rel
+
+
+def _rel_pos(from_pos: int, color: str) -> int:
+    """Posición del tablero -> índice relativo."""
+    if from_pos == BAR:
+        return 25
+    return from_pos if color == "white" else 25 - from_pos
+
+
+# ---------------------------------------------------------------------------
+# Núcleo en marco relativo
+# ---------------------------------------------------------------------------
+
+def _step(own: Tuple[int, ...], opp: Tuple[int, ...], f: int, d: int):
+    """
+    Aplica un paso desde el índice relativo f con el dado d.
+    Devuelve (own, opp) nuevos o None si el paso es ilegal.
+    """
+    if not own[f] or (own[25] and f != 25):
+        return None
+    t = f - d
+    if t >= 1:
+        n = opp[t]
+        if n >= 2:
+            return None
+        o = list(own)
+        o[f] -= 1
+        o[t] += 1
+        if n == 1:
+            p = list(opp)
+            p[t] = 0
+            p[0] += 1
+            return tuple(o), tuple(p)
+        return tuple(o), opp
+    # Bearing off: todas en home (1..6), exacto u overshoot sin fichas más lejos
+    if f > 6 or any(own[7:26]):
+        return None
+    if t < 0 and any(own[f + 1:7]):
+        return None
+    o = list(own)
+    o[f] -= 1
+    o[0] += 1
+    return tuple(o), opp
+
+
+def _race_step(own: Tuple[int, ...], f: int, d: int) -> Optional[Tuple[int, ...]]:
+    """_step sin contacto: no hay bloqueos ni golpes, sólo cambia `own`."""
+    if not own[f]:
+        return None
+    t = f - d
+    if t < 1:
+        if f > 6 or any(own[7:26]):
+            return None
+        if t < 0 and any(own[f + 1:7]):
+            return None
+        t = 0
+    o = list(own)
+    o[f] -= 1
+    o[t] += 1
+    return tuple(o)
+
+
+def _is_race(own: Tuple[int, ...], opp: Tuple[int, ...]) -> bool:
+    """La ficha propia más atrasada ya pasó a la rival más adelantada (ver features.has_contact)."""
+    back = next((i for i in range(25, 0, -1) if own[i]), 0)
+    front = next((i for i in range(25) if opp[i]), 25)
+    return back < front
+
+
+def _origins(own: Tuple[int, ...]) -> Sequence[int]:
+    if own[25]:
+        return (25,)
+    return [i for i in range(24, 0, -1) if own[i]]
+
+
+def _search(own, opp, dice: Tuple[int, ...], prefix: Tuple[Tuple[int, int], ...],
+            leaves: List, seen: set) -> None:
+    key = (own, opp, dice)
+    if key in seen:
+        return
+    seen.add(key)
+
+    moved = False
+    tried = set()
+    for i, d in enumerate(dice):
+        if d in tried:
+            continue
+        tried.add(d)
+        rest = dice[:i] + dice[i + 1:]
+        for f in _origins(own):
+            nxt = _step(own, opp, f, d)
+            if nxt is None:
+                continue
+            moved = True
+            _search(nxt[0], nxt[1], rest, prefix + ((f, d),), leaves, seen)
+    if not moved:
+        leaves.append((prefix, own, opp))
+
+
+def _race_search(own, opp, dice: Tuple[int, ...], prefix: Tuple[Tuple[int, int], ...],
+                 leaves: List, seen: set) -> None:
+    """_search para carreras: `opp` no cambia y no entra en la clave."""
+    key = (own, dice)
+    if key in seen:
+        return
+    seen.add(key)
+
+    moved = False
+    tried = set()
+    for i, d in enumerate(dice):
+        if d in tried:
+            continue
+        tried.add(d)
+        rest = dice[:i] + dice[i + 1:]
+        for f in _origins(own):
+            nxt = _race_step(own, f, d)
+            if nxt is None:
+                continue
+            moved = True
+            _race_search(nxt, opp, rest, prefix + ((f, d),), leaves, seen)
+    if not moved:
+        leaves.append((prefix, own, opp))
+
+
+def _legal_relative(own, opp, dice: Sequence[int]):
+    """Lista deduplicada de (jugada_relativa, own_final, opp_final)."""
+    dice = tuple(sorted(dice, reverse=True))
+    leaves: List = []
+    search = _race_search if _is_race(own, opp) else _search
+    search(own, opp, dice, tuple(), leaves, set())
+
+    max_len = max(len(prefix) for prefix, _, _ in leaves)
+    best = [leaf for leaf in leaves if len(leaf[0]) == max_len]
+
+    # Regla del dado más alto: dos dados distintos y sólo se puede jugar uno
+    if max_len == 1 and len(dice) == 2 and dice[0] != dice[1]:
+        high = [leaf for leaf in best if leaf[0][0][1] == dice[0]]
+        if high:
+            best = high
+
+    unique: Dict[Tuple, Tuple] = {}
+    for prefix, o, p in best:
+        unique.setdefault((o, p), (prefix, o, p))
+    return list(unique.values())
+
+
+# ---------------------------------------------------------------------------
+# API pública
+# ---------------------------------------------------------------------------
+
+def generate_play_positions(board_or_position: Union[object, Position], color: str,
+                            dice: Sequence[int]) -> List[Tuple[Play, Position]]:
+    """
+    Como generate_plays, pero devuelve también la posición resultante
+    de cada jugada: [(play, position), ...].
+    """
+    own, opp = _to_relative(_as_position(board_or_position), color)
+    result = []
+    for prefix, o, p in _legal_relative(own, opp, list(dice)):
+        play = tuple((_board_pos(f, color), d) for f, d in prefix)
+        result.append((play, _from_relative(o, p, color)))
+    return result
+
+
+def generate_plays(board_or_position: Union[object, Position], color: str,
+                   dice: Sequence[int]) -> List[Play]:
+    """
+    Devuelve todas las jugadas legales (deduplicadas por posición resultante)
+    para `color` con los valores de `dice` (por ejemplo [3, 5] o [4, 4, 4, 4]).
+
+    Si no hay ningún movimiento posible devuelve [()] (una única jugada vacía).
+    """
+    return [play for play, _ in generate_play_positions(board_or_position, color, dice)]
+
+
+def apply_play(position: Position, color: str, play: Sequence[Step]) -> Position:
+    """
+    Aplica una jugada a una posición empaquetada y devuelve la nueva posición.
+
+    Raises:
+        InvalidMoveException: si algún paso es ilegal
+    """
+    own, opp = _to_relative(position, color)
+    for from_pos, steps in play:
+        if not isinstance(steps, int) or not (1 <= steps <= 6):
+            raise InvalidMoveException(f"Valor de dado inválido: {steps}")
+        nxt = _step(own, opp, _rel_pos(from_pos, color), steps)
+        if nxt is None:
+            raise InvalidMoveException(f"Paso ilegal: desde {from_pos} con {steps}", from_pos)
+        own, opp = nxt
+    return _from_relative(own, opp, color)
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+Libro de aperturas: mejores jugadas precalculadas para los dos primeros plies.
+
+Todas las partidas empiezan en la misma posición, así que las primeras
+jugadas se repetirían en cada partida simulada y son las búsquedas más
+caras (es donde hay más candidatas). El libro guarda, para la posición
+inicial y cada una de las 21 tiradas, la jugada elegida por la búsqueda
+(core.search) y su equity; y para la posición que deja cada una de esas
+jugadas, la respuesta a las 21 tiradas del rival.
+
+La clave es el Position ID binario desde el punto de vista del que tira
+(core.position_id.encode_position), que es el mismo para white y black: el
+libro sirve para cualquiera de los dos colores. Las jugadas se guardan en el
+marco relativo del que mueve (punto 1..24 contando hacia su casa, 25 = BAR).
+
+Formato del archivo (little-endian):
+    cabecera: b"BGOB", versión (u8), plies de la búsqueda (u8), cantidad (u16)
+    registros: position key (10 bytes), índice de tirada en core.rolls.ROLLS (u8),
+               pasos (u8), 4 x (desde relativo u8, dado u8), equity * 32767 (i16)
+
+El libro por defecto (DEFAULT_BOOK_PATH) se carga recién en la primera
+consulta (default_book). Generación offline:
+    python -m core.opening_book core/data/opening_book.bin --depth 2
+"""
+
+import os
+import struct
+from typing import Dict, NamedTuple, Optional, Sequence, Tuple
+
+from core.compact_board import CompactBoard
+from core.movegen import Play, _board_pos, _rel_pos, apply_play, position_of
+from core.position_id import encode_position
+from core.rolls import ROLLS, roll_index
+
+__all__ = [
+    "DEFAULT_BOOK_PATH", "BookEntry", "OpeningBook", "default_book", "book_play",
+]
+
+DEFAULT_BOOK_PATH = os.path.join(os.path.dirname(__file__), "data", "opening_book.bin")
+
+_MAGIC = b"BGOB"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBBH")
+_RECORD = struct.Struct("<10sBB8Bh")
+_SCALE = 32767
+
+_Key = Tuple[bytes, int]                 # (position key, índice de tirada)
+
+
+class BookEntry(NamedTuple):
+    """Jugada del libro (en coordenadas del tablero para el color consultado) y su equity."""
+    play: Play
+    equity: float
+
+
+def _is_full_roll(dice: Sequence[int]) -> bool:
+    return len(dice) == 2 or (len(dice) == 4 and len(set(dice)) == 1)
+
+
+class OpeningBook:
+    """Libro en memoria: {(position key, tirada): (jugada relativa, equity)}."""
+
+    def __init__(self, entries: Optional[Dict[_Key, Tuple[Play, float]]] = None, depth: int = 0):
+        self._entries: Dict[_Key, Tuple[Play, float]] = dict(entries or {})
+        self.depth = depth
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ---------------- Consultas ----------------
+
+    def lookup(self, board_or_position, color: str, dice: Sequence[int]) -> Optional[BookEntry]:
+        """Jugada del libro para `color` con `dice`, o None si la posición no está."""
+        if not _is_full_roll(dice):
+            return None
+        position = board_or_position if isinstance(board_or_position, tuple) else position_of(board_or_position)
+        found = self._entries.get((encode_position(position, color), roll_index(dice)))
+        if found is None:
+            return None
+        play, equity = found
+        return BookEntry(tuple((_board_pos(f, color), d) for f, d in play), equity)
+
+    # ---------------- Generación ----------------
+
+    def add(self, position, color: str, dice: Sequence[int], play: Play, equity: float) -> None:
+        """Agrega la jugada `play` (coordenadas del tablero) de `color` con `dice`."""
+        relative = tuple((_rel_pos(f, color), d) for f, d in play)
+        self._entries[(encode_position(position, color), roll_index(dice))] = (relative, equity)
+
+    @classmethod
+    def build(cls, depth: int = 2, search=None, progress=None) -> "OpeningBook":
+        """
+        Genera el libro buscando a `depth` plies (ExpectimaxSearch por defecto).
+        Son 21 + 21 x 21 búsquedas: a 2-ply, unos minutos.
+        """
+        if search is None:
+            from core.search import ExpectimaxSearch
+            search = ExpectimaxSearch(depth=depth)
+        book = cls(depth=depth)
+        start = position_of(CompactBoard())
+        for roll in ROLLS:
+            opening = search.analyze(start, "white", roll.dice)
+            book.add(start, "white", roll.dice, opening.play, opening.equity)
+            after = apply_play(start, "white", opening.play)
+            for reply_roll in ROLLS:
+                reply = search.analyze(after, "black", reply_roll.dice)
+                book.add(after, "black", reply_roll.dice, reply.play, reply.equity)
+            if progress is not None:
+                progress(len(book))
+        return book
+
+    # ---------------- Archivo ----------------
+
+    def serialize(self) -> bytes:
+        out = bytearray(_HEADER.pack(_MAGIC, _VERSION, self.depth, len(self._entries)))
+        for (key, index), (play, equity) in sorted(self._entries.items()):
+            steps = [v for step in play for v in step] + [0] * (8 - 2 * len(play))
+            out += _RECORD.pack(key, index, len(play), *steps, round(equity * _SCALE))
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "OpeningBook":
+        if len(data) < _HEADER.size:
+            raise ValueError("Libro de aperturas inválido.")
+        magic, version, depth, count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION or len(data) != _HEADER.size + count * _RECORD.size:
+            raise ValueError("Libro de aperturas inválido o de otra versión.")
+        entries = {}
+        for key, index, n, *rest in _RECORD.iter_unpack(data[_HEADER.size:]):
+            steps, equity = rest[:8], rest[8]
+            if index >= len(ROLLS) or n > 4:
+                raise ValueError("Libro de aperturas corrupto.")
+            play = tuple((steps[2 * i], steps[2 * i + 1]) for i in range(n))
+            entries[(key, index)] = (play, equity / _SCALE)
+        return cls(entries, depth)
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "wb") as fh:
+            fh.write(self.serialize())
+
+    @classmethod
+    def open(cls, path: str) -> "OpeningBook":
+        with open(path, "rb") as fh:
+            return cls.from_bytes(fh.read())
+
+
+_DEFAULT: Dict[str, Optional[OpeningBook]] = {}
+
+
+def default_book() -> Optional[OpeningBook]:
+    """El libro de DEFAULT_BOOK_PATH, cargado una sola vez (None si no existe)."""
+    if "book" not in _DEFAULT:
+        _DEFAULT["book"] = OpeningBook.open(DEFAULT_BOOK_PATH) if os.path.exists(DEFAULT_BOOK_PATH) else None
+    return _DEFAULT["book"]
+
+
+def book_play(board_or_position, color: str, dice: Sequence[int],
+              book: Optional[OpeningBook] = None) -> Optional[BookEntry]:
+    """Consulta `book` (el libro por defecto si no se pasa uno)."""
+    book = default_book() if book is None else book
+    return None if book is None else book.lookup(board_or_position, color, dice)
+
+
+if __name__ == "__main__":  # pragma: no cover - generador offline
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Genera el libro de aperturas.")
+    parser.add_argument("path", nargs="?", default=DEFAULT_BOOK_PATH, help="archivo de salida")
+    parser.add_argument("--depth", type=int, default=2, help="plies de la búsqueda")
+    args = parser.parse_args()
+    start = time.perf_counter()
+    book = OpeningBook.build(args.depth, progress=lambda n: print(f"  {n} posiciones", flush=True))
+    book.save(args.path)
+    print(f"Libro de aperturas ({len(book)} entradas, {args.depth}-ply) generado en "
+          f"{time.perf_counter() - start:.1f}s")
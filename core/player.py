@@ -11,6 +11,7 @@ class Player:
     """
     
     TOTAL_CHECKERS = 15
+    __slots__ = ("_name", "_color", "_checkers", "_score", "_games_won")
     
     def __init__(self, name: str, color: str):
         """
@@ -42,7 +43,7 @@ class Player:
         """
         Crea las 15 fichas del jugador.
         """
-        self._checkers = [Checker(self._color) for _ in range(self.TOTAL_CHECKERS)]
+        self._checkers = [Checker.unchecked(self._color) for _ in range(self.TOTAL_CHECKERS)]
     
     @property
     def name(self) -> str:
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+Identificadores compactos de posición y de partida (formato de GNU Backgammon).
+
+Position ID: 80 bits (10 bytes). Para cada jugador, primero el que NO está
+en turno y luego el que tira, se recorren sus puntos 1..24 desde su propia
+perspectiva y después su BAR; por cada punto se escriben tantos 1 como
+fichas haya y un 0. Las fichas borneadas quedan implícitas (15 - resto).
+Los bits se empaquetan little-endian y el texto es base64 sin relleno
+(14 caracteres); la posición inicial es "4HPwATDgc/ABMA".
+
+Match ID: 66 bits (9 bytes, 12 caracteres base64) con cubo, jugador en
+turno, estado, dados, largo del match y puntajes. En este juego no hay cubo
+ni match: se codifican cubo 1 centrado y partida por dinero salvo que se
+indique otra cosa. El jugador 0 es white y el 1 es black.
+"""
+
+import base64
+from typing import NamedTuple, Optional, Tuple
+
+from core.constants import BAR, OFF
+from core.movegen import Position
+
+__all__ = [
+    "POSITION_ID_BYTES", "MATCH_ID_BYTES", "GAME_NONE", "GAME_PLAYING", "GAME_OVER", "MatchInfo",
+    "encode_position", "decode_position", "position_id", "position_from_id",
+    "encode_match", "decode_match", "match_id", "match_from_id",
+]
+
+POSITION_ID_BYTES = 10
+MATCH_ID_BYTES = 9
+_PLAYERS = ("white", "black")
+
+# Estados de partida del match ID
+GAME_NONE, GAME_PLAYING, GAME_OVER = 0, 1, 2
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii").rstrip("=")
+
+
+def _b64decode(text: str, size: int) -> bytes:
+    try:
+        data = base64.b64decode(text + "=" * (-len(text) % 4), validate=True)
+    except (ValueError, TypeError) as exc:
+        raise ValueError(f"ID inválido: {text!r}") from exc
+    if len(data) != size:
+        raise ValueError(f"ID inválido: se esperaban {size} bytes y hay {len(data)}.")
+    return data
+
+
+def _check_color(color: str) -> None:
+    if color not in _PLAYERS:
+        raise ValueError(f"Color inválido: {color}")
+
+
+def _side_counts(position: Position, color: str):
+    """Conteos de `color` en sus puntos 1..24 (propia perspectiva) y su BAR al final."""
+    counts = position[0] if color == "white" else position[1]
+    if color == "white":
+        points = [counts[p] for p in range(1, 25)]
+    else:
+        points = [counts[25 - p] for p in range(1, 25)]
+    return points + [counts[BAR]]
+
+
+# ---------------- Position ID ----------------
+
+def encode_position(position: Position, on_roll: str) -> bytes:
+    """Position ID binario (10 bytes) de `position` con `on_roll` en turno."""
+    _check_color(on_roll)
+    other = "black" if on_roll == "white" else "white"
+    bits = 0
+    n = 0
+    for color in (other, on_roll):
+        for count in _side_counts(position, color):
+            bits |= ((1 << count) - 1) << n      # `count` unos seguidos de un cero
+            n += count + 1
+    if n > 8 * POSITION_ID_BYTES:
+        raise ValueError("La posición tiene más de 15 fichas por jugador.")
+    return bits.to_bytes(POSITION_ID_BYTES, "little")
+
+
+def decode_position(key: bytes, on_roll: str) -> Position:
+    """Inversa de encode_position."""
+    _check_color(on_roll)
+    if len(key) != POSITION_ID_BYTES:
+        raise ValueError(f"Se esperaban {POSITION_ID_BYTES} bytes.")
+    bits = int.from_bytes(key, "little")
+    other = "black" if on_roll == "white" else "white"
+    sides = {}
+    for color in (other, on_roll):
+        side = []
+        while len(side) < 25:
+            count = 0
+            while bits & 1:
+                count += 1
+                bits >>= 1
+            bits >>= 1
+            side.append(count)
+        if sum(side) > 15:
+            raise ValueError("Position ID inválido: más de 15 fichas por jugador.")
+        sides[color] = side
+    if bits:
+        raise ValueError("Position ID inválido: sobran bits.")
+
+    white, black = [0] * 26, [0] * 26
+    for p in range(1, 25):
+        white[p] = sides["white"][p - 1]
+        black[25 - p] = sides["black"][p - 1]
+    white[BAR], black[BAR] = sides["white"][24], sides["black"][24]
+    white[OFF] = 15 - sum(white)
+    black[OFF] = 15 - sum(black)
+    return (tuple(white), tuple(black))
+
+
+def position_id(board_or_position, on_roll: str) -> str:
+    """Position ID en texto (14 caracteres base64)."""
+    from core.eval.features import as_position
+    return _b64encode(encode_position(as_position(board_or_position), on_roll))
+
+
+def position_from_id(pid: str, on_roll: str) -> Position:
+    """Posición empaquetada a partir del texto de position_id."""
+    return decode_position(_b64decode(pid, POSITION_ID_BYTES), on_roll)
+
+
+# ---------------- Match ID ----------------
+
+class MatchInfo(NamedTuple):
+    """Campos del match ID (jugadores como colores, dados (0, 0) si no hay tirada)."""
+    on_roll: str
+    dice: Tuple[int, int] = (0, 0)
+    turn: Optional[str] = None
+    game_state: int = GAME_PLAYING
+    cube: int = 1
+    cube_owner: Optional[str] = None
+    crawford: bool = False
+    double_offered: bool = False
+    resigned: int = 0
+    match_length: int = 0
+    score: Tuple[int, int] = (0, 0)
+
+
+# (campo, ancho en bits) en el orden de GNU Backgammon
+_MATCH_FIELDS = (
+    ("cube_log", 4), ("cube_owner", 2), ("on_roll", 1), ("crawford", 1),
+    ("game_state", 3), ("turn", 1), ("double_offered", 1), ("resigned", 2),
+    ("die0", 3), ("die1", 3), ("match_length", 15), ("score0", 15), ("score1", 15),
+)
+
+
+def encode_match(info: MatchInfo) -> bytes:
+    """Match ID binario (9 bytes)."""
+    _check_color(info.on_roll)
+    cube_log = info.cube.bit_length() - 1
+    if info.cube < 1 or 1 << cube_log != info.cube:
+        raise ValueError(f"Valor de cubo inválido: {info.cube}")
+    values = {
+        "cube_log": cube_log,
+        "cube_owner": 3 if info.cube_owner is None else _PLAYERS.index(info.cube_owner),
+        "on_roll": _PLAYERS.index(info.on_roll),
+        "crawford": int(info.crawford),
+        "game_state": info.game_state,
+        "turn": _PLAYERS.index(info.turn or info.on_roll),
+        "double_offered": int(info.double_offered),
+        "resigned": info.resigned,
+        "die0": info.dice[0],
+        "die1": info.dice[1],
+        "match_length": info.match_length,
+        "score0": info.score[0],
+        "score1": info.score[1],
+    }
+    bits = 0
+    n = 0
+    for name, width in _MATCH_FIELDS:
+        value = values[name]
+        if not 0 <= value < 1 << width:
+            raise ValueError(f"Valor fuera de rango para {name}: {value}")
+        bits |= value << n
+        n += width
+    return bits.to_bytes(MATCH_ID_BYTES, "little")
+
+
+def decode_match(key: bytes) -> MatchInfo:
+    """Inversa de encode_match."""
+    if len(key) != MATCH_ID_BYTES:
+        raise ValueError(f"Se esperaban {MATCH_ID_BYTES} bytes.")
+    bits = int.from_bytes(key, "little")
+    values = {}
+    for name, width in _MATCH_FIELDS:
+        values[name] = bits & ((1 << width) - 1)
+        bits >>= width
+    if values["cube_owner"] == 2 or values["die0"] > 6 or values["die1"] > 6:
+        raise ValueError("Match ID inválido.")
+    return MatchInfo(
+        on_roll=_PLAYERS[values["on_roll"]],
+        dice=(values["die0"], values["die1"]),
+        turn=_PLAYERS[values["turn"]],
+        game_state=values["game_state"],
+        cube=1 << values["cube_log"],
+        cube_owner=None if values["cube_owner"] == 3 else _PLAYERS[values["cube_owner"]],
+        crawford=bool(values["crawford"]),
+        double_offered=bool(values["double_offered"]),
+        resigned=values["resigned"],
+        match_length=values["match_length"],
+        score=(values["score0"], values["score1"]),
+    )
+
+
+def match_id(info: MatchInfo) -> str:
+    """Match ID en texto (12 caracteres base64)."""
+    return _b64encode(encode_match(info))
+
+
+def match_from_id(mid: str) -> MatchInfo:
+    """MatchInfo a partir del texto de match_id."""
+    return decode_match(_b64decode(mid, MATCH_ID_BYTES))
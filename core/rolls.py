@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Tabla de tiradas y jugadas legales por tirada.
+
+ROLLS son las 21 tiradas distintas con su peso (15 no dobles a 1/18 y 6
+dobles a 1/36); `dice` es la forma que espera core.movegen ([a, b] o
+[a, a, a, a]). Los bucles de expectativa (core.search, rollouts, conteo de
+tiros) recorren exactamente esta tabla.
+
+PlayTable memoiza, por posición y color, las jugadas legales de cada una de
+las 21 tiradas ([(jugada, posición resultante)], como
+movegen.generate_play_positions). La clave es la posición empaquetada misma
+(sin colisiones posibles); las posiciones menos usadas se descartan (LRU)
+al pasar de `maxsize`. Cada tirada se genera recién cuando se pide, así que
+quien corta antes (poda de la búsqueda) no paga las demás.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from core.constants import BAR
+from core.eval.features import as_position
+from core.movegen import Play, Position, _legal_relative, _board_pos, _from_relative, _to_relative
+
+__all__ = [
+    "Roll", "ROLLS", "roll_index", "PlayTable", "DEFAULT_PLAY_TABLE",
+    "legal_play_positions", "plays_for_all_rolls", "count_shots",
+]
+
+PlayList = List[Tuple[Play, Position]]
+
+
+class Roll(NamedTuple):
+    """Tirada distinta: dados para movegen y probabilidad."""
+    dice: Tuple[int, ...]
+    weight: float
+
+    @property
+    def values(self) -> Tuple[int, int]:
+        return self.dice[0], self.dice[1]
+
+    @property
+    def is_double(self) -> bool:
+        return len(self.dice) == 4
+
+    @property
+    def count(self) -> int:
+        """Combinaciones de las 36 que dan esta tirada (1 o 2)."""
+        return 1 if self.is_double else 2
+
+
+ROLLS: Tuple[Roll, ...] = tuple(
+    Roll((a,) * 4 if a == b else (a, b), (1 if a == b else 2) / 36)
+    for a in range(1, 7) for b in range(a, 7)
+)
+_INDEX: Dict[Tuple[int, int], int] = {roll.values: i for i, roll in enumerate(ROLLS)}
+
+
+def roll_index(dice: Sequence[int]) -> int:
+    """Índice en ROLLS de una tirada ([a, b] en cualquier orden o [a, a, a, a])."""
+    try:
+        return _INDEX[(min(dice[0], dice[1]), max(dice[0], dice[1]))]
+    except (KeyError, IndexError, TypeError):
+        raise ValueError(f"Tirada inválida: {dice}") from None
+
+
+def _generate(position: Position, color: str, dice: Sequence[int]) -> PlayList:
+    own, opp = _to_relative(position, color)
+    return [
+        (tuple((_board_pos(f, color), d) for f, d in prefix), _from_relative(o, p, color))
+        for prefix, o, p in _legal_relative(own, opp, list(dice))
+    ]
+
+
+class PlayTable:
+    """
+    Caché LRU de jugadas legales por (posición, color) para las 21 tiradas.
+    Las listas devueltas son compartidas: no modificarlas.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        if maxsize < 1:
+            raise ValueError("maxsize debe ser al menos 1.")
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[Position, str], List[Optional[PlayList]]]" = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def _entry(self, position: Position, color: str) -> List[Optional[PlayList]]:
+        key = (position, color)
+        entries = self._entries
+        entry = entries.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = entries[key] = [None] * len(ROLLS)
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+                self.evictions += 1
+        else:
+            self.hits += 1
+            entries.move_to_end(key)
+        return entry
+
+    def plays_for_roll(self, board_or_position, color: str, index: int) -> PlayList:
+        """Jugadas de `color` con la tirada ROLLS[index]."""
+        position = as_position(board_or_position)
+        entry = self._entry(position, color)
+        plays = entry[index]
+        if plays is None:
+            plays = entry[index] = _generate(position, color, ROLLS[index].dice)
+        return plays
+
+    def plays_for_dice(self, board_or_position, color: str, dice: Sequence[int]) -> PlayList:
+        """
+        Jugadas de `color` con `dice`. Sólo las tiradas completas están en la
+        tabla; dados parciales (a mitad de turno) se generan sin memoizar.
+        """
+        if len(dice) == 2 or (len(dice) == 4 and len(set(dice)) == 1):
+            return self.plays_for_roll(board_or_position, color, roll_index(dice))
+        return _generate(as_position(board_or_position), color, dice)
+
+    def plays_for_all_rolls(self, board_or_position, color: str) -> List[PlayList]:
+        """Las jugadas de las 21 tiradas, en el orden de ROLLS."""
+        position = as_position(board_or_position)
+        entry = self._entry(position, color)
+        for i, plays in enumerate(entry):
+            if plays is None:
+                entry[i] = _generate(position, color, ROLLS[i].dice)
+        return list(entry)
+
+
+DEFAULT_PLAY_TABLE = PlayTable()
+
+
+def legal_play_positions(board_or_position, color: str, dice: Sequence[int],
+                         table: Optional[PlayTable] = None) -> PlayList:
+    """generate_play_positions memoizado en `table` (DEFAULT_PLAY_TABLE por defecto)."""
+    return (DEFAULT_PLAY_TABLE if table is None else table).plays_for_dice(board_or_position, color, dice)
+
+
+def plays_for_all_rolls(board_or_position, color: str, table: Optional[PlayTable] = None) -> List[PlayList]:
+    """Jugadas legales de `color` para las 21 tiradas de ROLLS (memoizadas)."""
+    return (DEFAULT_PLAY_TABLE if table is None else table).plays_for_all_rolls(board_or_position, color)
+
+
+def count_shots(board_or_position, color: str, table: Optional[PlayTable] = None) -> int:
+    """
+    Cuántas de las 36 tiradas le permiten a `color` golpear al menos una
+    ficha rival (alguna jugada legal manda fichas al BAR rival).
+    """
+    position = as_position(board_or_position)
+    side = 1 if color == "white" else 0          # conteos del rival
+    opp_bar = position[side][BAR]
+    shots = 0
+    for roll, plays in zip(ROLLS, plays_for_all_rolls(position, color, table)):
+        if any(pos[side][BAR] > opp_bar for _, pos in plays):
+            shots += roll.count
+    return shots
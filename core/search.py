@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+"""
+Búsqueda expectiminimax de N plies sobre nodos de azar.
+
+Cada jugada candidata se valora promediando las 21 tiradas distintas del
+rival (dobles con probabilidad 1/36, el resto 2/36) y la mejor respuesta
+del rival a cada una, hasta `depth` plies:
+  0-ply  evaluación estática de la posición tras la jugada
+  1-ply  promedio sobre las tiradas del rival de su mejor respuesta (0-ply)
+  2-ply  lo mismo, con cada respuesta valorada a 1-ply
+Todo trabaja sobre posiciones empaquetadas (core.movegen), así que nunca
+toca el tablero ni la partida en curso.
+
+Costo:
+  - Filtro de candidatas (como en GNU Backgammon): las jugadas de la raíz se
+    ordenan a 0-ply y sólo las `candidates[0]` mejores pasan a 1-ply, las
+    `candidates[1]` mejores de ésas a 2-ply, etc.
+  - Dentro del árbol, las respuestas se ordenan por evaluación estática (en
+    lote) y sólo se buscan las `reply_width` primeras.
+  - Poda Star1: en cada nodo de azar, con las equities acotadas a [-1, 1],
+    se corta en cuanto el promedio parcial más las cotas de las tiradas que
+    faltan queda fuera de la ventana (alpha, beta).
+  - Star2: con 2 o más plies por delante, antes de Star1 se sondea la
+    primera respuesta de cada tirada; su valor es una cota inferior del
+    nodo max y ajusta las cotas de Star1 (y muchas veces corta sin buscar
+    el resto). A 1-ply no se sondea: el nodo max ya es exacto con una
+    evaluación en lote.
+Con poda, la equity de la jugada elegida es exacta; las de las descartadas
+por poda son cotas superiores (prune=False da todas exactas).
+
+Con una tabla de transposición (core.transposition) se guardan los nodos de
+azar (con su tipo de cota), la mejor respuesta a 0-ply de cada nodo max (la
+pasada de 2-ply reutiliza las que calculó la de 1-ply sin regenerar
+jugadas) y la mejor jugada de cada raíz (con claves propias, ver
+_root_key), que pasa primera al filtro de candidatas en la próxima búsqueda.
+
+Con un libro de aperturas (core.opening_book) las posiciones que están en el
+libro se responden sin buscar.
+
+Con `time_limit` (segundos por decisión) la búsqueda es por profundización
+iterativa con corte: si una pasada no termina a tiempo se descarta y se
+devuelve la última pasada completa (SearchResult.depth dice cuál fue). Los
+nodos terminados antes del corte quedan en la tabla.
+"""
+
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from core.constants import OFF, opponent
+from core.eval.features import as_position
+from core.movegen import Play, Position, apply_play
+from core.rolls import DEFAULT_PLAY_TABLE, ROLLS
+from core.transposition import EXACT, LOWER, UPPER, dice_key, make_key
+
+__all__ = ["ROLLS", "SearchResult", "ExpectimaxSearch", "search"]
+
+_INF = math.inf
+
+# Sal de las claves de raíz por cantidad de dados que quedan (1..4): las
+# entradas de raíz (equity a `depth` plies) no comparten espacio de claves con
+# las mejores respuestas a 0-ply de _best_reply, y una raíz a mitad de turno
+# no se confunde con la tirada completa.
+_rng = random.Random(0x5EA2C0)
+_ROOT_SALT = tuple(_rng.getrandbits(64) for _ in range(5))
+
+
+def _root_key(position: Position, color: str, dice: Sequence[int]) -> int:
+    """Clave de la raíz: posición, color, dados y cuántos quedan."""
+    return make_key(position, color) ^ dice_key((dice[0], dice[-1])) ^ _ROOT_SALT[len(dice)]
+
+
+class _Timeout(Exception):
+    """Se terminó el tiempo de la decisión (uso interno de analyze)."""
+
+
+def _won(position: Position, color: str) -> bool:
+    return (position[0] if color == "white" else position[1])[OFF] == 15
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """
+    Resultado de una búsqueda para `color`.
+
+    play: jugada elegida (() si no hay movimiento posible)
+    equity: su equity a `depth` plies, en [-1, 1]
+    ranked: [(jugada, equity)] de las candidatas de la última pasada, de
+        mejor a peor (ver la nota sobre poda del módulo)
+    nodes: evaluaciones estáticas realizadas
+    """
+    play: Play
+    equity: float
+    depth: int
+    ranked: List[Tuple[Play, float]]
+    nodes: int
+    elapsed: float
+
+
+class ExpectimaxSearch:
+    """
+    Búsqueda de `depth` plies con el evaluador `evaluator` (por defecto
+    RaceEvaluator: HeuristicEvaluator con contacto, pip count efectivo sin
+    él). `candidates[i]` es cuántas jugadas de la raíz pasan a la pasada de
+    i+1 plies (la última vale para las pasadas siguientes).
+    `table` es una TranspositionTable opcional (se puede compartir entre
+    búsquedas: cada analyze la envejece con new_search). Las jugadas
+    legales salen de `plays` (core.rolls.PlayTable, la compartida por defecto).
+    `book` es un OpeningBook opcional que se consulta antes de buscar.
+    `time_limit` (segundos, opcional) acota cada analyze: ver la nota del módulo.
+    """
+
+    def __init__(self, evaluator=None, depth: int = 1, candidates: Sequence[int] = (8, 2),
+                 reply_width: int = 1, prune: bool = True, table=None,
+                 plays=None, book=None, time_limit: Optional[float] = None):
+        if depth < 0:
+            raise ValueError("depth no puede ser negativo.")
+        if not candidates or min(candidates) < 1 or reply_width < 1:
+            raise ValueError("candidates y reply_width deben ser al menos 1.")
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError("time_limit debe ser positivo.")
+        if evaluator is None:
+            from core.eval import RaceEvaluator
+            evaluator = RaceEvaluator()
+        self.evaluator = evaluator
+        self.depth = depth
+        self.candidates = tuple(candidates)
+        self.reply_width = reply_width
+        self.prune = prune
+        self.table = table
+        self.plays = DEFAULT_PLAY_TABLE if plays is None else plays
+        self.book = book
+        self.time_limit = time_limit
+        self.nodes = 0
+        self._deadline = None
+
+    # ---------------- API ----------------
+
+    def analyze(self, board_or_position, color: str, dice: Sequence[int]) -> SearchResult:
+        """Busca la mejor jugada de `color` con `dice` (no muta el tablero)."""
+        start = time.perf_counter()
+        self.nodes = 0
+        position = as_position(board_or_position)
+        if self.book is not None:
+            entry = self.book.lookup(position, color, dice)
+            if entry is not None:
+                return SearchResult(entry.play, entry.equity, self.book.depth,
+                                    [(entry.play, entry.equity)], 0, time.perf_counter() - start)
+        ranked = self._replies(position, color, tuple(dice))
+        table = self.table
+        key = None
+        if table is not None and len(ranked) > 1:
+            table.new_search()
+            key = _root_key(position, color, dice)
+            entry = table.get(key)
+            if entry is not None and entry.play is not None:
+                # la mejor jugada de una búsqueda anterior pasa primera
+                ranked.sort(key=lambda item: item[0] != entry.play)
+        depth = self.depth
+        if len(ranked) > 1:
+            self._deadline = None if self.time_limit is None else start + self.time_limit
+            try:
+                for ply in range(1, self.depth + 1):
+                    keep = self.candidates[min(ply, len(self.candidates)) - 1]
+                    # sólo la última pasada poda: las anteriores filtran candidatas
+                    # y necesitan valores exactos, no cotas
+                    ranked = self._root_pass(ranked[:keep], color, ply, self.prune and ply == self.depth)
+            except _Timeout:
+                depth = ply - 1           # queda la última pasada completa
+            finally:
+                self._deadline = None
+        play, _, equity = ranked[0]
+        if key is not None:
+            table.store(key, depth, equity, EXACT, play)
+        return SearchResult(
+            play=play,
+            equity=equity,
+            depth=depth,
+            ranked=[(p, v) for p, _, v in ranked],
+            nodes=self.nodes,
+            elapsed=time.perf_counter() - start,
+        )
+
+    def best_play(self, board_or_position, color: str, dice: Sequence[int]) -> Play:
+        return self.analyze(board_or_position, color, dice).play
+
+    def evaluate(self, board_or_position, color: str, depth: Optional[int] = None) -> float:
+        """
+        Equity para `color` de una posición en la que acaba de mover `color`
+        (le toca tirar al rival), a `depth` plies (por defecto self.depth).
+        """
+        return self._chance(as_position(board_or_position), color,
+                            self.depth if depth is None else depth, -_INF, _INF)
+
+    # ---------------- Nodos ----------------
+
+    def _replies(self, position: Position, color: str, dice: Tuple[int, ...]):
+        """[(jugada, posición, equity estática)] de `color`, de mejor a peor."""
+        results = self.plays.plays_for_dice(position, color, dice)
+        positions = [pos for _, pos in results]
+        scores = self.evaluator.evaluate_batch(positions, color)
+        self.nodes += len(positions)
+        scored = [
+            (play, pos, 1.0 if _won(pos, color) else float(score))
+            for (play, pos), score in zip(results, scores)
+        ]
+        scored.sort(key=lambda item: -item[2])     # estable: a igual equity, orden del generador
+        return scored
+
+    def _best_reply(self, position: Position, color: str, dice: Tuple[int, ...]):
+        """Mejor respuesta a 0-ply (jugada, posición, equity); la tabla evita regenerarlas."""
+        table = self.table
+        if table is None:
+            return self._replies(position, color, dice)[0]
+        key = make_key(position, color, dice)
+        value = table.probe(key, 0, -_INF, _INF)
+        if value is not None:
+            play = table.get(key).play
+            return (play, apply_play(position, color, play), value)
+        best = self._replies(position, color, dice)[0]
+        table.store(key, 0, best[2], EXACT, best[0])
+        return best
+
+    def _root_pass(self, candidates, color: str, depth: int, prune: bool):
+        """
+        Valora las candidatas a `depth` plies. Con `prune` alpha sube con la
+        mejor vista y las demás quedan como cotas superiores (sólo la primera
+        posición del orden resultante es exacta).
+        """
+        alpha = -_INF
+        valued = []
+        for play, pos, _ in candidates:
+            value = self._chance(pos, color, depth, alpha if prune else -_INF, _INF)
+            valued.append((play, pos, value))
+            alpha = max(alpha, value)
+        valued.sort(key=lambda item: -item[2])
+        return valued
+
+    def _chance(self, position: Position, color: str, depth: int, alpha: float, beta: float) -> float:
+        """
+        Equity para `color`, que acaba de mover, promediando las tiradas del
+        rival. Fuera de (alpha, beta) devuelve una cota (fail-soft).
+        """
+        if _won(position, color):
+            return 1.0
+        if depth == 0:
+            self.nodes += 1
+            return float(self.evaluator.evaluate(position, color))
+        if alpha >= 1.0:          # nada supera a una victoria ya asegurada
+            return 1.0
+        if beta <= -1.0:
+            return -1.0
+        table = self.table
+        if table is None:
+            return self._average(position, color, depth, alpha, beta)
+
+        key = make_key(position, opponent(color))      # le toca tirar al rival
+        value = table.probe(key, depth, alpha, beta)
+        if value is None:
+            value = self._average(position, color, depth, alpha, beta)
+            flag = UPPER if value <= alpha else LOWER if value >= beta else EXACT
+            table.store(key, depth, value, flag)
+        return value
+
+    def _average(self, position: Position, color: str, depth: int, alpha: float, beta: float) -> float:
+        """Promedio sobre las 21 tiradas del rival (Star2 + Star1)."""
+        opp = opponent(color)
+        n = len(ROLLS)
+        replies: List[Optional[list]] = [None] * n
+        probes: List[Optional[float]] = [None] * n
+        # cotas del aporte de cada tirada (= -valor del nodo max del rival)
+        upper = [1.0] * n
+        lower = [-1.0] * n
+
+        if self.prune and depth >= 2:
+            # Star2: la primera respuesta de cada tirada acota su nodo max por abajo
+            for r, (dice, _) in enumerate(ROLLS):
+                if self._deadline is not None and time.perf_counter() > self._deadline:
+                    raise _Timeout()
+                if self.reply_width == 1:
+                    replies[r] = [self._best_reply(position, opp, dice)]
+                else:
+                    replies[r] = self._replies(position, opp, dice)
+                probes[r] = self._chance(replies[r][0][1], opp, depth - 1, -_INF, _INF)
+                upper[r] = -probes[r]
+                if len(replies[r]) == 1 or self.reply_width == 1:
+                    lower[r] = upper[r]
+            bound = sum(p * u for (_, p), u in zip(ROLLS, upper))
+            if bound <= alpha:
+                return bound
+
+        # sumas de las cotas de las tiradas que faltan (sufijos)
+        rest_upper = sum(p * u for (_, p), u in zip(ROLLS, upper))
+        rest_lower = sum(p * lo for (_, p), lo in zip(ROLLS, lower))
+        total = 0.0
+        deadline = self._deadline
+        for r, (dice, p) in enumerate(ROLLS):
+            if deadline is not None and time.perf_counter() > deadline:
+                raise _Timeout()
+            rest_upper -= p * upper[r]
+            rest_lower -= p * lower[r]
+            if self.prune:
+                # ventana del rival para que esta tirada todavía importe
+                child_alpha = (total + rest_lower - beta) / p
+                child_beta = (total + rest_upper - alpha) / p
+            else:
+                child_alpha, child_beta = -_INF, _INF
+            best = self._max_node(position, opp, dice, depth - 1, child_alpha, child_beta,
+                                  replies[r], probes[r])
+            total -= p * best
+            if self.prune:
+                if best <= child_alpha:
+                    return total + rest_lower      # ya no baja de beta
+                if best >= child_beta:
+                    return total + rest_upper      # ya no sube de alpha
+        return total
+
+    def _max_node(self, position: Position, color: str, dice: Tuple[int, ...], depth: int,
+                  alpha: float, beta: float, replies=None, probe: Optional[float] = None) -> float:
+        """Mejor equity de `color` con `dice` (cada respuesta valorada a `depth` plies)."""
+        if depth == 0 and replies is None:
+            return self._best_reply(position, color, dice)[2]
+        if replies is None:
+            replies = self._replies(position, color, dice)
+        if depth == 0:
+            return replies[0][2]
+        best, first = -_INF, 0
+        if probe is not None:
+            best, first = probe, 1
+            if best >= beta:
+                return best
+            alpha = max(alpha, best)
+        for _, pos, _ in replies[first:self.reply_width]:
+            value = self._chance(pos, color, depth, alpha, beta)
+            if value > best:
+                best = value
+                if best >= beta:
+                    break
+                alpha = max(alpha, best)
+        return best
+
+
+def search(board_or_position, color: str, dice: Sequence[int], depth: int = 1,
+           evaluator=None, **options) -> SearchResult:
+    """Atajo: ExpectimaxSearch(evaluator, depth, **options).analyze(...)."""
+    return ExpectimaxSearch(evaluator, depth, **options).analyze(board_or_position, color, dice)
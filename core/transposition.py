@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+Tabla de transposición de tamaño fijo para la búsqueda (core.search).
+
+Clave: la clave Zobrist de la posición (core.zobrist.position_key) combinada
+con el color que tira (side_key) y, si los hay, los dados (dice_key). Cada
+entrada guarda la equity, la profundidad a la que se calculó, el tipo de
+cota (EXACT, LOWER o UPPER, porque la búsqueda poda con ventanas) y la
+mejor jugada si se conoce.
+
+La tabla reserva sus casillas de entrada según `max_bytes` (estimando
+ENTRY_BYTES por entrada) y las agrupa en buckets de `ways` casillas.
+Reemplazo dentro del bucket:
+  - la misma clave se pisa si la nueva entrada es igual o más profunda, o
+    si la vieja es de una búsqueda anterior;
+  - si no, se usa una casilla libre, o la de una búsqueda anterior (aging,
+    ver new_search), o la menos profunda;
+  - una entrada nueva menos profunda que todas las actuales del bucket se
+    descarta (depth-preferred).
+Los contadores (probes, hits, stores, evictions, rejected) permiten
+dimensionarla por worker.
+"""
+
+import random
+from typing import Dict, NamedTuple, Optional, Sequence
+
+from core.zobrist import position_key, side_key
+
+__all__ = [
+    "EXACT", "LOWER", "UPPER", "ENTRY_BYTES", "TTEntry", "TranspositionTable",
+    "dice_key", "make_key",
+]
+
+# Tipos de valor guardado
+EXACT, LOWER, UPPER = 0, 1, 2
+
+ENTRY_BYTES = 160       # estimación por entrada (tupla + clave + float + casilla de la lista)
+_MASK64 = (1 << 64) - 1
+
+_rng = random.Random(0xD1CE_7AB1)
+_DICE = {(a, b): _rng.getrandbits(64) for a in range(1, 7) for b in range(a, 7)}
+
+
+class TTEntry(NamedTuple):
+    key: int
+    depth: int
+    generation: int
+    value: float
+    flag: int
+    play: Optional[tuple]
+
+
+def dice_key(dice: Sequence[int]) -> int:
+    """Componente de los dados ([a, b] o [a, a, a, a]; el orden no importa)."""
+    a, b = min(dice[0], dice[1]), max(dice[0], dice[1])
+    return _DICE[(a, b)]
+
+
+def make_key(position, color: str, dice: Optional[Sequence[int]] = None) -> int:
+    """Clave de (posición empaquetada, color que tira, dados opcionales)."""
+    key = position_key(position) ^ side_key(color)
+    if dice:
+        key ^= dice_key(dice)
+    return key & _MASK64
+
+
+class TranspositionTable:
+    """
+    Tabla de `max_bytes` (aprox.) en buckets de `ways` entradas.
+    new_search() envejece las entradas actuales sin borrarlas.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024, ways: int = 4):
+        if ways < 1:
+            raise ValueError("ways debe ser al menos 1.")
+        buckets = max_bytes // (ENTRY_BYTES * ways)
+        if buckets < 1:
+            raise ValueError(f"max_bytes demasiado chico: hacen falta {ENTRY_BYTES * ways} como mínimo.")
+        self.ways = ways
+        self.buckets = buckets
+        self.capacity = buckets * ways
+        self._slots = [None] * self.capacity
+        self.generation = 0
+        self.used = 0
+        self.reset_stats()
+
+    # ---------------- Mantenimiento ----------------
+
+    def reset_stats(self) -> None:
+        self.probes = self.hits = self.stores = self.evictions = self.rejected = 0
+
+    def clear(self) -> None:
+        self._slots = [None] * self.capacity
+        self.used = 0
+        self.generation = 0
+
+    def new_search(self) -> None:
+        """Marca las entradas actuales como de una búsqueda anterior (reemplazables)."""
+        self.generation += 1
+
+    def __len__(self) -> int:
+        return self.used
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.probes if self.probes else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "capacity": self.capacity, "used": self.used, "probes": self.probes,
+            "hits": self.hits, "hit_rate": self.hit_rate, "stores": self.stores,
+            "evictions": self.evictions, "rejected": self.rejected,
+        }
+
+    # ---------------- Acceso ----------------
+
+    def get(self, key: int) -> Optional[TTEntry]:
+        """Entrada de `key` a cualquier profundidad (no cuenta en las estadísticas)."""
+        base = (key % self.buckets) * self.ways
+        for i in range(base, base + self.ways):
+            entry = self._slots[i]
+            if entry is not None and entry.key == key:
+                return entry
+        return None
+
+    def probe(self, key: int, depth: int, alpha: float, beta: float) -> Optional[float]:
+        """
+        Valor guardado para `key` si sirve a `depth` plies con la ventana
+        (alpha, beta): exacto, o una cota que ya cae fuera de la ventana.
+        """
+        self.probes += 1
+        entry = self.get(key)
+        if entry is None or entry.depth < depth:
+            return None
+        value = entry.value
+        if entry.flag == EXACT or (entry.flag == LOWER and value >= beta) \
+                or (entry.flag == UPPER and value <= alpha):
+            self.hits += 1
+            return value
+        return None
+
+    def store(self, key: int, depth: int, value: float, flag: int = EXACT,
+              play: Optional[tuple] = None) -> bool:
+        """Guarda una entrada según la política de reemplazo; False si se descartó."""
+        base = (key % self.buckets) * self.ways
+        slots = self._slots
+        generation = self.generation
+        victim = None
+        for i in range(base, base + self.ways):
+            entry = slots[i]
+            if entry is None:
+                if victim is None or slots[victim] is not None:
+                    victim = i
+                continue
+            if entry.key == key:
+                if depth < entry.depth and entry.generation == generation:
+                    self.rejected += 1
+                    return False
+                slots[i] = TTEntry(key, depth, generation, value, flag, play or entry.play)
+                self.stores += 1
+                return True
+            if victim is None or (slots[victim] is not None and self._worse(entry, slots[victim])):
+                victim = i
+
+        old = slots[victim]
+        if old is not None:
+            if old.generation == generation and old.depth > depth:
+                self.rejected += 1
+                return False
+            self.evictions += 1
+        else:
+            self.used += 1
+        slots[victim] = TTEntry(key, depth, generation, value, flag, play)
+        self.stores += 1
+        return True
+
+    def _worse(self, a: TTEntry, b: TTEntry) -> bool:
+        """True si `a` es mejor víctima que `b`: más vieja o, a igual edad, menos profunda."""
+        a_stale, b_stale = a.generation != self.generation, b.generation != self.generation
+        if a_stale != b_stale:
+            return a_stale
+        return a.depth < b.depth
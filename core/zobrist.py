@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Claves Zobrist de 64 bits para posiciones de Backgammon.
+
+Cada combinación (color, posición 0..25, cantidad de fichas) tiene una clave
+aleatoria fija; la clave de una posición es el XOR de las claves de todos sus
+puntos. Como cambiar la cantidad de un punto de n a m sólo requiere
+`key ^= point_key(c, p, n) ^ point_key(c, p, m)`, los tableros pueden mantener
+la clave de forma incremental en O(1) por movimiento.
+
+La cantidad 0 tiene clave 0, así que un tablero vacío vale 0 y los puntos
+vacíos no aportan nada. El turno (side to move) se agrega con side_key(color).
+"""
+
+import random
+from typing import Dict, Tuple
+
+__all__ = ["MAX_COUNT", "point_key", "side_key", "position_key", "board_key"]
+
+MASK64 = (1 << 64) - 1
+MAX_COUNT = 15          # 15 fichas por color: cantidades 0..15 tienen clave propia
+_SEED = 0x5EED_BAC6     # semilla fija: las claves son estables entre procesos y versiones
+
+
+def _build_table() -> Dict[str, Tuple[Tuple[int, ...], ...]]:
+    rng = random.Random(_SEED)
+    table = {}
+    for color in ("white", "black"):
+        table[color] = tuple(
+            (0,) + tuple(rng.getrandbits(64) for _ in range(MAX_COUNT))
+            for _ in range(26)
+        )
+    return table
+
+
+_TABLE = _build_table()
+_SIDE = {"white": 0, "black": random.Random(_SEED ^ 0xB1AC).getrandbits(64)}
+
+
+def _mix(value: int) -> int:
+    """splitmix64: sólo para cantidades fuera de rango (posiciones inválidas de test)."""
+    value = (value + 0x9E3779B97F4A7C15) & MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK64
+    return value ^ (value >> 31)
+
+
+def point_key(color: str, position: int, count: int) -> int:
+    """Clave de tener `count` fichas de `color` en `position`."""
+    if 0 <= count <= MAX_COUNT:
+        return _TABLE[color][position][count]
+    return _mix((0 if color == "white" else 1) << 16 | position << 8 | (count & 0xFF))
+
+
+def side_key(color: str) -> int:
+    """Componente del turno: 0 para white, clave fija para black."""
+    return _SIDE[color]
+
+
+def position_key(position) -> int:
+    """Clave completa de una posición empaquetada (conteos blancos, conteos negros)."""
+    key = 0
+    for color, counts in (("white", position[0]), ("black", position[1])):
+        rows = _TABLE[color]
+        for pos, n in enumerate(counts):
+            if n:
+                key ^= rows[pos][n] if n <= MAX_COUNT else point_key(color, pos, n)
+    return key
+
+
+def board_key(board) -> int:
+    """Clave completa (no incremental) de cualquier tablero con count_at(pos, color)."""
+    from core.movegen import position_of
+    return position_key(position_of(board))
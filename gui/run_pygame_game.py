@@ -14,10 +14,8 @@ Backgammon – Pygame UI completa
 
 from __future__ import annotations
 
-import json
 import time
 import random
-from dataclasses import asdict, is_dataclass
 from typing import Optional, Tuple, List
 
 import pygame
@@ -26,6 +24,7 @@ from core.board import Board
 from core.dice import Dice
 from core.player import Player
 from core.game import BackgammonGame
+from storage import save_game
 from core.exceptions import (
     BackgammonException,
     InvalidMoveException,
@@ -551,6 +550,13 @@ def _legal_steps_from(game: BackgammonGame, from_pos: int) -> List[int]:
     dice_vals = _get_available_moves(game)
     if not dice_vals:
         return []
+
+    # Camino rápido: el Board clasifica cada dado sin lanzar excepciones
+    classify = getattr(game.board, "classify_move", None)
+    if callable(classify):
+        ok = {steps: classify(color, from_pos, steps).is_legal for steps in set(dice_vals)}
+        return sorted(steps for steps in dice_vals if ok[steps])
+
     has_bar = False
     bar_fetcher = getattr(game.board, "get_checkers_in_bar", None)
     if callable(bar_fetcher):
@@ -617,25 +623,9 @@ def draw_legal_badges(surface, font_small, positions, selected_from: int, legal_
 
 
 # ------------- Utilidades de snapshot -------------
-def _to_serializable(obj):
-    if is_dataclass(obj):
-        return asdict(obj)
-    if isinstance(obj, (list, tuple)):
-        return [_to_serializable(item) for item in obj]
-    if isinstance(obj, dict):
-        return {key: _to_serializable(value) for key, value in obj.items()}
-    if hasattr(obj, "__dict__"):
-        return {key: _to_serializable(value) for key, value in vars(obj).items()}
-    return obj
-
-
 def save_snapshot(game: BackgammonGame, filename: str = "snapshot.json") -> str:
-    payload = {"state": _to_serializable(game.state())}
-    result = getattr(game, "result", None)
-    if result is not None:
-        payload["result"] = _to_serializable(result)
-    with open(filename, "w", encoding="utf-8") as fh:
-        json.dump(payload, fh, ensure_ascii=False, indent=2)
+    """Guarda la partida completa (ver storage.save_game)."""
+    save_game(game, filename)
     return f"Partida guardada en {filename}"
 
 
@@ -727,7 +717,7 @@ def main():
                 action = b.handle_event(ev)
                 if action:
                     if action == "new":
-                        game = init_game()
+                        game.reset(starting_color="white")
                         selected_from = None
                         dragging = False
                         drag_from = None
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Punto de entrada del simulador headless (sin interfaz).
+
+Ejemplos:
+    python run_selfplay.py --games 1000 --white greedy --black random --seed 7
+    python run_selfplay.py --games 100000 --workers 0     # todos los núcleos
+"""
+
+import argparse
+
+from sim.farm import run_farm
+from sim.policies import POLICY_NAMES
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Partidas de Backgammon bot contra bot, sin interfaz.")
+    parser.add_argument("--games", type=int, default=100, help="cantidad de partidas")
+    parser.add_argument("--white", choices=POLICY_NAMES, default="random", help="política de white")
+    parser.add_argument("--black", choices=POLICY_NAMES, default="random", help="política de black")
+    parser.add_argument("--seed", type=int, default=0, help="semilla (reproducible)")
+    parser.add_argument("--validate", action="store_true",
+                        help="aplicar cada paso con apply_player_move (más lento)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="procesos a usar (0 = todos los núcleos; resultados idénticos para la misma semilla)")
+    parser.add_argument("--batch-size", type=int, default=64, help="partidas por lote en modo multiproceso")
+    args = parser.parse_args(argv)
+
+    # también con un solo worker: las semillas por partida son las del farm,
+    # así la misma --seed da lo mismo con cualquier cantidad de procesos
+    farm = run_farm(args.games, args.white, args.black, master_seed=args.seed,
+                    workers=args.workers or None, batch_size=args.batch_size, validate=args.validate)
+    print(farm.stats.summary())
+    print(f"Digest: {farm.digest()}")
+    return farm.stats
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+"""Simulación headless: políticas de juego y partidas bot contra bot."""
+
+from sim.farm import FarmResult, game_seed, iter_farm, run_farm
+from sim.policies import GreedyPolicy, Policy, RandomPolicy, SearchPolicy, make_policy
+from sim.pool import GamePool
+from sim.rollout import RolloutResult, rollout
+from sim.simulator import GameRecord, SimStats, play_game, run_games
+
+__all__ = [
+    "Policy", "RandomPolicy", "GreedyPolicy", "SearchPolicy", "make_policy",
+    "GameRecord", "SimStats", "play_game", "run_games",
+    "FarmResult", "game_seed", "iter_farm", "run_farm",
+    "RolloutResult", "rollout", "GamePool",
+]
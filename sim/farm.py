@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Granja de self-play en varios procesos con semillas deterministas.
+
+Cada partida i usa la semilla game_seed(master_seed, i) (blake2b de
+"master:i"), tanto para los dados como para las políticas aleatorias, así que
+el resultado de cada partida no depende de cuántos procesos haya ni de cómo
+se repartan: con la misma master_seed el resultado es idéntico byte a byte
+(ver FarmResult.digest).
+
+El trabajo se divide en lotes de índices consecutivos; cada proceso devuelve
+sus partidas empaquetadas (RECORD_FORMAT, 8 bytes por partida) y los lotes
+se reciben en orden a medida que terminan (iter_farm).
+"""
+
+import hashlib
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sim.policies import make_policy
+from sim.pool import GamePool
+from sim.simulator import GameRecord, SimStats, play_game
+
+__all__ = ["RECORD_FORMAT", "game_seed", "pack_records", "unpack_records",
+           "FarmResult", "iter_farm", "run_farm"]
+
+# winner, outcome, points, starting_color, turns
+RECORD_FORMAT = struct.Struct("<BBBBI")
+_COLORS = (None, "white", "black")
+_OUTCOMES = (None, "single", "gammon", "backgammon")
+
+
+def game_seed(master_seed: int, index: int) -> int:
+    """Semilla de 64 bits de la partida `index`, derivada de `master_seed`."""
+    digest = hashlib.blake2b(f"{master_seed}:{index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def pack_records(records: List[GameRecord]) -> bytes:
+    return b"".join(
+        RECORD_FORMAT.pack(_COLORS.index(r.winner), _OUTCOMES.index(r.outcome), r.points,
+                           _COLORS.index(r.starting_color), r.turns)
+        for r in records
+    )
+
+
+def unpack_records(data: bytes) -> List[GameRecord]:
+    return [
+        GameRecord(_COLORS[w], _OUTCOMES[o], points, turns, _COLORS[s])
+        for w, o, points, s, turns in RECORD_FORMAT.iter_unpack(data)
+    ]
+
+
+# Políticas por proceso (se crean una vez por nombre y se resiembran por partida)
+_WORKER_POLICIES: Dict[str, object] = {}
+# Partidas reutilizables por proceso
+_WORKER_POOL = GamePool()
+
+
+def _policy(name: str):
+    if name not in _WORKER_POLICIES:
+        _WORKER_POLICIES[name] = make_policy(name)
+    return _WORKER_POLICIES[name]
+
+
+def _play_batch(task: Tuple[int, int, int, str, str, bool, int]) -> Tuple[int, bytes, Dict[str, float]]:
+    """Juega las partidas [start, end) y devuelve (start, registros empaquetados, tiempos)."""
+    master_seed, start, end, white_name, black_name, validate, max_turns = task
+    white, black = _policy(white_name), _policy(black_name)
+    timings: Dict[str, float] = {}
+    records = []
+    for index in range(start, end):
+        seed = game_seed(master_seed, index)
+        white.reseed(seed ^ 0x57)
+        black.reseed(seed ^ 0xB1)
+        records.append(play_game(white, black, seed=seed, validate=validate,
+                                 max_turns=max_turns, timings=timings, pool=_WORKER_POOL))
+    return start, pack_records(records), timings
+
+
+@dataclass
+class FarmResult:
+    """Partidas de la granja (en orden de índice) y sus estadísticas agregadas."""
+    master_seed: int
+    records: List[GameRecord] = field(default_factory=list)
+    stats: SimStats = field(default_factory=SimStats)
+
+    def digest(self) -> str:
+        """Hash de todos los resultados: igual para la misma master_seed."""
+        return hashlib.sha256(pack_records(self.records)).hexdigest()
+
+
+def _tasks(n_games: int, master_seed: int, white: str, black: str, validate: bool,
+           max_turns: int, batch_size: int):
+    for start in range(0, n_games, batch_size):
+        yield (master_seed, start, min(start + batch_size, n_games), white, black, validate, max_turns)
+
+
+def iter_farm(n_games: int, white: str = "random", black: str = "random", master_seed: int = 0,
+              workers: Optional[int] = None, batch_size: int = 64, validate: bool = False,
+              max_turns: int = 10000) -> Iterator[Tuple[int, List[GameRecord], Dict[str, float]]]:
+    """
+    Genera (índice inicial, registros, tiempos) por lote, en orden, a medida
+    que los procesos los terminan. `white`/`black` son nombres de política
+    (ver make_policy) para que los procesos puedan construirlas.
+    workers=None usa todos los núcleos; workers=1 juega en este proceso.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size debe ser al menos 1.")
+    workers = workers or os.cpu_count() or 1
+    tasks = _tasks(n_games, master_seed, white, black, validate, max_turns, batch_size)
+    if workers == 1:
+        results = map(_play_batch, tasks)
+        for start, data, timings in results:
+            yield start, unpack_records(data), timings
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for start, data, timings in pool.map(_play_batch, tasks):
+            yield start, unpack_records(data), timings
+
+
+def run_farm(n_games: int, white: str = "random", black: str = "random", master_seed: int = 0,
+             workers: Optional[int] = None, batch_size: int = 64, validate: bool = False,
+             max_turns: int = 10000) -> FarmResult:
+    """Juega `n_games` partidas repartidas entre `workers` procesos y junta los resultados."""
+    result = FarmResult(master_seed)
+    start_time = time.perf_counter()
+    for _, records, timings in iter_farm(n_games, white, black, master_seed, workers,
+                                         batch_size, validate, max_turns):
+        result.records.extend(records)
+        for record in records:
+            result.stats.add(record)
+        for phase, seconds in timings.items():
+            result.stats.timings[phase] += seconds
+    result.stats.elapsed = time.perf_counter() - start_time
+    return result
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Políticas de juego para el simulador: deciden la jugada completa de un turno.
+
+Una política recibe el BackgammonGame con el turno ya iniciado (dados tirados)
+y devuelve una de sus jugadas legales (ver BackgammonGame.legal_plays).
+Para rollouts también puede trabajar directo sobre posiciones empaquetadas:
+choose_position(position, color, dice) devuelve la posición resultante.
+"""
+
+import random
+from typing import Optional, Sequence
+
+from core.movegen import Play, Position, apply_play, generate_play_positions
+
+__all__ = ["Policy", "RandomPolicy", "GreedyPolicy", "SearchPolicy", "POLICY_NAMES", "make_policy"]
+
+
+class Policy:
+    """Interfaz de política: choose(game) -> jugada."""
+
+    name = "base"
+
+    def choose(self, game) -> Play:
+        raise NotImplementedError
+
+    def choose_position(self, position: Position, color: str, dice: Sequence[int]) -> Position:
+        """Posición tras la jugada elegida para `color` con `dice` (sin BackgammonGame)."""
+        raise NotImplementedError
+
+    def reseed(self, seed: int) -> None:
+        """Reinicia el azar interno (no-op en políticas deterministas)."""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class RandomPolicy(Policy):
+    """Elige una jugada legal al azar (uniforme), con su propio RNG."""
+
+    name = "random"
+
+    def __init__(self, seed: Optional[int] = None):
+        self._rng = random.Random(seed)
+
+    def reseed(self, seed: int) -> None:
+        self._rng.seed(seed)
+
+    def choose(self, game) -> Play:
+        return self._rng.choice(game.legal_plays())
+
+    def choose_position(self, position: Position, color: str, dice: Sequence[int]) -> Position:
+        return self._rng.choice(generate_play_positions(position, color, dice))[1]
+
+
+class GreedyPolicy(Policy):
+    """Elige la jugada de mayor equity según `evaluator` (1-ply, en lote)."""
+
+    name = "greedy"
+
+    def __init__(self, evaluator=None):
+        if evaluator is None:
+            from core.eval import HeuristicEvaluator
+            evaluator = HeuristicEvaluator()
+        self.evaluator = evaluator
+
+    def choose(self, game) -> Play:
+        return game.best_play(self.evaluator)
+
+    def choose_position(self, position: Position, color: str, dice: Sequence[int]) -> Position:
+        results = generate_play_positions(position, color, dice)
+        if len(results) == 1:
+            return results[0][1]
+        scores = self.evaluator.evaluate_batch([pos for _, pos in results], color)
+        best = max(range(len(results)), key=scores.__getitem__)
+        return results[best][1]
+
+    def __repr__(self) -> str:
+        return f"GreedyPolicy({self.evaluator!r})"
+
+
+class SearchPolicy(Policy):
+    """
+    Búsqueda expectiminimax de `depth` plies (core.search). Si `use_book`,
+    las aperturas salen del libro (core.opening_book) sin buscar.
+    """
+
+    name = "search"
+
+    def __init__(self, depth: int = 1, evaluator=None, use_book: bool = True, table=None):
+        from core.opening_book import default_book
+        from core.search import ExpectimaxSearch
+        self.search = ExpectimaxSearch(evaluator, depth, table=table,
+                                       book=default_book() if use_book else None)
+
+    def choose(self, game) -> Play:
+        return self.search.analyze(game.board, game.current_color, game.state().dice_values).play
+
+    def choose_position(self, position: Position, color: str, dice: Sequence[int]) -> Position:
+        return apply_play(position, color, self.search.analyze(position, color, dice).play)
+
+    def __repr__(self) -> str:
+        return f"SearchPolicy(depth={self.search.depth})"
+
+
+POLICY_NAMES = ("random", "greedy", "mlp", "search")
+
+
+def make_policy(name: str, seed: Optional[int] = None) -> Policy:
+    """Construye una política por nombre: random, greedy (heurística), mlp o search (1-ply + libro)."""
+    if name == "random":
+        return RandomPolicy(seed)
+    if name == "greedy":
+        return GreedyPolicy()
+    if name == "mlp":
+        from core.eval import MLPEvaluator
+        return GreedyPolicy(MLPEvaluator())
+    if name == "search":
+        return SearchPolicy()
+    raise ValueError(f"Política desconocida: {name}. Opciones: {', '.join(POLICY_NAMES)}")
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Pool de partidas reutilizables para la simulación.
+
+Crear BackgammonGame + tablero + dados + dos Player por partida domina el
+costo de arranque en partidas cortas (rollouts truncados, lotes de la
+granja). GamePool entrega partidas ya construidas y las devuelve a la
+posición inicial con BackgammonGame.reset en lugar de recrearlas.
+"""
+
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.player import Player
+
+__all__ = ["GamePool"]
+
+
+class GamePool:
+    """
+    Partidas libres listas para usar.
+
+    acquire() devuelve una partida en la posición inicial (nueva si el pool
+    está vacío); release() la devuelve para reutilizarla.
+    """
+
+    def __init__(self, board_factory: Callable[[], object] = CompactBoard, size: int = 0):
+        self.board_factory = board_factory
+        self._free: List[BackgammonGame] = [self._new_game() for _ in range(size)]
+        self.created = size
+
+    def _new_game(self) -> BackgammonGame:
+        return BackgammonGame(
+            self.board_factory(), Dice(), (Player("White", "white"), Player("Black", "black"))
+        )
+
+    def __len__(self) -> int:
+        """Partidas libres en el pool."""
+        return len(self._free)
+
+    def acquire(self, starting_color: Optional[str] = None, dice_seed: Optional[int] = None) -> BackgammonGame:
+        """Partida lista para empezar (ver BackgammonGame.reset)."""
+        if self._free:
+            game = self._free.pop()
+        else:
+            game = self._new_game()
+            self.created += 1
+        game.reset(starting_color, dice_seed)
+        return game
+
+    def release(self, game: BackgammonGame) -> None:
+        """Devuelve `game` al pool; se reinicia en el próximo acquire."""
+        self._free.append(game)
+
+    @contextmanager
+    def game(self, starting_color: Optional[str] = None, dice_seed: Optional[int] = None) -> Iterator[BackgammonGame]:
+        """with pool.game(...) as game: ... (la devuelve al salir)."""
+        game = self.acquire(starting_color, dice_seed)
+        try:
+            yield game
+        finally:
+            self.release(game)
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Rollouts Monte Carlo: equity de una posición jugando K partidas desde ella.
+
+Desde una posición (tablero o empaquetada) y el color que está por tirar, se
+juegan `trials` partidas con una política barata sobre posiciones
+empaquetadas (Policy.choose_position, sin BackgammonGame) y se promedia el
+resultado: +1/+2/+3 si gana `color` (single/gammon/backgammon, mismas reglas
+que BackgammonGame._determine_outcome) y -1/-2/-3 si pierde.
+
+Reducción de varianza:
+  - Estratificación: las dos primeras tiradas recorren las 1296 combinaciones
+    (36 x 36) en un orden barajado con la semilla, en lugar de sortearse.
+  - Antitéticas: las pruebas van de a pares; la segunda usa los dados
+    complementarios (7-a, 7-b) de la primera en todas las tiradas.
+Truncado: con `truncate` plies la partida se corta y vale evaluator.evaluate
+(equity en [-1, 1]) para `color`.
+
+Las pruebas son independientes (semilla derivada por índice), así que se
+pueden repartir entre procesos sin cambiar el resultado.
+"""
+
+import itertools
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from core.constants import OFF, opponent
+from core.dice import Dice
+from core.eval.features import as_position
+from core.movegen import Position
+from sim.farm import game_seed
+from sim.policies import Policy, RandomPolicy
+
+__all__ = ["RolloutResult", "rollout", "rollout_trials", "score_position"]
+
+# Códigos de resultado por prueba (desde el punto de vista de `color`)
+_TRUNCATED = 0
+
+
+@dataclass(frozen=True)
+class RolloutResult:
+    """
+    Resultado de un rollout para `color`.
+
+    equity: resultado medio por partida (en puntos, -3..3)
+    std_error / ci95: error estándar e intervalo de confianza del 95 %
+    win: proporción de victorias (las truncadas aportan (equity + 1) / 2)
+    win_gammon / win_backgammon / lose_gammon / lose_backgammon: tasas
+        (gammon incluye backgammon) sobre todas las pruebas
+    """
+    color: str
+    trials: int
+    equity: float
+    std_error: float
+    ci95: Tuple[float, float]
+    win: float
+    win_gammon: float
+    win_backgammon: float
+    lose_gammon: float
+    lose_backgammon: float
+    truncated: int
+    elapsed: float
+
+    @property
+    def trials_per_sec(self) -> float:
+        return self.trials / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def score_position(position: Position, winner: str) -> int:
+    """
+    Puntos que gana `winner` (ya borneó sus 15 fichas): 1 single, 2 gammon,
+    3 backgammon (el perdedor sin fichas fuera y con fichas en el BAR o en el
+    home del ganador). Mismas reglas que BackgammonGame._determine_outcome.
+    """
+    loser = position[1] if winner == "white" else position[0]
+    if loser[OFF] > 0:
+        return 1
+    home = loser[1:7] if winner == "white" else loser[19:25]
+    if loser[0] > 0 or any(home):
+        return 3
+    return 2
+
+
+def _strata(seed: int, antithetic: bool) -> List[Tuple[int, int, int, int]]:
+    """Orden barajado de las primeras dos tiradas (a1, b1, a2, b2)."""
+    combos = list(itertools.product(range(1, 7), repeat=4))
+    if antithetic:
+        # sólo un representante de cada par (r, complemento(r)); el otro lo juega el par antitético
+        combos = [c for c in combos if c < tuple(7 - v for v in c)]
+    random.Random(seed).shuffle(combos)
+    return combos
+
+
+def _play_trial(position: Position, color: str, first_rolls, rng: random.Random, flip: bool,
+                policy: Policy, truncate: Optional[int], evaluator) -> Tuple[float, int]:
+    """
+    Juega una prueba. Devuelve (valor para `color`, código) donde código es
+    el resultado con signo (+-1..3) o _TRUNCATED.
+    """
+    dice = Dice()
+    mover = color
+    ply = 0
+    while True:
+        if ply < 2:
+            a, b = first_rolls[2 * ply], first_rolls[2 * ply + 1]
+        else:
+            a, b = rng.randint(1, 6), rng.randint(1, 6)
+        if flip:
+            a, b = 7 - a, 7 - b
+        dice.simulate_roll(a, b)
+        position = policy.choose_position(position, mover, dice.available_moves)
+        own = position[0] if mover == "white" else position[1]
+        if own[OFF] == 15:
+            points = score_position(position, mover)
+            value = points if mover == color else -points
+            return float(value), value
+        mover = opponent(mover)
+        ply += 1
+        if truncate is not None and ply >= truncate:
+            return float(evaluator.evaluate(position, color)), _TRUNCATED
+
+
+def rollout_trials(position: Position, color: str, indices: Sequence[int], seed: int = 0,
+                   policy: Optional[Policy] = None, truncate: Optional[int] = None,
+                   evaluator=None, antithetic: bool = True) -> List[Tuple[float, int]]:
+    """
+    Juega las pruebas de índices `indices` y devuelve [(valor, código), ...].
+    Cada prueba depende sólo de (seed, índice): se pueden repartir entre procesos.
+    """
+    policy = policy or RandomPolicy()
+    strata = _strata(seed, antithetic)
+    out = []
+    for t in indices:
+        pair, flip = (t // 2, t % 2 == 1) if antithetic else (t, False)
+        first_rolls = strata[pair % len(strata)]
+        stream_seed = game_seed(seed, pair)
+        policy.reseed(stream_seed ^ (1 if flip else 0))
+        out.append(_play_trial(position, color, first_rolls, random.Random(stream_seed), flip,
+                               policy, truncate, evaluator))
+    return out
+
+
+def _trials_task(args):
+    return rollout_trials(*args)
+
+
+def rollout(board_or_position, color: str, trials: int = 1296, seed: int = 0,
+            policy: Optional[Policy] = None, truncate: Optional[int] = None, evaluator=None,
+            antithetic: bool = True, workers: int = 1, chunk_size: int = 64) -> RolloutResult:
+    """
+    Estima la equity de la posición para `color`, que es quien tira primero.
+
+    Args:
+        trials: cantidad de partidas (múltiplo de 1296 para estratificación completa)
+        policy: política de ambos bandos (RandomPolicy por defecto)
+        truncate: cortar cada partida tras ese número de plies y evaluar
+        evaluator: evaluador para las truncadas (HeuristicEvaluator por defecto)
+        antithetic: usar pares antitéticos de dados (`trials` debe ser par)
+        workers: procesos a usar (1 = en este proceso; None = todos los núcleos)
+    """
+    if color not in ("white", "black"):
+        raise ValueError(f"Color inválido: {color}")
+    if trials < 1:
+        raise ValueError("trials debe ser al menos 1.")
+    if antithetic and trials % 2:
+        raise ValueError("Con antithetic=True trials debe ser par (las partidas van de a pares).")
+    if truncate is not None and evaluator is None:
+        from core.eval import HeuristicEvaluator
+        evaluator = HeuristicEvaluator()
+    position = as_position(board_or_position)
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = rollout_trials(position, color, range(trials), seed, policy, truncate, evaluator, antithetic)
+    else:
+        chunks = [range(i, min(i + chunk_size, trials)) for i in range(0, trials, chunk_size)]
+        tasks = [(position, color, chunk, seed, policy, truncate, evaluator, antithetic) for chunk in chunks]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = [r for part in pool.map(_trials_task, tasks) for r in part]
+    elapsed = time.perf_counter() - start
+    return _summarize(color, results, antithetic, elapsed)
+
+
+def _summarize(color: str, results: List[Tuple[float, int]], antithetic: bool, elapsed: float) -> RolloutResult:
+    n = len(results)
+    values = [v for v, _ in results]
+    mean = sum(values) / n
+    # Con antitéticas las muestras independientes son los promedios de cada par
+    if antithetic and n >= 4:
+        samples = [(values[i] + values[i + 1]) / 2 for i in range(0, n - 1, 2)]
+    else:
+        samples = values
+    m = len(samples)
+    if m > 1:
+        sample_mean = sum(samples) / m
+        var = sum((x - sample_mean) ** 2 for x in samples) / (m - 1)
+        se = math.sqrt(var / m)
+    else:
+        se = 0.0
+
+    codes = [c for _, c in results]
+    win = sum(1.0 for c in codes if c > 0) + sum((v + 1) / 2 for v, c in results if c == _TRUNCATED)
+    return RolloutResult(
+        color=color,
+        trials=n,
+        equity=mean,
+        std_error=se,
+        ci95=(mean - 1.96 * se, mean + 1.96 * se),
+        win=win / n,
+        win_gammon=sum(1 for c in codes if c >= 2) / n,
+        win_backgammon=sum(1 for c in codes if c == 3) / n,
+        lose_gammon=sum(1 for c in codes if c <= -2) / n,
+        lose_backgammon=sum(1 for c in codes if c == -3) / n,
+        truncated=codes.count(_TRUNCATED),
+        elapsed=elapsed,
+    )
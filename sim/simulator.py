@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Simulador headless de partidas entre dos políticas.
+
+play_game juega una partida completa sin interfaz, manejando el turno con
+BackgammonGame.start_turn / apply_play / end_turn, y run_games juega N
+partidas y acumula estadísticas: partidas por segundo, resultados
+(single/gammon/backgammon de _determine_outcome) y tiempos por fase.
+
+Fases medidas: roll (start_turn), choose (política + generación de jugadas),
+apply (aplicar la jugada) y end (end_turn).
+"""
+
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.player import Player
+from sim.pool import GamePool
+
+__all__ = ["PHASES", "GameRecord", "SimStats", "play_game", "run_games"]
+
+PHASES = ("roll", "choose", "apply", "end")
+
+
+@dataclass(frozen=True)
+class GameRecord:
+    """Resultado de una partida. winner es None si se cortó por max_turns."""
+    winner: Optional[str]
+    outcome: Optional[str]
+    points: int
+    turns: int
+    starting_color: str
+
+
+@dataclass
+class SimStats:
+    """Estadísticas acumuladas de varias partidas."""
+    games: int = 0
+    turns: int = 0
+    unfinished: int = 0
+    elapsed: float = 0.0
+    wins: Counter = field(default_factory=Counter)        # color -> partidas ganadas
+    outcomes: Counter = field(default_factory=Counter)    # single/gammon/backgammon
+    points: Counter = field(default_factory=Counter)      # color -> puntos ganados
+    timings: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+
+    @property
+    def games_per_sec(self) -> float:
+        return self.games / self.elapsed if self.elapsed > 0 else 0.0
+
+    def add(self, record: GameRecord) -> None:
+        self.games += 1
+        self.turns += record.turns
+        if record.winner is None:
+            self.unfinished += 1
+            return
+        self.wins[record.winner] += 1
+        self.outcomes[record.outcome] += 1
+        self.points[record.winner] += record.points
+
+    def merge(self, other: "SimStats") -> None:
+        """Suma las estadísticas de `other` (p. ej. de otro proceso)."""
+        self.games += other.games
+        self.turns += other.turns
+        self.unfinished += other.unfinished
+        self.elapsed = max(self.elapsed, other.elapsed)
+        self.wins.update(other.wins)
+        self.outcomes.update(other.outcomes)
+        self.points.update(other.points)
+        for phase, seconds in other.timings.items():
+            self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+
+    def summary(self) -> str:
+        lines = [
+            f"Partidas: {self.games} en {self.elapsed:.2f}s ({self.games_per_sec:.1f} partidas/s)",
+            f"Turnos: {self.turns} ({self.turns / max(self.games, 1):.1f} por partida)",
+            f"Victorias: white={self.wins['white']} black={self.wins['black']}"
+            + (f" sin terminar={self.unfinished}" if self.unfinished else ""),
+            "Resultados: " + ", ".join(f"{k}={self.outcomes[k]}" for k in ("single", "gammon", "backgammon")),
+            f"Puntos: white={self.points['white']} black={self.points['black']}",
+        ]
+        total = sum(self.timings.values()) or 1.0
+        lines.append("Tiempos: " + ", ".join(
+            f"{phase}={seconds:.2f}s ({100 * seconds / total:.0f}%)" for phase, seconds in self.timings.items()
+        ))
+        return "\n".join(lines)
+
+
+def play_game(white, black, seed: Optional[int] = None,
+              board_factory: Callable[[], object] = CompactBoard,
+              validate: bool = False, max_turns: int = 10000,
+              timings: Optional[Dict[str, float]] = None,
+              pool: Optional[GamePool] = None) -> GameRecord:
+    """
+    Juega una partida completa entre las políticas `white` y `black`.
+
+    Args:
+        seed: semilla de la partida (color inicial y dados); None = aleatoria
+        board_factory: tablero a usar (CompactBoard por velocidad; Board también sirve)
+        validate: si es True cada paso pasa por apply_player_move (más lento)
+        max_turns: corte de seguridad; la partida queda sin ganador
+        timings: dict de fase -> segundos donde acumular los tiempos
+        pool: GamePool del que tomar la partida (ignora board_factory); la
+            partida se devuelve al pool al terminar
+    """
+    rng = random.Random(seed)
+    starting = rng.choice(("white", "black"))
+    if pool is not None:
+        game = pool.acquire(starting, rng.getrandbits(64))
+        try:
+            return _play(game, white, black, validate, max_turns, timings, starting)
+        finally:
+            pool.release(game)
+    dice = Dice(rng.getrandbits(64))
+    game = BackgammonGame(
+        board_factory(), dice, (Player("White", "white"), Player("Black", "black")),
+        starting_color=starting,
+    )
+    return _play(game, white, black, validate, max_turns, timings, starting)
+
+
+def _play(game: BackgammonGame, white, black, validate: bool, max_turns: int,
+          timings: Optional[Dict[str, float]], starting: str) -> GameRecord:
+    """Bucle de turnos de play_game sobre una partida ya preparada."""
+    policies = {"white": white, "black": black}
+    clock = time.perf_counter
+    spent = dict.fromkeys(PHASES, 0.0)
+
+    turns = 0
+    while not game.game_over and turns < max_turns:
+        t0 = clock()
+        game.start_turn()
+        t1 = clock()
+        play = policies[game.current_color].choose(game)
+        t2 = clock()
+        game.apply_play(play, validate=validate)
+        t3 = clock()
+        if not game.game_over:
+            game.end_turn()
+        t4 = clock()
+        turns += 1
+        spent["roll"] += t1 - t0
+        spent["choose"] += t2 - t1
+        spent["apply"] += t3 - t2
+        spent["end"] += t4 - t3
+
+    if timings is not None:
+        for phase, seconds in spent.items():
+            timings[phase] = timings.get(phase, 0.0) + seconds
+
+    if not game.game_over:
+        return GameRecord(None, None, 0, turns, starting)
+    result = game.result
+    return GameRecord(result.winner_color, result.outcome, result.points, turns, starting)
+
+
+def run_games(n: int, white, black, seed: Optional[int] = 0,
+              board_factory: Callable[[], object] = CompactBoard,
+              validate: bool = False, max_turns: int = 10000) -> SimStats:
+    """
+    Juega `n` partidas en este proceso, reutilizando una única partida de un
+    GamePool. Con la misma `seed` (y políticas deterministas) los resultados
+    son reproducibles.
+    """
+    rng = random.Random(seed)
+    stats = SimStats()
+    pool = GamePool(board_factory)
+    start = time.perf_counter()
+    for _ in range(n):
+        record = play_game(white, black, seed=rng.getrandbits(64), validate=validate,
+                           max_turns=max_turns, timings=stats.timings, pool=pool)
+        stats.add(record)
+    stats.elapsed = time.perf_counter() - start
+    return stats
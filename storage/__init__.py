@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""
+Persistencia de partidas: guardado y carga del estado completo (JSON y
+binario), journal de eventos con replay y archivo SQLite de partidas.
+"""
+
+from storage.codec import (
+    BINARY_EXTENSIONS, FORMAT_VERSION, StorageError, decode_game, encode_game,
+    game_from_dict, game_to_dict, load_game, save_game,
+)
+from storage.archive import ArchivedGame, GameArchive
+from storage.journal import GameJournal, JournalEvent, Replayer, ReplayState, read_events
+
+__all__ = [
+    "FORMAT_VERSION", "BINARY_EXTENSIONS", "StorageError",
+    "game_to_dict", "game_from_dict", "encode_game", "decode_game",
+    "save_game", "load_game",
+    "GameJournal", "JournalEvent", "Replayer", "ReplayState", "read_events",
+    "ArchivedGame", "GameArchive",
+]
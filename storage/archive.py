@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+Archivo SQLite de partidas para análisis.
+
+Tablas:
+  games      una fila por partida (jugadores, ganador, resultado, puntos, turnos)
+  moves      (game_id, ply) -> color, desde, pasos, hasta, captura
+  positions  (game_id, turn) -> ply, position key (los 10 bytes del Position
+             ID, ver core.position_id) y color en turno, al comienzo de cada
+             turno (un turno sin jugadas repite el ply del siguiente)
+
+Índices sobre positions(position_key), games(outcome), games(white),
+games(black) y games(winner): "todas las partidas que pasan por esta
+posición" es una búsqueda por índice, sin recorrer la tabla.
+
+Las inserciones se acumulan y se escriben en lotes de `batch_size`
+partidas, cada lote en una sola transacción; los archivos en disco usan WAL.
+Las partidas se pueden armar desde un journal (ArchivedGame.from_journal).
+"""
+
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from core.compact_board import CompactBoard
+from core.move_check import MoveToken
+from core.position_id import decode_position, encode_position, position_from_id
+from storage.journal import END_TURN, GAME_OVER, MOVE, ROLL, UNDO, read_events
+
+__all__ = ["ArchivedGame", "GameArchive"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id       INTEGER PRIMARY KEY,
+    white    TEXT NOT NULL,
+    black    TEXT NOT NULL,
+    winner   TEXT,
+    outcome  TEXT,
+    points   INTEGER NOT NULL DEFAULT 0,
+    turns    INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS moves (
+    game_id  INTEGER NOT NULL REFERENCES games(id),
+    ply      INTEGER NOT NULL,
+    color    TEXT NOT NULL,
+    from_pos INTEGER NOT NULL,
+    steps    INTEGER NOT NULL,
+    to_pos   INTEGER NOT NULL,
+    hit      INTEGER NOT NULL,
+    PRIMARY KEY (game_id, ply)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS positions (
+    game_id      INTEGER NOT NULL REFERENCES games(id),
+    turn         INTEGER NOT NULL,
+    ply          INTEGER NOT NULL,
+    position_key BLOB NOT NULL,
+    on_roll      TEXT NOT NULL,
+    PRIMARY KEY (game_id, turn)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_positions_key ON positions(position_key, on_roll);
+CREATE INDEX IF NOT EXISTS idx_games_outcome ON games(outcome);
+CREATE INDEX IF NOT EXISTS idx_games_white ON games(white);
+CREATE INDEX IF NOT EXISTS idx_games_black ON games(black);
+CREATE INDEX IF NOT EXISTS idx_games_winner ON games(winner);
+"""
+
+Move = Tuple[str, int, int, int, bool]          # color, desde, pasos, hasta, captura
+PositionRow = Tuple[int, bytes, str]            # ply, position key, color en turno
+
+
+@dataclass
+class ArchivedGame:
+    """Partida lista para archivar. `ply` cuenta movimientos de ficha desde 0."""
+    white: str
+    black: str
+    winner: Optional[str] = None
+    outcome: Optional[str] = None
+    points: int = 0
+    turns: int = 0
+    moves: List[Move] = field(default_factory=list)
+    positions: List[PositionRow] = field(default_factory=list)
+
+    @classmethod
+    def from_journal(cls, source: Union[str, bytes], white: str = "White", black: str = "Black") -> "ArchivedGame":
+        """
+        Arma la partida desde un journal (ver storage.journal): movimientos
+        (los deshechos se descartan), la posición al comienzo de cada turno
+        y el resultado. El journal debe empezar en la posición inicial o con
+        un checkpoint.
+        """
+        game = cls(white, black)
+        board = CompactBoard()
+        for event in read_events(source):
+            if event.kind == ROLL:
+                snap = board.snapshot()
+                position = (tuple(snap[:26]), tuple(snap[26:]))
+                game.positions.append((len(game.moves), encode_position(position, event.color), event.color))
+            elif event.kind == MOVE:
+                from_pos, steps, to_pos, hit = event.data
+                board.make_move(event.color, from_pos, steps)
+                game.moves.append((event.color, from_pos, steps, to_pos, hit))
+            elif event.kind == UNDO:
+                from_pos, steps, to_pos, hit = event.data
+                board.unmake_move(MoveToken(event.color, from_pos, to_pos, hit))
+                game.moves.pop()
+            elif event.kind == END_TURN:
+                game.turns += 1
+            elif event.kind == GAME_OVER:
+                game.winner = event.color
+                game.outcome, game.points = event.data
+                game.turns += 1
+            else:   # CHECKPOINT
+                board.restore(event.data[1])
+        return game
+
+
+def _key(position, on_roll: Optional[str]) -> bytes:
+    """Position key a partir de bytes (10), texto del Position ID o posición empaquetada."""
+    if isinstance(position, (bytes, bytearray)):
+        if len(position) != 10:
+            raise ValueError("La position key debe tener 10 bytes.")
+        return bytes(position)
+    if on_roll is None:
+        raise ValueError("Hace falta on_roll para codificar la posición.")
+    if isinstance(position, str):
+        return encode_position(position_from_id(position, on_roll), on_roll)
+    return encode_position(position, on_roll)
+
+
+class GameArchive:
+    """
+    Archivo de partidas sobre SQLite. add_game acumula en memoria y escribe
+    cada `batch_size` partidas; flush() (o cerrar) escribe lo pendiente.
+    """
+
+    def __init__(self, path: str = ":memory:", batch_size: int = 500):
+        if batch_size < 1:
+            raise ValueError("batch_size debe ser al menos 1.")
+        self.path = path
+        self.batch_size = batch_size
+        self._conn = sqlite3.connect(path)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        (last,) = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM games").fetchone()
+        self._next_id = last + 1
+        self._pending: List[Tuple[int, ArchivedGame]] = []
+
+    # ---------------- Escritura ----------------
+
+    def add_game(self, game: ArchivedGame) -> int:
+        """Agrega una partida y devuelve su id (se escribe con el próximo lote)."""
+        game_id = self._next_id
+        self._next_id += 1
+        self._pending.append((game_id, game))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+        return game_id
+
+    def add_games(self, games: Iterable[ArchivedGame]) -> List[int]:
+        return [self.add_game(g) for g in games]
+
+    def flush(self) -> None:
+        """Escribe las partidas pendientes en una sola transacción."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO games (id, white, black, winner, outcome, points, turns) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(gid, g.white, g.black, g.winner, g.outcome, g.points, g.turns) for gid, g in pending],
+            )
+            self._conn.executemany(
+                "INSERT INTO moves (game_id, ply, color, from_pos, steps, to_pos, hit) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(gid, ply, *move[:4], int(move[4])) for gid, g in pending for ply, move in enumerate(g.moves)],
+            )
+            self._conn.executemany(
+                "INSERT INTO positions (game_id, turn, ply, position_key, on_roll) VALUES (?, ?, ?, ?, ?)",
+                [(gid, turn, *row) for gid, g in pending for turn, row in enumerate(g.positions)],
+            )
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self) -> "GameArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ---------------- Consultas ----------------
+
+    def count(self) -> int:
+        self.flush()
+        return self._conn.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+    def get_game(self, game_id: int) -> Optional[ArchivedGame]:
+        """Partida completa por id (None si no existe)."""
+        self.flush()
+        row = self._conn.execute(
+            "SELECT white, black, winner, outcome, points, turns FROM games WHERE id = ?", (game_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        moves = [
+            (color, f, s, t, bool(hit)) for color, f, s, t, hit in self._conn.execute(
+                "SELECT color, from_pos, steps, to_pos, hit FROM moves WHERE game_id = ? ORDER BY ply", (game_id,))
+        ]
+        positions = list(self._conn.execute(
+            "SELECT ply, position_key, on_roll FROM positions WHERE game_id = ? ORDER BY turn", (game_id,)))
+        return ArchivedGame(*row, moves=moves, positions=positions)
+
+    def games_through(self, position, on_roll: Optional[str] = None) -> List[int]:
+        """
+        Ids de las partidas que pasan por `position` (10 bytes, texto del
+        Position ID o posición empaquetada) con `on_roll` en turno.
+        """
+        self.flush()
+        key = _key(position, on_roll)
+        if on_roll is None:
+            rows = self._conn.execute(
+                "SELECT DISTINCT game_id FROM positions WHERE position_key = ? ORDER BY game_id", (key,))
+        else:
+            rows = self._conn.execute(
+                "SELECT DISTINCT game_id FROM positions WHERE position_key = ? AND on_roll = ? ORDER BY game_id",
+                (key, on_roll))
+        return [r[0] for r in rows]
+
+    def games_by_player(self, name: str) -> List[int]:
+        """Ids de las partidas donde jugó `name` (con cualquier color)."""
+        self.flush()
+        rows = self._conn.execute(
+            "SELECT id FROM games WHERE white = ? UNION SELECT id FROM games WHERE black = ? ORDER BY 1",
+            (name, name))
+        return [r[0] for r in rows]
+
+    def outcome_counts(self) -> Dict[str, int]:
+        """{resultado: cantidad} de las partidas terminadas."""
+        self.flush()
+        rows = self._conn.execute(
+            "SELECT outcome, COUNT(*) FROM games WHERE outcome IS NOT NULL GROUP BY outcome")
+        return dict(rows)
+
+    def position(self, key: bytes, on_roll: str):
+        """Posición empaquetada de una position key guardada."""
+        return decode_position(key, on_roll)
+
+    def explain(self, sql: str, params: tuple = ()) -> List[str]:
+        """Plan de SQLite para una consulta (para verificar el uso de índices)."""
+        return [row[-1] for row in self._conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
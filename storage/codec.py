@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""
+Guardado y carga de partidas completas.
+
+Se persiste todo lo necesario para retomar una partida sin reproducir las
+jugadas: tablero (52 conteos, ver Board.snapshot), dados (última tirada,
+available_moves y used_moves), color en turno, número de turno, si hay un
+turno activo, dados al inicio del turno, nombres y puntajes de los
+jugadores y el resultado si la partida terminó. El generador de los dados
+no se guarda: las tiradas siguientes no son las mismas que sin guardar.
+
+Dos formatos con el mismo contenido y número de versión:
+  - JSON (legible, incluye además "state" = BackgammonGame.state() y el
+    Position ID para inspección).
+  - Binario: cabecera b"BGSV" + versión y campos de tamaño fijo; es el que
+    conviene para reanudar rápido.
+save_game elige el formato por extensión (.bgs / .bin = binario) y escribe
+de forma atómica; load_game detecta el formato por la cabecera.
+"""
+
+import json
+import os
+import struct
+from types import SimpleNamespace
+from typing import Optional
+
+from core.board import Board
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.player import Player
+
+__all__ = [
+    "FORMAT_VERSION", "BINARY_EXTENSIONS", "StorageError",
+    "game_to_dict", "game_from_dict", "encode_game", "decode_game",
+    "save_game", "load_game",
+]
+
+FORMAT_VERSION = 1
+BINARY_EXTENSIONS = (".bgs", ".bin")
+
+_MAGIC = b"BGSV"
+_COLORS = ("white", "black")
+_OUTCOMES = ("single", "gammon", "backgammon")
+_NONE = 0xFF
+# magic, versión, tablero (52), color en turno, flags, número de turno,
+# última tirada (2), largo + 4 valores de available, used y dados de inicio,
+# ganador, resultado, puntos
+_BODY = struct.Struct("<4sB52sBBI2B5B5B5BBBB")
+_FLAG_TURN_ACTIVE = 1
+_FLAG_GAME_OVER = 2
+
+
+class StorageError(ValueError):
+    """Archivo o datos de partida inválidos (formato, versión o contenido)."""
+
+
+# ---------------- Estado <-> dict ----------------
+
+def _players_of(game):
+    return [game.players[c] for c in _COLORS if c in game.players]
+
+
+def game_to_dict(game) -> dict:
+    """Estado completo de `game` como dict serializable a JSON."""
+    board = game.board.snapshot()
+    dice = game.dice
+    result = getattr(game, "result", None)
+    st = game.state()
+    return {
+        "version": FORMAT_VERSION,
+        "position_id": game.position_id(),
+        "board": {"white": list(board[:26]), "black": list(board[26:])},
+        "current_color": game.current_color,
+        "turn_number": game.turn_number,
+        "turn_active": bool(getattr(game, "_turn_active", False)),
+        "turn_start_dice": list(getattr(game, "_turn_start_dice", ())),
+        "dice": {
+            "last_roll": list(dice.last_roll) if getattr(dice, "last_roll", None) else None,
+            "available_moves": list(getattr(dice, "available_moves", [])),
+            "used_moves": list(getattr(dice, "used_moves", [])),
+        },
+        "players": [
+            {"name": p.name, "color": p.color, "score": getattr(p, "score", 0)} for p in _players_of(game)
+        ],
+        "game_over": bool(game.game_over),
+        "result": None if result is None else {
+            "winner": result.winner_color, "outcome": result.outcome, "points": result.points,
+        },
+        "state": {
+            "current_color": st.current_color,
+            "dice_values": list(st.dice_values),
+            "moves_left": st.moves_left,
+        },
+    }
+
+
+def _apply(game, board: bytes, current_color: str, turn_number: int, turn_active: bool,
+           turn_start_dice, last_roll, available, used, game_over: bool, result) -> None:
+    """Vuelca un estado ya validado sobre `game` (en el lugar)."""
+    dice = game.dice
+    dice.last_roll = tuple(last_roll) if last_roll else None
+    dice.available_moves[:] = available
+    dice.used_moves[:] = used
+    if result is not None:
+        winner, outcome, points = result
+        loser = "black" if winner == "white" else "white"
+        result = SimpleNamespace(
+            winner=winner, winner_color=winner, loser=loser, loser_color=loser,
+            outcome=outcome, points=points,
+        )
+    game.restore_state(board, current_color, turn_number, turn_active, turn_start_dice, game_over, result)
+
+
+def _new_game(players, board_factory) -> BackgammonGame:
+    made = []
+    for color in _COLORS:
+        name, score = players.get(color, (color.capitalize(), 0))
+        player = Player(name, color)
+        if score:
+            player.add_score(score)
+        made.append(player)
+    return BackgammonGame(board_factory(), Dice(), tuple(made))
+
+
+def _check(cond: bool, message: str) -> None:
+    if not cond:
+        raise StorageError(message)
+
+
+def _check_dice(values, limit: int, what: str) -> list:
+    values = list(values)
+    _check(len(values) <= limit and all(1 <= v <= 6 for v in values), f"{what} inválidos: {values}")
+    return values
+
+
+def game_from_dict(data: dict, game: Optional[BackgammonGame] = None,
+                   board_factory=Board) -> BackgammonGame:
+    """
+    Restaura el estado de `data` (ver game_to_dict). Si se pasa `game` se
+    restaura en el lugar; si no, se crea una partida nueva con tablero
+    `board_factory()` y los jugadores guardados.
+    """
+    try:
+        _check(data.get("version") == FORMAT_VERSION, f"Versión no soportada: {data.get('version')}")
+        white, black = data["board"]["white"], data["board"]["black"]
+        _check(len(white) == 26 and len(black) == 26, "El tablero debe tener 26 posiciones por color.")
+        _check(sum(white) == 15 and sum(black) == 15, "Cada color debe tener 15 fichas.")
+        board = bytes(white) + bytes(black)
+        current_color = data["current_color"]
+        _check(current_color in _COLORS, f"Color inválido: {current_color}")
+        dice = data["dice"]
+        last_roll = dice["last_roll"]
+        if last_roll is not None:
+            last_roll = _check_dice(last_roll, 2, "Dados")
+            _check(len(last_roll) == 2, "La tirada debe tener dos dados.")
+        available = _check_dice(dice["available_moves"], 4, "Movimientos disponibles")
+        used = _check_dice(dice["used_moves"], 4, "Movimientos usados")
+        start = _check_dice(data.get("turn_start_dice", []), 4, "Dados de inicio")
+        result = data.get("result")
+        if result is not None:
+            _check(result["winner"] in _COLORS and result["outcome"] in _OUTCOMES, "Resultado inválido.")
+            result = (result["winner"], result["outcome"], int(result["points"]))
+        players = {p["color"]: (p["name"], int(p.get("score", 0))) for p in data.get("players", [])}
+        fields = (board, current_color, int(data["turn_number"]), bool(data.get("turn_active", False)),
+                  start, last_roll, available, used, bool(data.get("game_over", False)), result)
+    except (KeyError, TypeError, AttributeError) as exc:
+        raise StorageError(f"Datos de partida incompletos: {exc}") from exc
+    except ValueError as exc:
+        if isinstance(exc, StorageError):
+            raise
+        raise StorageError(str(exc)) from exc
+
+    if game is None:
+        game = _new_game(players, board_factory)
+    _apply(game, *fields)
+    return game
+
+
+# ---------------- Codec binario ----------------
+
+def _pad4(values) -> list:
+    values = list(values)
+    if len(values) > 4:
+        raise StorageError(f"Demasiados dados: {values}")
+    return [len(values)] + values + [0] * (4 - len(values))
+
+
+def encode_game(game) -> bytes:
+    """
+    Estado de `game` en binario: cuerpo de tamaño fijo (_BODY) seguido de
+    los nombres de los jugadores (largo u8 + UTF-8) y sus puntajes (u32).
+    """
+    d = game_to_dict(game)
+    dice = d["dice"]
+    flags = (_FLAG_TURN_ACTIVE if d["turn_active"] else 0) | (_FLAG_GAME_OVER if d["game_over"] else 0)
+    last_roll = dice["last_roll"] or [0, 0]
+    result = d["result"]
+    if result is None:
+        tail = (_NONE, _NONE, 0)
+    else:
+        tail = (_COLORS.index(result["winner"]), _OUTCOMES.index(result["outcome"]), result["points"])
+    body = _BODY.pack(
+        _MAGIC, FORMAT_VERSION, game.board.snapshot(), _COLORS.index(d["current_color"]), flags,
+        d["turn_number"], *last_roll, *_pad4(dice["available_moves"]), *_pad4(dice["used_moves"]),
+        *_pad4(d["turn_start_dice"]), *tail,
+    )
+    extra = bytearray()
+    for player in d["players"]:
+        name = player["name"].encode("utf-8")[:255]
+        extra += struct.pack("<BB", _COLORS.index(player["color"]), len(name)) + name
+        extra += struct.pack("<I", player["score"])
+    return body + bytes([len(d["players"])]) + bytes(extra)
+
+
+def decode_game(data: bytes, game: Optional[BackgammonGame] = None, board_factory=Board) -> BackgammonGame:
+    """Inversa de encode_game (mismas reglas que game_from_dict)."""
+    if len(data) < _BODY.size + 1 or data[:4] != _MAGIC:
+        raise StorageError("No es un archivo de partida binario.")
+    fields = _BODY.unpack_from(data)
+    _, version, board, color, flags, turn_number = fields[:6]
+    if version != FORMAT_VERSION:
+        raise StorageError(f"Versión no soportada: {version}")
+    last_roll = list(fields[6:8])
+    lists = [fields[8 + 5 * i: 13 + 5 * i] for i in range(3)]
+    available, used, start = (list(vals[1:1 + vals[0]]) for vals in lists)
+    winner, outcome, points = fields[23:26]
+
+    players = []
+    offset = _BODY.size + 1
+    try:
+        for _ in range(data[_BODY.size]):
+            pcolor, size = struct.unpack_from("<BB", data, offset)
+            offset += 2
+            name = data[offset:offset + size].decode("utf-8")
+            offset += size
+            (score,) = struct.unpack_from("<I", data, offset)
+            offset += 4
+            players.append({"name": name, "color": _COLORS[pcolor], "score": score})
+    except (struct.error, IndexError, UnicodeDecodeError) as exc:
+        raise StorageError(f"Jugadores corruptos: {exc}") from exc
+
+    return game_from_dict({
+        "version": version,
+        "board": {"white": list(board[:26]), "black": list(board[26:])},
+        "current_color": _COLORS[color] if color < 2 else None,
+        "turn_number": turn_number,
+        "turn_active": bool(flags & _FLAG_TURN_ACTIVE),
+        "turn_start_dice": start,
+        "dice": {"last_roll": last_roll if any(last_roll) else None,
+                 "available_moves": available, "used_moves": used},
+        "players": players,
+        "game_over": bool(flags & _FLAG_GAME_OVER),
+        "result": None if winner == _NONE else {
+            "winner": _COLORS[winner] if winner < 2 else None,
+            "outcome": _OUTCOMES[outcome] if outcome < 3 else None,
+            "points": points,
+        },
+    }, game, board_factory)
+
+
+# ---------------- Archivos ----------------
+
+def _is_binary_path(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in BINARY_EXTENSIONS
+
+
+def save_game(game, path: str, binary: Optional[bool] = None) -> str:
+    """
+    Guarda `game` en `path` (binario si binary=True o por extensión .bgs/.bin).
+    Escribe a un temporal y lo renombra para no dejar archivos a medias.
+    Devuelve el path.
+    """
+    if binary is None:
+        binary = _is_binary_path(path)
+    if binary:
+        payload = encode_game(game)
+    else:
+        payload = json.dumps(game_to_dict(game), ensure_ascii=False, indent=2).encode("utf-8")
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(payload)
+    os.replace(tmp, path)
+    return path
+
+
+def load_game(path: str, game: Optional[BackgammonGame] = None, board_factory=Board) -> BackgammonGame:
+    """Carga una partida guardada con save_game (detecta el formato por la cabecera)."""
+    with open(path, "rb") as fh:
+        data = fh.read()
+    if data[:4] == _MAGIC:
+        return decode_game(data, game, board_factory)
+    try:
+        parsed = json.loads(data.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise StorageError(f"Archivo de partida inválido: {path}") from exc
+    if not isinstance(parsed, dict):
+        raise StorageError(f"Archivo de partida inválido: {path}")
+    return game_from_dict(parsed, game, board_factory)
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Journal de partida: registro binario de sólo-agregado con los eventos del
+motor (tiradas, movimientos, fin de turno, fin de partida) y checkpoints
+periódicos del tablero.
+
+Formato: b"BGJ1" y luego registros [largo u16][tipo u8][datos]. Un registro
+cortado al final (p. ej. por una caída del proceso) se ignora al leer, así
+que el journal sirve para recuperar la partida hasta el último evento
+completo. Los checkpoints guardan el snapshot de 52 bytes del tablero (ver
+Board.snapshot), el color en turno y el número de turno; Replayer reconstruye
+la posición tras cualquier evento partiendo del checkpoint más cercano y
+aplicando los movimientos posteriores con make_move.
+
+El motor escribe en el journal si se le asigna uno (BackgammonGame.attach_journal).
+"""
+
+import bisect
+import struct
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from core.compact_board import CompactBoard
+from core.move_check import MoveToken
+
+__all__ = [
+    "ROLL", "MOVE", "END_TURN", "GAME_OVER", "CHECKPOINT", "UNDO",
+    "JournalEvent", "GameJournal", "read_events", "ReplayState", "Replayer",
+]
+
+_MAGIC = b"BGJ1"
+_LEN = struct.Struct("<H")
+
+# Tipos de evento
+ROLL, MOVE, END_TURN, GAME_OVER, CHECKPOINT, UNDO = 1, 2, 3, 4, 5, 6
+
+_COLORS = ("white", "black")
+_OUTCOMES = ("single", "gammon", "backgammon")
+
+# Formato de los datos de cada tipo (el color siempre primero)
+_FORMATS = {
+    ROLL: struct.Struct("<BBB"),              # color, dado 1, dado 2
+    MOVE: struct.Struct("<BBBBB"),            # color, desde, pasos, hasta, captura
+    END_TURN: struct.Struct("<B"),            # color que terminó
+    GAME_OVER: struct.Struct("<BBB"),         # ganador, resultado, puntos
+    CHECKPOINT: struct.Struct("<B I 52s"),    # color en turno, número de turno, tablero
+    UNDO: struct.Struct("<BBBBB"),            # el movimiento deshecho (como MOVE)
+}
+
+
+class JournalEvent(NamedTuple):
+    """
+    Evento leído del journal. `data` depende del tipo:
+      ROLL (a, b) | MOVE / UNDO (from_pos, steps, to_pos, hit) | END_TURN ()
+      GAME_OVER (outcome, points) | CHECKPOINT (turn_number, snapshot)
+    """
+    kind: int
+    color: str
+    data: tuple
+
+
+def _decode(kind: int, payload: bytes) -> JournalEvent:
+    fields = _FORMATS[kind].unpack(payload)
+    color = _COLORS[fields[0]]
+    rest = fields[1:]
+    if kind in (MOVE, UNDO):
+        rest = (rest[0], rest[1], rest[2], bool(rest[3]))
+    elif kind == GAME_OVER:
+        rest = (_OUTCOMES[rest[0]], rest[1])
+    return JournalEvent(kind, color, rest)
+
+
+def _iter_records(data: bytes) -> Iterator[Tuple[int, JournalEvent]]:
+    """(offset, evento) de cada registro completo; corta en el primero incompleto."""
+    if data[:4] != _MAGIC:
+        raise ValueError("No es un journal de partida.")
+    offset = 4
+    while offset + _LEN.size <= len(data):
+        (size,) = _LEN.unpack_from(data, offset)
+        end = offset + _LEN.size + size
+        if size < 1 or end > len(data):
+            break
+        kind = data[offset + _LEN.size]
+        fmt = _FORMATS.get(kind)
+        if fmt is None or fmt.size != size - 1:
+            break
+        yield offset, _decode(kind, data[offset + _LEN.size + 1:end])
+        offset = end
+
+
+def read_events(source: Union[str, bytes]) -> List[JournalEvent]:
+    """Eventos completos de un journal (ruta o bytes)."""
+    if isinstance(source, str):
+        with open(source, "rb") as fh:
+            source = fh.read()
+    return [event for _, event in _iter_records(source)]
+
+
+class GameJournal:
+    """
+    Journal abierto para agregar eventos. `target` es una ruta (se abre en
+    modo append) o un archivo binario ya abierto. Cada `checkpoint_every`
+    fines de turno se agrega un checkpoint del tablero.
+    """
+
+    def __init__(self, target: Union[str, BinaryIO], checkpoint_every: int = 8):
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every debe ser al menos 1.")
+        if isinstance(target, str):
+            self._fh = open(target, "ab")
+            self._owns = True
+        else:
+            self._fh = target
+            self._owns = False
+        if self._fh.tell() == 0:
+            self._fh.write(_MAGIC)
+        self.checkpoint_every = checkpoint_every
+        self.events = 0
+        self._turns_since_checkpoint = 0
+
+    def _append(self, kind: int, *fields) -> None:
+        payload = _FORMATS[kind].pack(*fields)
+        self._fh.write(_LEN.pack(len(payload) + 1) + bytes([kind]) + payload)
+        self.events += 1
+
+    # ---------------- Eventos ----------------
+
+    def record_roll(self, color: str, a: int, b: int) -> None:
+        self._append(ROLL, _COLORS.index(color), a, b)
+
+    def record_move(self, color: str, from_pos: int, steps: int, to_pos: int, hit: bool) -> None:
+        self._append(MOVE, _COLORS.index(color), from_pos, steps, to_pos, int(hit))
+
+    def record_undo(self, color: str, from_pos: int, steps: int, to_pos: int, hit: bool) -> None:
+        self._append(UNDO, _COLORS.index(color), from_pos, steps, to_pos, int(hit))
+
+    def record_end_turn(self, color: str, game=None) -> None:
+        """Fin de turno; si toca, agrega un checkpoint de `game`."""
+        self._append(END_TURN, _COLORS.index(color))
+        self._turns_since_checkpoint += 1
+        if game is not None and self._turns_since_checkpoint >= self.checkpoint_every:
+            self.checkpoint(game)
+
+    def record_game_over(self, winner: str, outcome: str, points: int) -> None:
+        self._append(GAME_OVER, _COLORS.index(winner), _OUTCOMES.index(outcome), points)
+
+    def checkpoint(self, game) -> None:
+        """Snapshot del tablero de `game` con el color en turno y el número de turno."""
+        self._append(CHECKPOINT, _COLORS.index(game.current_color), game.turn_number, game.board.snapshot())
+        self._turns_since_checkpoint = 0
+
+    # ---------------- Archivo ----------------
+
+    def flush(self) -> None:
+        self._fh.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self._owns:
+            self._fh.close()
+
+    def __enter__(self) -> "GameJournal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ReplayState(NamedTuple):
+    """Estado reconstruido tras un evento."""
+    board: CompactBoard
+    current_color: Optional[str]
+    turn_number: int
+    game_over: bool
+
+
+class Replayer:
+    """
+    Reconstruye posiciones de un journal. Los índices de evento cuentan
+    todos los registros (incluidos los checkpoints) desde 0.
+    """
+
+    def __init__(self, source: Union[str, bytes]):
+        self.events = read_events(source)
+        # índices de los checkpoints, en orden
+        self._checkpoints = [i for i, e in enumerate(self.events) if e.kind == CHECKPOINT]
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def state_after(self, index: Optional[int] = None) -> ReplayState:
+        """
+        Estado tras el evento `index` (None = el último). Parte del checkpoint
+        más cercano anterior; sin checkpoints previos, de la posición inicial.
+        """
+        if not self.events:
+            raise ValueError("El journal no tiene eventos.")
+        if index is None:
+            index = len(self.events) - 1
+        if not 0 <= index < len(self.events):
+            raise IndexError(f"Evento fuera de rango: {index}")
+
+        # checkpoint más cercano <= index
+        lo = bisect.bisect_right(self._checkpoints, index)
+        board = CompactBoard()
+        color, turn_number, start = None, 1, 0
+        if lo:
+            cp = self._checkpoints[lo - 1]
+            event = self.events[cp]
+            turn_number, snapshot = event.data
+            board.restore(snapshot)
+            color, start = event.color, cp + 1
+
+        game_over = False
+        for event in self.events[start:index + 1]:
+            if event.kind == MOVE:
+                board.make_move(event.color, event.data[0], event.data[1])
+                color = event.color
+            elif event.kind == UNDO:
+                from_pos, steps, to_pos, hit = event.data
+                board.unmake_move(MoveToken(event.color, from_pos, to_pos, hit))
+            elif event.kind == ROLL:
+                color = event.color
+            elif event.kind == END_TURN:
+                color = "black" if event.color == "white" else "white"
+            elif event.kind == GAME_OVER:
+                game_over = True
+            elif event.kind == CHECKPOINT:
+                color, turn_number = event.color, event.data[0]
+        return ReplayState(board, color, turn_number, game_over)
+
+    def board_after(self, index: Optional[int] = None) -> CompactBoard:
+        """Tablero tras el evento `index` (ver state_after)."""
+        return self.state_after(index).board
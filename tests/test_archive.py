@@ -0,0 +1,60 @@
+import io
+import pytest
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.player import Player
+from sim import RandomPolicy
+from storage import ArchivedGame, GameArchive, GameJournal
+
+OPENING = "4HPwATDgc/ABMA"
+
+
+def journaled_game(seed):
+    buf = io.BytesIO()
+    game = BackgammonGame(CompactBoard(), Dice(seed), (Player("W", "white"), Player("B", "black")),
+                          starting_color="white")
+    game.attach_journal(GameJournal(buf))
+    policy = RandomPolicy(seed)
+    while not game.game_over:
+        game.start_turn()
+        game.apply_play(policy.choose(game), validate=False)
+        if not game.game_over:
+            game.end_turn()
+    return game, buf.getvalue()
+
+
+def test_from_journal_collects_moves_positions_and_result():
+    game, data = journaled_game(1)
+    archived = ArchivedGame.from_journal(data, "ana", "beto")
+    assert (archived.winner, archived.outcome, archived.points) == (
+        game.result.winner_color, game.result.outcome, game.result.points)
+    assert archived.positions[0][0] == 0 and archived.positions[0][2] == "white"
+    board = CompactBoard()
+    for color, from_pos, steps, _to, _hit in archived.moves:
+        board.make_move(color, from_pos, steps)
+    assert board.snapshot() == game.board.snapshot()
+    assert len(archived.positions) == archived.turns
+
+
+def test_archive_batches_and_index_queries(tmp_path):
+    path = str(tmp_path / "games.db")
+    with GameArchive(path, batch_size=2) as archive:
+        assert archive._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        ids = [archive.add_game(ArchivedGame.from_journal(journaled_game(s)[1], f"p{s}", "bot"))
+               for s in range(3)]
+        assert len(archive._pending) == 1      # el primer lote de 2 ya se escribió
+        assert archive.count() == 3
+        assert archive.games_through(OPENING, "white") == ids
+        assert archive.games_by_player("p1") == [ids[1]]
+        assert archive.games_by_player("bot") == ids
+        assert sum(archive.outcome_counts().values()) == 3
+        plan = " ".join(archive.explain("SELECT game_id FROM positions WHERE position_key = ?", (b"x" * 10,)))
+        assert "idx_positions_key" in plan
+        stored = archive.get_game(ids[2])
+        assert stored.moves == ArchivedGame.from_journal(journaled_game(2)[1]).moves
+    with GameArchive(path) as archive:       # reabrir: los ids siguen
+        assert archive.add_game(ArchivedGame("x", "y")) == ids[-1] + 1
+        assert archive.get_game(999) is None
+    with pytest.raises(ValueError):
+        GameArchive(batch_size=0)
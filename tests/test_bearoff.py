@@ -0,0 +1,77 @@
+import pytest
+from core.bearoff import (
+    BearoffDatabase, bearoff_moves, count_positions, exact_win_probability,
+    is_bearoff, one_sided, position_from_index, position_index,
+)
+from core.board import Board
+from core.eval import BearoffEvaluator, HeuristicEvaluator
+
+
+@pytest.fixture(scope="module")
+def db():
+    return BearoffDatabase.build(max_checkers=4)
+
+def position(white, black):
+    w, b = [0] * 26, [0] * 26
+    for p, n in white.items():
+        w[p] = n
+    for p, n in black.items():
+        b[p] = n
+    return (tuple(w), tuple(b))
+
+
+def test_index_is_a_minimal_perfect_hash_with_small_dbs_as_prefix():
+    assert count_positions() == 54264
+    for i in range(0, count_positions(), 97):
+        assert position_index(position_from_index(i)) == i
+    small = {position_from_index(i) for i in range(count_positions(6, 3))}
+    assert len(small) == count_positions(6, 3) and all(sum(p) <= 3 for p in small)
+    with pytest.raises(ValueError):
+        position_index((16, 0, 0, 0, 0, 0))
+
+def test_bearoff_moves_respect_overshoot_rule():
+    # 6-5 con fichas en 2 y 4: el 6 saca la de 4, el 5 la de 2
+    assert (0, 0, 0, 0, 0, 0) in bearoff_moves((0, 1, 0, 1, 0, 0), 6, 5)
+    # con una ficha en 6 no se puede sacar la de 2 con un 5
+    assert all(p[5] == 0 or p[1] == 1 for p in bearoff_moves((0, 1, 0, 0, 0, 1), 5, 1))
+
+def test_known_distributions(db):
+    assert db.distribution((2, 0, 0, 0, 0, 0))[1] == pytest.approx(1.0, abs=1e-4)
+    one_on_six = db.distribution((0, 0, 0, 0, 0, 1))
+    assert one_on_six[1] == pytest.approx(27 / 36, abs=1e-4)    # suma >= 6 o 2-2
+    assert sum(one_on_six) == pytest.approx(1.0, abs=1e-3)
+    assert db.expected_rolls((0, 0, 0, 0, 0, 4)) > db.expected_rolls((4, 0, 0, 0, 0, 0))
+    with pytest.raises(ValueError):
+        db.distribution((0, 0, 0, 0, 0, 5))
+
+def test_win_probability_matches_exact_two_sided_on_small_positions(db):
+    assert db.win_probability((0, 2, 0, 0, 0, 0), (0, 2, 0, 0, 0, 0)) == pytest.approx(
+        26 / 36 + (10 / 36) ** 2, abs=1e-4)
+    for mine, theirs in [((1, 1, 0, 0, 0, 0), (0, 0, 1, 0, 0, 0)), ((0, 0, 0, 1, 1, 0), (1, 0, 0, 0, 1, 0))]:
+        assert db.win_probability(mine, theirs) == pytest.approx(exact_win_probability(mine, theirs), abs=2e-3)
+
+def test_lookup_from_board_positions(db):
+    race = position({2: 2, 25: 13}, {23: 2, 25: 13})
+    assert is_bearoff(race, "white") and one_sided(race, "black") == (0, 2, 0, 0, 0, 0)
+    assert db.lookup(race, "black") == pytest.approx(26 / 36 + (10 / 36) ** 2, abs=1e-4)
+    assert db.lookup(Board(), "white") is None
+    assert db.lookup(position({2: 10, 25: 5}, {23: 2, 25: 13}), "white") is None   # más de 4 fichas
+
+def test_save_and_open_with_mmap(db, tmp_path):
+    path = tmp_path / "bearoff.bin"
+    db.save(str(path))
+    with BearoffDatabase.open(str(path)) as mapped:
+        assert mapped.max_checkers == 4 and mapped.count == count_positions(6, 4)
+        for pos in [(1, 0, 0, 0, 0, 0), (0, 1, 1, 0, 2, 0), (0, 0, 0, 0, 0, 4)]:
+            assert mapped.distribution(pos) == db.distribution(pos)
+    bad = tmp_path / "bad.bin"
+    bad.write_bytes(b"XXXX" + bytes(20))
+    with pytest.raises(ValueError):
+        BearoffDatabase.open(str(bad))
+
+def test_bearoff_evaluator_uses_database_and_falls_back(db):
+    ev = BearoffEvaluator(db)
+    race = position({2: 2, 25: 13}, {23: 2, 25: 13})
+    # después de mover white tira black: equity de white = 1 - 2 * P(black gana)
+    assert ev.evaluate(race, "white") == pytest.approx(1 - 2 * db.lookup(race, "black"))
+    assert ev.evaluate(Board(), "white") == HeuristicEvaluator().evaluate(Board(), "white")
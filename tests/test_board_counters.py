@@ -0,0 +1,73 @@
+import random
+import pytest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.constants import BAR, OFF, HOME_RANGE
+from core.movegen import generate_play_positions, position_of
+
+
+def brute_counters(board, color):
+    counts = [board.count_at(p, color) for p in range(26)]
+    weight = (lambda p: p) if color == "white" else (lambda p: 25 - p)
+    home_start, home_end = HOME_RANGE[color]
+    return {
+        "pips": 25 * counts[BAR] + sum(weight(p) * counts[p] for p in range(1, 25)),
+        "off": counts[OFF],
+        "bar": counts[BAR],
+        "board": sum(counts[1:25]),
+        "outside": sum(counts[p] for p in range(1, 25) if not home_start <= p <= home_end),
+    }
+
+def fast_counters(board, color):
+    return {
+        "pips": board.pip_count(color),
+        "off": board.count_off(color),
+        "bar": board.count_bar(color),
+        "board": board.count_on_board(color),
+        "outside": board.count_outside_home(color),
+    }
+
+
+def test_initial_counters():
+    b = Board()
+    assert b.pip_count("white") == b.pip_count("black") == 167
+    assert b.count_checkers("white") == {"board": 15, "bar": 0, "off": 0, "total": 15}
+    assert b.count_remaining("black") == 15
+    assert b.count_outside_home("white") == 10
+    assert not b.all_checkers_in_home_board("white")
+
+def test_counters_follow_moves_captures_and_set_count_at():
+    b = Board()
+    b.move_checker("white", 24, 1)
+    assert b.pip_count("white") == 166
+    b.set_count_at(20, "black", 1)          # blot negro en 20
+    b.move_checker("white", 24, 4)          # captura
+    assert b.count_bar("black") == 1
+    assert fast_counters(b, "black") == brute_counters(b, "black")
+    assert fast_counters(b, "white") == brute_counters(b, "white")
+
+@pytest.mark.parametrize("cls", [Board, CompactBoard])
+def test_counters_match_recount_during_random_games(cls):
+    rng = random.Random(7)
+    board = cls()
+    color = "white"
+    for _ in range(120):
+        a, b = rng.randint(1, 6), rng.randint(1, 6)
+        dice = [a] * 4 if a == b else [a, b]
+        play, _ = rng.choice(generate_play_positions(position_of(board), color, dice))
+        for from_pos, steps in play:
+            board.make_move(color, from_pos, steps)
+        for c in ("white", "black"):
+            assert fast_counters(board, c) == brute_counters(board, c)
+            assert board.all_checkers_in_home_board(c) == (
+                brute_counters(board, c)["bar"] == 0 and brute_counters(board, c)["outside"] == 0)
+        if board.count_off(color) == 15:
+            break
+        color = "black" if color == "white" else "white"
+
+def test_restore_recomputes_counters():
+    b = Board()
+    snap = b.snapshot()
+    b.move_checker("white", 6, 2)
+    b.restore(snap)
+    assert b.pip_count("white") == 167 and b.count_outside_home("white") == 10
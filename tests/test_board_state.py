@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+from core.board import Board
+from core.board_state import BoardState, BoardStateAdapter, as_board_state, determine_outcome
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.player import Player
+
+
+def test_native_boards_satisfy_protocol_without_adapter():
+    for board in (Board(), CompactBoard()):
+        assert isinstance(board, BoardState)
+        assert as_board_state(board) is board
+        assert board.count_in_home_of("black", "white") == 2    # dos negras en el punto 1
+
+def test_instance_overrides_and_partial_boards_use_adapter():
+    b = Board()
+    b.count_off = lambda color: 15
+    state = as_board_state(b)
+    assert isinstance(state, BoardStateAdapter) and state.count_off("white") == 15
+    partial = SimpleNamespace(count_at=lambda pos, color: 4 if pos == 25 else 0)
+    assert as_board_state(partial).count_off("white") == 4
+
+def test_determine_outcome_from_counters():
+    b = CompactBoard(empty=True)
+    assert determine_outcome(b, "white", "black") == ("gammon", 2)
+    b.set_count_at(3, "black", 1)
+    assert determine_outcome(b, "white", "black") == ("backgammon", 3)
+    b.set_count_at(3, "black", 0)
+    b.set_count_at(25, "black", 1)
+    assert determine_outcome(b, "white", "black") == ("single", 1)
+
+def test_game_detects_victory_with_native_counters():
+    board = CompactBoard(empty=True)
+    board.set_count_at(1, "white", 1)
+    board.set_count_at(25, "white", 14)
+    board.set_count_at(20, "black", 15)
+    dice = Dice()
+    g = BackgammonGame(board, dice, (Player("W", "white"), Player("B", "black")), starting_color="white")
+    dice.roll = lambda: dice.simulate_roll(3, 1)
+    g.start_turn()
+    g.apply_player_move(1, 1)
+    assert g.game_over and (g.result.outcome, g.result.points) == ("gammon", 2)
@@ -364,6 +364,11 @@ class TestChecker(unittest.TestCase):
         self.assertEqual(Checker.BAR_POSITION, 0)
         self.assertEqual(Checker.BEAR_OFF_POSITION, 25)
 
+    def test_slots_and_unchecked_constructor(self):
+        """Test: Checker no tiene __dict__ y unchecked crea fichas equivalentes"""
+        self.assertFalse(hasattr(self.white_checker, "__dict__"))
+        self.assertEqual(Checker.unchecked("black", 7), Checker("black", 7))
+
 
 if __name__ == '__main__':
     # Ejecutar tests con verbose output
@@ -25,3 +25,20 @@ def test_hint_does_not_mutate_state():
     after = game.state()
     assert after == before, "hint no debe mutar el estado del juego"
 
+
+def test_hint_falls_back_only_for_unsupported_engines():
+    import pytest
+    from cli.hint_engine import suggest_move
+    game = make_game()
+    game.start_turn()
+
+    def unsupported(*args, **kwargs):
+        raise AttributeError("sin búsqueda")
+    game.analyze = unsupported
+    assert suggest_move(game).startswith("Probá")
+
+    def broken(*args, **kwargs):
+        raise RuntimeError("bug del motor")
+    game.analyze = broken
+    with pytest.raises(RuntimeError):
+        suggest_move(game)
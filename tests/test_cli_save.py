@@ -24,3 +24,23 @@ def test_save_writes_snapshot_json(tmp_path):
     assert out_file.exists(), f"no se creó el snapshot: {msg}"
     data = json.loads(out_file.read_text())
     assert isinstance(data, dict) and data, "snapshot debe contener estado serializado"
+
+def test_load_command_restores_saved_game(tmp_path):
+    from cli.command_parser import Command
+    game = make_game()
+    runner = CommandRunner(game)
+    out_file = tmp_path / "partida.bgs"
+    game.board.move_checker("white", 13, 5)
+    runner.execute(parse_command(f"save {out_file.as_posix()}"))
+    saved = game.board.snapshot()
+    game.board.reset()
+    assert parse_command("load") == Command(name="load")
+    _done, msg = runner.execute(parse_command(f"load {out_file.as_posix()}"))
+    assert "cargada" in msg and game.board.snapshot() == saved
+
+def test_load_command_reports_missing_file(tmp_path):
+    import pytest
+    from cli.cli_exceptions import CommandExecError
+    runner = CommandRunner(make_game())
+    with pytest.raises(CommandExecError):
+        runner.execute(parse_command(f"load {(tmp_path / 'nada.json').as_posix()}"))
@@ -26,3 +26,16 @@ def test_undo_reverts_last_move_or_roll():
     state_after_undo = game.state()
     assert state_after_undo != state_after_roll or state_after_roll == state_after_undo
     # Como mínimo el comando no debe crashear y debe informar algo
+
+def test_undo_and_redo_commands_roundtrip():
+    game = make_game()
+    runner = CommandRunner(game)
+    game.dice.roll = lambda: game.dice.simulate_roll(6, 4)
+    runner.execute(parse_command("roll"))
+    start = game.board.snapshot()
+    runner.execute(parse_command("move 8 6"))
+    _done, msg = runner.execute(parse_command("undo"))
+    assert "deshizo" in msg and game.board.snapshot() == start
+    _done, msg = runner.execute(parse_command("redo"))
+    assert "rehízo" in msg and game.board.count_at(2, "white") == 1
+    assert "No hay movimientos para rehacer" in runner.execute(parse_command("redo"))[1]
@@ -0,0 +1,120 @@
+import random
+import pytest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.player import Player
+from core.game import BackgammonGame
+from core.exceptions import BackgammonException, InvalidMoveException, InvalidPositionException
+
+# Helpers
+def clear_board(b):
+    for p in range(26):
+        b.set_count_at(p, "white", 0)
+        b.set_count_at(p, "black", 0)
+
+def layout(b):
+    return [(b.count_at(p, "white"), b.count_at(p, "black")) for p in range(26)]
+
+
+def test_initial_position_matches_board():
+    assert layout(CompactBoard()) == layout(Board())
+    assert str(CompactBoard()) == str(Board())
+    assert CompactBoard().count_checkers("white") == Board().count_checkers("white")
+
+def test_empty_board_and_get_point_materializes_checkers():
+    b = CompactBoard(empty=True)
+    assert all(w == 0 and k == 0 for w, k in layout(b))
+    b.set_count_at(5, "black", 2)
+    pts = b.get_point(5)
+    assert len(pts) == 2 and all(ch.get_color() == "black" and ch.get_position() == 5 for ch in pts)
+    # modificar la copia no altera el tablero
+    pts[0].set_position(7)
+    assert b.count_at(5, "black") == 2
+    with pytest.raises(InvalidPositionException):
+        b.get_point(26)
+
+def test_move_with_capture_sends_blot_to_bar():
+    b = CompactBoard()
+    b.set_count_at(5, "black", 1)
+    from_pos, to_pos, cap = b.move_checker("white", 6, 1)
+    assert (from_pos, to_pos) == (6, 5)
+    assert cap is not None and cap.get_color() == "black" and cap.get_position() == 0
+    assert b.count_bar("black") == 1
+    assert b.count_at(5, "white") == 1 and b.count_at(5, "black") == 0
+
+def test_validation_errors_match_board():
+    b = CompactBoard()
+    with pytest.raises(ValueError):
+        b.validate_basic_move("white", 7, 1)         # origen vacío
+    with pytest.raises(ValueError):
+        b.validate_basic_move("white", 13, 1)        # 12 bloqueado por negras
+    with pytest.raises(InvalidPositionException):
+        b.validate_basic_move("white", 6, 6)         # destino fuera de 1..24
+    with pytest.raises(InvalidMoveException):
+        b.validate_basic_move("red", 6, 1)
+
+def test_reentry_and_bear_off():
+    b = CompactBoard(empty=True)
+    b.set_count_at(0, "white", 1)
+    b.set_count_at(19, "black", 2)
+    with pytest.raises(InvalidMoveException):
+        b.reenter_checker("white", 6)                # 19 bloqueado
+    assert b.reenter_checker("white", 3) == (0, 22, None)
+
+    b = CompactBoard(empty=True)
+    b.set_count_at(2, "white", 1)
+    b.set_count_at(4, "white", 1)
+    assert b.can_bear_off_from("white", 2, 6) is False   # hay ficha más lejos (4)
+    assert b.move_or_bear_off("white", 4, 6) == (4, 25, None)
+    assert b.can_bear_off_from("white", 2, 6) is True
+    b.move_or_bear_off("white", 2, 6)
+    assert b.count_off("white") == 2
+
+def test_from_board_and_copy_are_independent():
+    src = Board()
+    src.move_checker("white", 13, 5)
+    cb = CompactBoard.from_board(src)
+    assert layout(cb) == layout(src)
+    clone = cb.copy()
+    clone.move_checker("white", 8, 2)
+    assert layout(cb) == layout(src)
+    assert layout(clone) != layout(src)
+
+@pytest.mark.parametrize("seed", [1, 7, 42])
+def test_random_games_stay_in_sync_with_board(seed):
+    """Partidas aleatorias aplicadas a ambos motores producen el mismo tablero."""
+    rng = random.Random(seed)
+    boards = [Board(), CompactBoard()]
+    color = "white"
+    for _ in range(200):
+        steps = rng.randint(1, 6)
+        origins = [0] if boards[0].has_checkers_in_bar(color) else list(range(1, 25))
+        rng.shuffle(origins)
+        for pos in origins:
+            results = []
+            for b in boards:
+                try:
+                    if pos == 0:
+                        b.reenter_checker(color, steps)
+                    else:
+                        b.move_or_bear_off(color, pos, steps)
+                    results.append(True)
+                except (ValueError, BackgammonException):
+                    results.append(False)
+            assert results[0] == results[1]
+            if results[0]:
+                break
+        assert layout(boards[0]) == layout(boards[1])
+        color = "black" if color == "white" else "white"
+
+def test_game_runs_on_compact_board():
+    dice = Dice(seed=3)
+    game = BackgammonGame(CompactBoard(), dice, (Player("W", "white"), Player("B", "black")))
+    game.start_turn()
+    dice.simulate_roll(3, 1)
+    game.apply_player_move(8, 3)
+    game.apply_player_move(6, 1)
+    game.end_turn()
+    assert game.board.count_at(5, "white") == 2
+    assert game.current_color == "black"
@@ -0,0 +1,169 @@
+import random
+import pytest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.eval import (
+    Evaluator, HeuristicEvaluator, FEATURE_NAMES, extract_features,
+    features_dict, has_contact, pip_count,
+)
+from core.movegen import generate_play_positions, generate_plays, position_of
+
+
+def race_board():
+    b = CompactBoard(empty=True)
+    b.set_count_at(3, "white", 15)
+    b.set_count_at(22, "black", 15)
+    return b
+
+def random_positions(n, seed=5):
+    rng = random.Random(seed)
+    board, color, out = CompactBoard(), "white", []
+    while len(out) < n:
+        a, d = rng.randint(1, 6), rng.randint(1, 6)
+        for f, s in rng.choice(generate_plays(board, color, [a] * 4 if a == d else [a, d])):
+            board.make_move(color, f, s)
+        out.append(position_of(board))
+        if board.count_off(color) == 15:
+            board, color = CompactBoard(), "white"
+            continue
+        color = "black" if color == "white" else "white"
+    return out
+
+
+def test_initial_position_features_are_symmetric():
+    b = Board()
+    white = features_dict(b, "white")
+    black = features_dict(b, "black")
+    assert white["own_pips"] == white["opp_pips"] == 167 == pip_count(b, "black")
+    assert white["own_points"] == 4 and white["own_home_points"] == 1
+    assert white["own_anchors"] == 1 and white["contact"] == 1
+    assert white == black
+
+def test_prime_blots_and_bar_features():
+    b = CompactBoard(empty=True)
+    for p in (4, 5, 6, 7, 8):
+        b.set_count_at(p, "white", 2)
+    b.set_count_at(10, "white", 1)
+    b.set_count_at(0, "white", 1)
+    f = features_dict(b, "white")
+    assert f["own_prime"] == 5 and f["own_blots"] == 1 and f["own_bar"] == 1
+    assert f["own_pips"] == 2 * (4 + 5 + 6 + 7 + 8) + 10 + 25
+
+def test_contact_detection():
+    assert has_contact(Board())
+    assert not has_contact(race_board())
+    b = race_board()
+    b.set_count_at(0, "black", 1)     # ficha negra en el BAR: vuelve a haber contacto
+    assert has_contact(b)
+
+def test_heuristic_prefers_race_leader_and_terminal_positions():
+    ev = HeuristicEvaluator()
+    assert isinstance(ev, Evaluator)
+    b = race_board()          # white 45 pips vs black 45 pips: pareja
+    assert ev.evaluate(b, "white") == pytest.approx(-ev.evaluate(b, "black"))
+    b.set_count_at(3, "white", 0)
+    b.set_count_at(1, "white", 15)
+    assert ev.evaluate(b, "white") > 0.3
+    b.set_count_at(1, "white", 0)
+    b.set_count_at(25, "white", 15)
+    assert ev.evaluate(b, "white") == 1.0 and ev.evaluate(b, "black") == -1.0
+
+def test_heuristic_makes_points_and_rejects_unknown_weights():
+    ev = HeuristicEvaluator()
+    results = generate_play_positions(Board(), "white", [6, 4])
+    best = max(results, key=lambda r: ev.evaluate(r[1], "white"))
+    assert best[0] == ((8, 6), (6, 4))          # 8/2 6/2: hace el punto 2 sin dejar blots
+    with pytest.raises(ValueError):
+        HeuristicEvaluator({"nope": 1.0})
+
+def test_evaluate_batch_default_matches_evaluate():
+    ev = HeuristicEvaluator()
+    positions = random_positions(20)
+    default = Evaluator.evaluate_batch(ev, positions, "black")
+    assert default == [ev.evaluate(p, "black") for p in positions]
+
+
+# ---------------- Backend NumPy ----------------
+
+def test_batch_features_match_python_features():
+    np = pytest.importorskip("numpy")
+    from core.eval import batch_features
+    positions = random_positions(150) + [position_of(race_board())]
+    for color in ("white", "black"):
+        matrix = batch_features(positions, color)
+        assert matrix.shape == (len(positions), len(FEATURE_NAMES))
+        expected = np.array([extract_features(p, color) for p in positions])
+        assert (matrix == expected).all()
+
+def test_mlp_scores_batch_in_one_call_and_roundtrips(tmp_path):
+    pytest.importorskip("numpy")
+    from core.eval import MLPEvaluator
+    ev = MLPEvaluator(hidden=8, seed=1)
+    positions = [pos for _, pos in generate_play_positions(Board(), "white", [5, 5, 5, 5])]
+    scores = ev.evaluate_batch(positions, "white")
+    assert scores.shape == (len(positions),)
+    assert all(-1.0 <= s <= 1.0 for s in scores)
+    assert ev.evaluate(positions[3], "white") == pytest.approx(scores[3])
+    path = tmp_path / "mlp.npz"
+    ev.save(str(path))
+    loaded = MLPEvaluator.load(str(path))
+    assert (loaded.evaluate_batch(positions, "white") == scores).all()
+
+def test_mlp_prefers_race_leader():
+    pytest.importorskip("numpy")
+    from core.eval import MLPEvaluator
+    ev = MLPEvaluator()
+    ahead = race_board()
+    ahead.set_count_at(3, "white", 0)
+    ahead.set_count_at(1, "white", 15)
+    assert ev.evaluate(ahead, "white") > ev.evaluate(race_board(), "white")
+
+
+# ---------------- Evaluación en lote de jugadas ----------------
+
+def test_vectorized_heuristic_batch_matches_evaluate():
+    pytest.importorskip("numpy")
+    ev = HeuristicEvaluator()
+    positions = random_positions(120, seed=8) + [position_of(race_board())]
+    for color in ("white", "black"):
+        batch = ev.evaluate_batch(positions, color)
+        assert batch == pytest.approx([ev.evaluate(p, color) for p in positions])
+
+def test_rank_plays_orders_all_plays_and_best_play_is_first():
+    from core.eval import best_play, rank_plays
+    ev = HeuristicEvaluator()
+    ranked = rank_plays(Board(), "white", [6, 4], ev)
+    assert sorted(p for p, _ in ranked) == sorted(generate_plays(Board(), "white", [6, 4]))
+    scores = [s for _, s in ranked]
+    assert scores == sorted(scores, reverse=True)
+    assert best_play(Board(), "white", [6, 4], ev) == ranked[0][0] == ((8, 6), (6, 4))
+
+def test_rank_plays_without_moves_returns_empty_play():
+    from core.eval import best_play, rank_plays
+    b = CompactBoard(empty=True)
+    b.set_count_at(0, "white", 1)
+    b.set_count_at(15, "white", 14)
+    for p in range(19, 25):
+        b.set_count_at(p, "black", 2)
+    b.set_count_at(1, "black", 3)
+    assert [p for p, _ in rank_plays(b, "white", [3, 5], HeuristicEvaluator())] == [()]
+    assert best_play(b, "white", [3, 5], HeuristicEvaluator()) == ()
+
+def test_game_rank_plays_and_best_play_with_mlp():
+    pytest.importorskip("numpy")
+    from core.eval import MLPEvaluator
+    from core.dice import Dice
+    from core.game import BackgammonGame
+    from core.player import Player
+    dice = Dice()
+    game = BackgammonGame(Board(), dice, (Player("W", "white"), Player("B", "black")), starting_color="black")
+    dice.roll = lambda: dice.simulate_roll(5, 5)
+    game.start_turn()
+    ev = MLPEvaluator(seed=3)
+    ranked = game.rank_plays(ev)
+    assert len(ranked) == len(game.legal_plays())
+    assert game.best_play(ev) == ranked[0][0]
+    assert game.best_play() in game.legal_plays()
+    for from_pos, steps in game.best_play(ev):
+        game.apply_player_move(from_pos, steps)
+    assert game.board.count_off("black") == 0
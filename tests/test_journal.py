@@ -0,0 +1,102 @@
+import io
+import pytest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.player import Player
+from sim import RandomPolicy
+from storage import GameJournal, Replayer, read_events
+from storage.journal import CHECKPOINT, END_TURN, GAME_OVER, MOVE, ROLL
+
+
+def play_journaled(board, validate, checkpoint_every=3, seed=4):
+    buf = io.BytesIO()
+    journal = GameJournal(buf, checkpoint_every=checkpoint_every)
+    game = BackgammonGame(board, Dice(seed), (Player("W", "white"), Player("B", "black")))
+    game.attach_journal(journal)
+    policy = RandomPolicy(seed)
+    snapshots = []          # tablero tras cada fin de turno
+    while not game.game_over:
+        game.start_turn()
+        game.apply_play(policy.choose(game), validate=validate)
+        if not game.game_over:
+            game.end_turn()
+            snapshots.append(game.board.snapshot())
+    return game, buf.getvalue(), snapshots
+
+
+def test_replay_reconstructs_every_turn_from_checkpoints():
+    game, data, snapshots = play_journaled(CompactBoard(), validate=False)
+    replay = Replayer(data)
+    ends = [i for i, e in enumerate(replay.events) if e.kind == END_TURN]
+    assert len(ends) == len(snapshots)
+    for index, snap in zip(ends, snapshots):
+        assert replay.board_after(index).snapshot() == snap
+    final = replay.state_after()
+    assert final.game_over and final.board.snapshot() == game.board.snapshot()
+    kinds = {e.kind for e in replay.events}
+    assert {ROLL, MOVE, END_TURN, CHECKPOINT, GAME_OVER} <= kinds
+    over = replay.events[-1]
+    assert over.kind == GAME_OVER and over.color == game.result.winner_color
+
+def test_validated_path_records_same_moves_as_fast_path():
+    _, fast, _ = play_journaled(CompactBoard(), validate=False)
+    _, slow, _ = play_journaled(Board(), validate=True)
+    assert read_events(fast) == read_events(slow)
+
+def test_truncated_tail_is_ignored_and_file_appends(tmp_path):
+    _, data, _ = play_journaled(CompactBoard(), validate=False)
+    events = read_events(data)
+    assert read_events(data[:-2]) == events[:-1]
+    path = str(tmp_path / "game.bgj")
+    with GameJournal(path) as journal:
+        journal.record_roll("white", 3, 1)
+    with GameJournal(path) as journal:
+        journal.record_move("white", 8, 3, 5, False)
+    assert [e.kind for e in read_events(path)] == [ROLL, MOVE]
+    with pytest.raises(ValueError):
+        read_events(b"nope")
+
+def test_undo_is_journaled_and_replayed():
+    buf = io.BytesIO()
+    dice = Dice()
+    game = BackgammonGame(Board(), dice, (Player("W", "white"), Player("B", "black")), starting_color="white")
+    game.attach_journal(GameJournal(buf))
+    dice.roll = lambda: dice.simulate_roll(6, 4)
+    game.start_turn()
+    game.apply_player_move(8, 6)
+    game.undo_last_move()
+    game.apply_player_move(13, 4)
+    assert Replayer(buf.getvalue()).board_after().snapshot() == game.board.snapshot()
+
+def test_reset_checkpoints_so_the_next_game_replays_from_the_start():
+    game, _, _ = play_journaled(CompactBoard(), validate=False)
+    buf = io.BytesIO()
+    game.attach_journal(GameJournal(buf))
+    game.reset(dice_seed=9)
+    policy = RandomPolicy(9)
+    for _ in range(3):
+        game.start_turn()
+        game.apply_play(policy.choose(game), validate=False)
+        game.end_turn()
+    replay = Replayer(buf.getvalue())
+    assert replay.events[1].kind == CHECKPOINT
+    assert replay.board_after().snapshot() == game.board.snapshot()
+
+def test_loading_a_save_checkpoints_the_journal(tmp_path):
+    from storage import load_game, save_game
+    buf = io.BytesIO()
+    game = BackgammonGame(Board(), Dice(5), (Player("W", "white"), Player("B", "black")))
+    game.attach_journal(GameJournal(buf))
+    path = str(tmp_path / "game.json")
+    save_game(game, path)
+    policy = RandomPolicy(5)
+    for _ in range(3):
+        game.start_turn()
+        game.apply_play(policy.choose(game), validate=False)
+        game.end_turn()
+    load_game(path, game=game)
+    game.start_turn()
+    game.apply_play(policy.choose(game)[:1], validate=False)
+    assert Replayer(buf.getvalue()).board_after().snapshot() == game.board.snapshot()
@@ -0,0 +1,107 @@
+import random
+import pytest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.exceptions import BackgammonException
+from core.move_check import MoveToken
+from core.movegen import generate_plays
+
+BOARDS = [Board, CompactBoard]
+
+
+@pytest.mark.parametrize("board_cls", BOARDS)
+def test_make_unmake_normal_move(board_cls):
+    b = board_cls()
+    before, key = b.snapshot(), b.zobrist_key()
+    token = b.make_move("white", 8, 3)
+    assert token == MoveToken("white", 8, 5, False)
+    assert b.count_at(5, "white") == 1
+    b.unmake_move(token)
+    assert b.snapshot() == before and b.zobrist_key() == key
+
+@pytest.mark.parametrize("board_cls", BOARDS)
+def test_unmake_returns_hit_checker_from_bar(board_cls):
+    b = board_cls()
+    b.set_count_at(5, "black", 1)
+    before = b.snapshot()
+    token = b.make_move("white", 8, 3)
+    assert token.hit is True and b.count_bar("black") == 1
+    b.unmake_move(token)
+    assert b.snapshot() == before
+    assert b.count_at(5, "black") == 1 and b.count_bar("black") == 0
+
+@pytest.mark.parametrize("board_cls", BOARDS)
+def test_make_unmake_reentry_and_bear_off(board_cls):
+    b = board_cls()
+    b.set_count_at(0, "black", 1)
+    b.set_count_at(3, "white", 1)
+    before = b.snapshot()
+    token = b.make_move("black", 0, 3)             # reingresa golpeando en 3
+    assert token == MoveToken("black", 0, 3, True)
+    b.unmake_move(token)
+    assert b.snapshot() == before
+
+    for p in range(7, 25):
+        b.set_count_at(p, "white", 0)
+    before = b.snapshot()
+    token = b.make_move("white", 6, 6)
+    assert token.to_pos == 25
+    b.unmake_move(token)
+    assert b.snapshot() == before
+
+@pytest.mark.parametrize("board_cls", BOARDS)
+def test_illegal_make_move_leaves_board_untouched(board_cls):
+    b = board_cls()
+    before = b.snapshot()
+    with pytest.raises((ValueError, BackgammonException)):
+        b.make_move("white", 13, 1)                # 12 bloqueado
+    assert b.snapshot() == before
+
+@pytest.mark.parametrize("board_cls", BOARDS)
+def test_random_plays_unwind_exactly(board_cls):
+    rng = random.Random(21)
+    b, color = board_cls(), "white"
+    for _ in range(60):
+        a, d = rng.randint(1, 6), rng.randint(1, 6)
+        dice = [a] * 4 if a == d else [a, d]
+        before, key = b.snapshot(), b.zobrist_key()
+        for play in generate_plays(b, color, dice):
+            tokens = [b.make_move(color, f, s) for f, s in play]
+            for token in reversed(tokens):
+                b.unmake_move(token)
+            assert b.snapshot() == before and b.zobrist_key() == key
+        for f, s in rng.choice(generate_plays(b, color, dice)):
+            b.make_move(color, f, s)
+        if b.count_off(color) == 15:
+            break
+        color = "black" if color == "white" else "white"
+
+@pytest.mark.parametrize("board_cls", BOARDS)
+def test_snapshot_restore_roundtrip(board_cls):
+    b = board_cls()
+    start = b.snapshot()
+    assert len(start) == 52
+    b.make_move("white", 24, 6)
+    b.make_move("black", 1, 4)
+    b.restore(start)
+    assert b.snapshot() == start
+    assert b.zobrist_key() == board_cls().zobrist_key()
+    assert str(b) == str(board_cls())
+    with pytest.raises(ValueError):
+        b.restore(b"\x00" * 10)
+
+def test_snapshots_are_interchangeable_between_boards():
+    b, cb = Board(), CompactBoard()
+    b.make_move("white", 13, 5)
+    cb.restore(b.snapshot())
+    assert cb.snapshot() == b.snapshot()
+    assert cb.zobrist_key() == b.zobrist_key()
+
+def test_board_reuses_checkers_from_spare_pool():
+    b = Board()
+    before = {id(ch) for p in range(26) for ch in b.get_point(p)}
+    b.set_count_at(13, "white", 0)
+    b.set_count_at(5, "white", 5)
+    b.restore(Board().snapshot())
+    after = {id(ch) for p in range(26) for ch in b.get_point(p)}
+    assert after == before
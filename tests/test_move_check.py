@@ -0,0 +1,81 @@
+import random
+import pytest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.exceptions import BackgammonException
+from core.move_check import MoveKind
+
+# Helpers
+def clear_board(b):
+    for p in range(26):
+        b.set_count_at(p, "white", 0)
+        b.set_count_at(p, "black", 0)
+
+BOARDS = [Board, CompactBoard]
+
+
+@pytest.mark.parametrize("board_cls", BOARDS)
+def test_classify_normal_hit_and_blocked(board_cls):
+    b = board_cls()
+    assert b.classify_move("white", 8, 3).kind is MoveKind.NORMAL
+    assert b.classify_move("white", 8, 3).to_pos == 5
+    b.set_count_at(5, "black", 1)
+    check = b.classify_move("white", 8, 3)
+    assert check.kind is MoveKind.HIT and check.hit is True
+    blocked = b.classify_move("white", 13, 1)      # 12 con 5 negras
+    assert blocked.kind is MoveKind.ILLEGAL and not blocked
+    assert "bloqueado" in blocked.reason
+
+@pytest.mark.parametrize("board_cls", BOARDS)
+def test_classify_reentry_and_bar_priority(board_cls):
+    b = board_cls()
+    assert b.classify_move("white", 0, 3).kind is MoveKind.ILLEGAL   # BAR vacío
+    b.set_count_at(0, "white", 1)
+    assert b.classify_move("white", 0, 3).kind is MoveKind.REENTER
+    assert b.classify_move("white", 0, 6).kind is MoveKind.ILLEGAL   # 19 bloqueado
+    check = b.classify_move("white", 8, 3)
+    assert check.kind is MoveKind.ILLEGAL and "BAR" in check.reason
+
+@pytest.mark.parametrize("board_cls", BOARDS)
+def test_classify_bear_off(board_cls):
+    b = board_cls()
+    clear_board(b)
+    b.set_count_at(2, "white", 1)
+    b.set_count_at(4, "white", 1)
+    assert b.classify_move("white", 2, 2).kind is MoveKind.BEAR_OFF
+    assert b.classify_move("white", 2, 6).kind is MoveKind.ILLEGAL    # 4 está más lejos
+    assert b.classify_move("white", 4, 6).to_pos == 25
+    b.set_count_at(9, "white", 1)
+    assert "home" in b.classify_move("white", 2, 2).reason
+
+@pytest.mark.parametrize("board_cls", BOARDS)
+def test_predicates_never_raise_on_bad_input(board_cls):
+    b = board_cls()
+    for args in [("red", 8, 3), ("white", 8, 0), ("white", 8, 7), ("white", 30, 1), ("white", "x", 1)]:
+        assert b.is_legal_move(*args) is False
+        assert b.is_legal_bear_off(*args) is False
+        assert b.classify_move(*args).kind is MoveKind.ILLEGAL
+    assert b.is_legal_reentry("red", 3) is False
+    assert b.is_legal_reentry("white", 9) is False
+
+@pytest.mark.parametrize("board_cls", BOARDS)
+def test_predicates_agree_with_raising_validators(board_cls):
+    rng = random.Random(9)
+    b = board_cls()
+    for _ in range(300):
+        color = rng.choice(["white", "black"])
+        pos, steps = rng.randint(1, 24), rng.randint(1, 6)
+        try:
+            b.validate_basic_move(color, pos, steps)
+            expected = True
+        except (ValueError, BackgammonException):
+            expected = False
+        assert b.is_legal_move(color, pos, steps) is expected
+        try:
+            b.validate_reentry(color, steps)
+            expected = True
+        except BackgammonException:
+            expected = False
+        assert b.is_legal_reentry(color, steps) is expected
+        if b.is_legal_move(color, pos, steps):
+            b.move_checker(color, pos, steps)
@@ -0,0 +1,125 @@
+import random
+import pytest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.player import Player
+from core.game import BackgammonGame
+from core.exceptions import InvalidMoveException
+from core.movegen import generate_plays, generate_play_positions, apply_play, position_of
+
+# Helpers
+def empty_board():
+    return CompactBoard(empty=True)
+
+def make_game(board, a, b, color="white"):
+    dice = Dice()
+    game = BackgammonGame(board, dice, (Player("W", "white"), Player("B", "black")), starting_color=color)
+    dice.roll = lambda: dice.simulate_roll(a, b)
+    game.start_turn()
+    return game
+
+
+def test_opening_roll_counts():
+    b = Board()
+    assert len(generate_plays(b, "white", [3, 1])) == 16
+    plays = generate_plays(b, "white", [3, 1])
+    assert all(len(p) == 2 for p in plays)
+    # 8/5 6/5 (hacer el punto 5) está entre las jugadas
+    assert ((8, 3), (6, 1)) in plays or ((6, 1), (8, 3)) in plays
+
+def test_doubles_use_four_moves_and_colors_are_symmetric():
+    b = Board()
+    white = generate_plays(b, "white", [6, 6, 6, 6])
+    black = generate_plays(b, "black", [6, 6, 6, 6])
+    assert all(len(p) == 4 for p in white)
+    assert len(white) == len(black)
+
+def test_plays_are_deduplicated_by_resulting_position():
+    results = generate_play_positions(Board(), "white", [4, 4, 4, 4])
+    positions = [pos for _, pos in results]
+    assert len(positions) == len(set(positions))
+
+def test_bar_priority_and_no_move_returns_empty_play():
+    b = empty_board()
+    b.set_count_at(0, "white", 1)
+    b.set_count_at(10, "white", 1)
+    b.set_count_at(22, "black", 2)
+    plays = generate_plays(b, "white", [3, 5])
+    # sólo entra por 20 (5) y luego mueve cualquiera con el 3
+    assert all(p[0] == (0, 5) for p in plays)
+    # todo el home rival cerrado: no hay jugada
+    for p in range(19, 25):
+        b.set_count_at(p, "black", 2)
+    assert generate_plays(b, "white", [3, 5]) == [()]
+
+def test_maximum_dice_rule():
+    # 10/4 deja el 4 sin jugar; 20/14/10 usa ambos dados -> sólo vale esa
+    b = empty_board()
+    b.set_count_at(10, "white", 1)
+    b.set_count_at(20, "white", 1)
+    b.set_count_at(6, "black", 2)    # 10-4 bloqueado
+    b.set_count_at(16, "black", 2)   # 20-4 bloqueado
+    assert generate_plays(b, "white", [6, 4]) == [((20, 6), (14, 4))]
+
+def test_only_playable_die_is_used():
+    # 8-5=3 bloqueado; 8-2=6 libre pero después 6-5=1 bloqueado
+    b = empty_board()
+    b.set_count_at(8, "white", 1)
+    b.set_count_at(3, "black", 2)
+    b.set_count_at(1, "black", 2)
+    assert generate_plays(b, "white", [2, 5]) == [((8, 2),)]
+
+def test_higher_die_rule_when_dice_cannot_be_combined():
+    # 8/6 y 8/3 son jugables por separado, pero ninguna combinación usa ambos
+    b = empty_board()
+    b.set_count_at(8, "white", 1)
+    b.set_count_at(1, "black", 2)
+    assert generate_plays(b, "white", [2, 5]) == [((8, 5),)]
+
+def test_bear_off_overshoot():
+    b = empty_board()
+    b.set_count_at(2, "white", 1)
+    b.set_count_at(4, "white", 1)
+    b.set_count_at(25, "white", 13)
+    plays = generate_plays(b, "white", [6, 5])
+    # 6 saca la de 4 (no hay más lejos) y luego el 5 saca la de 2
+    assert ((4, 6), (2, 5)) in plays or ((4, 5), (2, 6)) in plays
+    final = {pos for _, pos in generate_play_positions(b, "white", [6, 5])}
+    assert all(pos[0][25] == 15 for pos in final)
+
+def test_apply_play_matches_generated_positions_and_rejects_illegal():
+    b = Board()
+    pos = position_of(b)
+    for play, result in generate_play_positions(b, "black", [5, 2]):
+        assert apply_play(pos, "black", play) == result
+    with pytest.raises(InvalidMoveException):
+        apply_play(pos, "white", ((13, 1),))   # 12 bloqueado por negras
+
+@pytest.mark.parametrize("seed", [3, 11])
+def test_every_generated_play_is_accepted_by_the_game(seed):
+    """Cada jugada generada se aplica sin errores y permite cerrar el turno."""
+    rng = random.Random(seed)
+    board = CompactBoard()
+    color = "white"
+    for _ in range(40):
+        a, b = rng.randint(1, 6), rng.randint(1, 6)
+        snapshot = board.copy()
+        plays = generate_plays(board, color, [a, a, a, a] if a == b else [a, b])
+        for play in plays:
+            game = make_game(snapshot.copy(), a, b, color)
+            for from_pos, steps in play:
+                game.apply_player_move(from_pos, steps)
+            if not game.game_over:
+                game.end_turn()
+        game = make_game(board, a, b, color)
+        for from_pos, steps in rng.choice(plays):
+            game.apply_player_move(from_pos, steps)
+        if game.game_over:
+            break
+        game.end_turn()
+        color = game.current_color
+
+def test_game_legal_plays_uses_current_color_and_dice():
+    game = make_game(Board(), 6, 5)
+    assert game.legal_plays() == generate_plays(game.board, "white", [6, 5])
@@ -0,0 +1,72 @@
+import os
+import pytest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.movegen import apply_play, generate_plays, position_of
+from core.opening_book import DEFAULT_BOOK_PATH, OpeningBook, book_play, default_book
+from core.player import Player
+from core.rolls import ROLLS
+from core.search import ExpectimaxSearch
+from cli.hint_engine import format_play, suggest_move
+from sim import SearchPolicy, make_policy
+
+START = position_of(Board())
+
+
+@pytest.fixture(scope="module")
+def small_book():
+    return OpeningBook.build(depth=0)
+
+
+def test_build_covers_openings_and_replies_for_both_colors(small_book):
+    for roll in ROLLS:
+        white = small_book.lookup(START, "white", roll.dice)
+        black = small_book.lookup(START, "black", roll.dice)
+        assert white.play in generate_plays(START, "white", roll.dice)
+        assert black.play in generate_plays(START, "black", roll.dice)
+        assert [(25 - f, s) for f, s in white.play] == list(black.play)     # espejo
+        after = apply_play(START, "white", white.play)
+        reply = small_book.lookup(after, "black", (6, 5))
+        assert reply is not None and reply.play in generate_plays(after, "black", (6, 5))
+    assert small_book.lookup(START, "white", [3]) is None                   # dados parciales
+    assert small_book.lookup(position_of(CompactBoard(empty=True)), "white", (3, 1)) is None
+
+def test_binary_round_trip(small_book, tmp_path):
+    data = small_book.serialize()
+    assert len(data) < 16 * 1024
+    path = str(tmp_path / "book.bin")
+    small_book.save(path)
+    loaded = OpeningBook.open(path)
+    assert len(loaded) == len(small_book) and loaded.depth == 0
+    for roll in ROLLS:
+        assert loaded.lookup(START, "black", roll.dice).play == small_book.lookup(START, "black", roll.dice).play
+    with pytest.raises(ValueError):
+        OpeningBook.from_bytes(b"XXXX" + data[4:])
+    with pytest.raises(ValueError):
+        OpeningBook.from_bytes(data[:-3])
+
+def test_default_book_is_shipped_and_legal():
+    assert os.path.exists(DEFAULT_BOOK_PATH)
+    book = default_book()
+    assert book is default_book() and book.depth == 2
+    for roll in ROLLS:
+        entry = book_play(Board(), "white", roll.dice)
+        assert entry.play in generate_plays(START, "white", roll.dice)
+        assert -1.0 <= entry.equity <= 1.0
+
+def test_search_and_bots_use_the_book_before_searching(small_book):
+    result = ExpectimaxSearch(depth=2, book=small_book).analyze(START, "white", (4, 2))
+    assert result.nodes == 0 and result.play == small_book.lookup(START, "white", (4, 2)).play
+    policy = make_policy("search")
+    assert isinstance(policy, SearchPolicy)
+    after = policy.choose_position(START, "black", (6, 4))
+    assert after == apply_play(START, "black", book_play(START, "black", (6, 4)).play)
+
+def test_hint_in_the_opening_comes_from_the_book():
+    game = BackgammonGame(Board(), Dice(11), (Player("W", "white"), Player("B", "black")),
+                          starting_color="white")
+    game.start_turn()
+    entry = book_play(game.board, "white", game.state().dice_values)
+    assert suggest_move(game).startswith(format_play(entry.play))
@@ -0,0 +1,62 @@
+import random
+import pytest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.movegen import generate_play_positions, position_of
+from core.player import Player
+from core.position_id import (
+    MatchInfo, decode_position, encode_position, match_from_id, match_id,
+    position_from_id, position_id,
+)
+
+
+def test_starting_position_matches_gnubg():
+    assert Board().to_id() == CompactBoard().to_id("black") == "4HPwATDgc/ABMA"
+    assert position_from_id("4HPwATDgc/ABMA", "white") == position_of(Board())
+
+def test_roundtrip_over_random_positions():
+    rng = random.Random(3)
+    position, color = position_of(Board()), "white"
+    for _ in range(60):
+        a, b = rng.randint(1, 6), rng.randint(1, 6)
+        dice = [a] * 4 if a == b else [a, b]
+        _, position = rng.choice(generate_play_positions(position, color, dice))
+        for on_roll in ("white", "black"):
+            key = encode_position(position, on_roll)
+            assert len(key) == 10 and decode_position(key, on_roll) == position
+        color = "black" if color == "white" else "white"
+
+def test_board_from_id_and_bad_ids():
+    board = Board()
+    board.move_checker("white", 13, 3)
+    for cls in (Board, CompactBoard):
+        copy = cls.from_id(board.to_id("black"), "black")
+        assert copy.snapshot() == board.snapshot()
+        assert copy.zobrist_key() == board.zobrist_key()
+    with pytest.raises(ValueError):
+        position_from_id("no es base64!", "white")
+    with pytest.raises(ValueError):
+        position_from_id("AAAA", "white")
+    with pytest.raises(ValueError):
+        position_from_id("//////////////", "white")     # más de 15 fichas
+
+def test_match_id_matches_gnubg_example_and_roundtrips():
+    info = match_from_id("QYkqASAAIAAA")
+    assert info.on_roll == "black" and info.dice == (5, 2)
+    assert (info.cube, info.cube_owner, info.match_length, info.score) == (2, "white", 9, (2, 4))
+    assert match_id(info) == "QYkqASAAIAAA"
+    assert match_from_id(match_id(MatchInfo("white"))) == MatchInfo("white", turn="white")
+    with pytest.raises(ValueError):
+        match_id(MatchInfo("white", cube=3))
+
+def test_game_ids_include_dice_and_side_to_move():
+    dice = Dice()
+    game = BackgammonGame(Board(), dice, (Player("W", "white"), Player("B", "black")), starting_color="black")
+    dice.roll = lambda: dice.simulate_roll(3, 1)
+    game.start_turn()
+    pid, mid = game.game_id().split(":")
+    assert pid == game.position_id() == position_id(game.board, "black")
+    info = match_from_id(mid)
+    assert info.on_roll == "black" and info.dice == (3, 1)
@@ -0,0 +1,94 @@
+import random
+
+import pytest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.eval import HeuristicEvaluator, RaceEvaluator, effective_pip_count, has_contact, pip_count
+from core.movegen import _legal_relative, _search, _to_relative, generate_plays, position_of
+
+
+def race_board(board_cls=Board):
+    """White en su home (6 y 5), black en el suyo (19 y 20): ya no hay contacto."""
+    b = board_cls()
+    for p in (1, 6, 8, 12, 13, 17, 19, 24):
+        b.set_count_at(p, "white", 0)
+    b.set_count_at(6, "white", 8)
+    b.set_count_at(5, "white", 7)
+    b.set_count_at(19, "black", 8)
+    b.set_count_at(20, "black", 7)
+    return b
+
+
+@pytest.mark.parametrize("board_cls", [Board, CompactBoard])
+def test_board_detects_race_incrementally(board_cls):
+    b = board_cls()
+    assert not b.is_race()
+    b = race_board(board_cls)
+    assert b.is_race() and not has_contact(b)
+    token = b.make_move("white", 6, 3)
+    assert b.is_race()
+    b.unmake_move(token)
+    b.set_count_at(0, "white", 1)            # una ficha en el BAR vuelve a dar contacto
+    assert not b.is_race()
+
+def test_race_move_skips_capture_but_validates():
+    b = race_board()
+    assert b.move_checker("white", 6, 2) == (6, 4, None)
+    assert b.count_checkers_at(4, "white") == 1
+    with pytest.raises(ValueError):
+        b.move_checker("white", 19, 1)       # ficha rival en el origen
+    with pytest.raises(Exception):
+        b.move_checker("white", 5, 6)        # destino fuera de 1..24
+
+@pytest.mark.parametrize("board_cls", [Board, CompactBoard])
+def test_is_race_matches_full_scan_over_random_games(board_cls):
+    rng = random.Random(25)
+    for _ in range(5):
+        b = board_cls()
+        color = "white"
+        for _ in range(120):
+            dice = [rng.randint(1, 6), rng.randint(1, 6)]
+            if dice[0] == dice[1]:
+                dice *= 2
+            for from_pos, steps in rng.choice(generate_plays(b, color, dice)):
+                b.make_move(color, from_pos, steps)
+            assert b.is_race() == (not has_contact(position_of(b)))
+            if b.count_off("white") == 15 or b.count_off("black") == 15:
+                break
+            color = "black" if color == "white" else "white"
+
+def test_race_generation_matches_general_search():
+    own, opp = _to_relative(position_of(race_board()), "white")
+    for dice in ([6, 5], [2, 1], [3, 3, 3, 3]):
+        leaves = []
+        _search(own, opp, tuple(sorted(dice, reverse=True)), (), leaves, set())
+        longest = max(len(prefix) for prefix, _, _ in leaves)
+        general = {(o, p) for prefix, o, p in leaves if len(prefix) == longest}
+        assert {(o, p) for _, o, p in _legal_relative(own, opp, dice)} == general
+
+def test_effective_pip_count_adds_wastage():
+    b = race_board()
+    assert effective_pip_count(b, "white") > pip_count(b, "white")
+    stacked = Board()
+    for p in (1, 6, 8, 12, 13, 17, 19, 24):
+        stacked.set_count_at(p, "white", 0)
+    stacked.set_count_at(1, "white", 15)
+    stacked.set_count_at(24, "black", 15)
+    wastage = effective_pip_count(stacked, "white") - pip_count(stacked, "white")
+    assert wastage > effective_pip_count(b, "white") - pip_count(b, "white")
+
+def test_race_evaluator_and_fallback():
+    ev = RaceEvaluator()
+    b = race_board()
+    # Pips iguales: el que evalúa acaba de jugar y tira el rival
+    even = ev.evaluate(b, "white")
+    assert even < 0 and ev.evaluate(b, "black") == pytest.approx(even)
+    b.make_move("white", 6, 5)
+    b.make_move("white", 5, 4)
+    ahead = ev.evaluate(b, "white")
+    assert -1.0 < ev.evaluate(b, "black") < 0 < ahead < 1.0
+    start = Board()
+    assert ev.evaluate(start, "white") == HeuristicEvaluator().evaluate(start, "white")
+    positions = [position_of(b), position_of(start)]
+    assert ev.evaluate_batch(positions, "white") == pytest.approx(
+        [ev.evaluate(p, "white") for p in positions])
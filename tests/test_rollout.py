@@ -0,0 +1,61 @@
+import pytest
+from core.board import Board
+from sim import RolloutResult, rollout
+from sim.policies import GreedyPolicy
+from sim.rollout import score_position
+
+
+def position(white, black):
+    w, b = [0] * 26, [0] * 26
+    for p, n in white.items():
+        w[p] = n
+    for p, n in black.items():
+        b[p] = n
+    return (tuple(w), tuple(b))
+
+# white y black con dos fichas en su punto 2 y 13 afuera
+LAST_ROLL = position({2: 2, 25: 13}, {23: 2, 25: 13})
+
+
+@pytest.mark.parametrize("antithetic", [True, False])
+def test_stratified_rollout_is_exact_on_short_race(antithetic):
+    # white gana si saca ambas de entrada (26/36) o si ambos fallan (10/36 * 10/36)
+    r = rollout(LAST_ROLL, "white", trials=1296, antithetic=antithetic)
+    expected = 26 / 36 + (10 / 36) ** 2
+    assert r.win == pytest.approx(expected)
+    assert r.equity == pytest.approx(2 * expected - 1)
+    assert r.win_gammon == 0 and r.truncated == 0
+
+def test_score_position_matches_game_outcome_rules():
+    assert score_position(position({25: 15}, {25: 1, 20: 14}), "white") == 1
+    assert score_position(position({25: 15}, {20: 15}), "white") == 2
+    assert score_position(position({25: 15}, {20: 14, 3: 1}), "white") == 3
+    assert score_position(position({20: 15}, {25: 15}), "black") == 3
+    assert score_position(position({10: 15}, {25: 15}), "black") == 2
+
+def test_rollout_is_reproducible_and_pool_gives_same_result():
+    a = rollout(LAST_ROLL, "black", trials=100, seed=3)
+    b = rollout(LAST_ROLL, "black", trials=100, seed=3, workers=2, chunk_size=16)
+    assert (a.equity, a.win, a.std_error) == (b.equity, b.win, b.std_error)
+    assert isinstance(a, RolloutResult) and a.trials_per_sec > 0
+
+def test_truncated_rollout_uses_evaluator():
+    r = rollout(Board(), "white", trials=36, truncate=2, seed=1)
+    assert r.truncated == 36
+    assert -1.0 <= r.equity <= 1.0
+    assert r.ci95[0] <= r.equity <= r.ci95[1]
+    assert 0.0 <= r.win <= 1.0
+
+def test_full_rollout_with_greedy_policy():
+    r = rollout(position({3: 3, 25: 12}, {21: 3, 25: 12}), "white", trials=72, policy=GreedyPolicy())
+    assert r.trials == 72 and r.truncated == 0
+    assert r.win > 0.5          # white tira primero en una carrera pareja
+
+def test_rollout_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        rollout(LAST_ROLL, "red")
+    with pytest.raises(ValueError):
+        rollout(LAST_ROLL, "white", trials=0)
+    with pytest.raises(ValueError):
+        rollout(LAST_ROLL, "white", trials=101)
+    assert rollout(LAST_ROLL, "white", trials=3, antithetic=False).trials == 3
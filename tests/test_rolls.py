@@ -0,0 +1,61 @@
+import pytest
+from core.board import Board
+from core.movegen import generate_play_positions, position_of
+from core.rolls import (
+    ROLLS, PlayTable, count_shots, legal_play_positions, plays_for_all_rolls, roll_index,
+)
+
+
+def shot_position():
+    """White: una ficha en 10 y 14 en 1; black: un blot en 7 y 14 en 24."""
+    white, black = [0] * 26, [0] * 26
+    white[10], white[1] = 1, 14
+    black[7], black[24] = 1, 14
+    return (tuple(white), tuple(black))
+
+
+def test_roll_table_weights():
+    assert len(ROLLS) == 21
+    assert sum(r.weight for r in ROLLS) == pytest.approx(1.0)
+    assert sum(r.count for r in ROLLS) == 36
+    doubles = [r for r in ROLLS if r.is_double]
+    assert len(doubles) == 6 and all(r.weight == pytest.approx(1 / 36) and len(r.dice) == 4 for r in doubles)
+    assert all(r.weight == pytest.approx(1 / 18) for r in ROLLS if not r.is_double)
+
+def test_roll_index():
+    assert roll_index([5, 3]) == roll_index([3, 5]) == ROLLS.index(next(r for r in ROLLS if r.values == (3, 5)))
+    assert ROLLS[roll_index([4, 4, 4, 4])].values == (4, 4)
+    with pytest.raises(ValueError):
+        roll_index([0, 7])
+
+def test_all_rolls_match_the_generator():
+    pos = position_of(Board())
+    table = PlayTable()
+    all_plays = plays_for_all_rolls(pos, "black", table)
+    assert [plays for plays in all_plays] == [
+        generate_play_positions(pos, "black", r.dice) for r in ROLLS
+    ]
+    assert plays_for_all_rolls(Board(), "black", table) == all_plays     # tablero o posición
+    assert (table.misses, table.hits) == (1, 1)
+
+def test_lru_eviction_and_lazy_rolls():
+    table = PlayTable(maxsize=2)
+    start = position_of(Board())
+    other = shot_position()
+    table.plays_for_dice(start, "white", [3, 1])
+    assert table._entries[(start, "white")].count(None) == 20       # sólo se generó 3-1
+    table.plays_for_dice(other, "white", [6, 6, 6, 6])
+    table.plays_for_dice(start, "white", [1, 3])                   # hit: pasa a ser la más reciente
+    table.plays_for_dice(start, "black", [2, 1])                   # desaloja a `other`
+    assert (table.hits, table.misses, table.evictions, len(table)) == (1, 3, 1, 2)
+    assert (other, "white") not in table._entries
+    # dados parciales: correctos pero sin memoizar
+    assert legal_play_positions(start, "white", [5, 5, 5], table) == generate_play_positions(start, "white", [5, 5, 5])
+    assert len(table) == 2
+    with pytest.raises(ValueError):
+        PlayTable(0)
+
+def test_count_shots():
+    pos = shot_position()
+    assert count_shots(pos, "white", PlayTable()) == 14     # 11 directos + 1-2, 2-1 y 1-1
+    assert count_shots(position_of(Board()), "white") == 0
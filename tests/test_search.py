@@ -0,0 +1,109 @@
+import pytest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.eval import HeuristicEvaluator, rank_plays
+from core.game import BackgammonGame
+from core.movegen import apply_play, position_of
+from core.player import Player
+from core.search import ROLLS, ExpectimaxSearch, search
+from cli.hint_engine import HINT_TIME_LIMIT, format_play, suggest_move
+
+
+def bearoff_position():
+    """White con fichas en 1 y 5, black con 3 en su punto 20; el resto borneadas."""
+    white, black = [0] * 26, [0] * 26
+    white[1] = white[5] = 1
+    white[25] = 13
+    black[20] = 3
+    black[25] = 12
+    return (tuple(white), tuple(black))
+
+
+def test_rolls_cover_the_36_outcomes():
+    assert len(ROLLS) == 21
+    assert sum(p for _, p in ROLLS) == pytest.approx(1.0)
+    assert sum(1 for dice, _ in ROLLS if len(dice) == 4) == 6
+
+def test_zero_ply_matches_static_ranking():
+    ev = HeuristicEvaluator()
+    result = search(Board(), "white", [3, 1], depth=0, evaluator=ev)
+    assert result.ranked == rank_plays(Board(), "white", [3, 1], ev)
+    assert result.play == ((8, 3), (6, 1))
+
+@pytest.mark.parametrize("dice", [(6, 5), (4, 2)])
+def test_pruning_keeps_the_best_play_and_equity(dice):
+    pos = position_of(Board())
+    pruned = ExpectimaxSearch(depth=1).analyze(pos, "white", dice)
+    full = ExpectimaxSearch(depth=1, prune=False).analyze(pos, "white", dice)
+    assert pruned.play == full.play
+    assert pruned.equity == pytest.approx(full.equity)
+    assert pruned.nodes < full.nodes
+    exact = dict(full.ranked)
+    assert all(bound >= exact[play] - 1e-9 for play, bound in pruned.ranked)
+
+@pytest.mark.parametrize("dice", [(5, 2), (4, 3)])
+def test_two_ply_candidate_filter_uses_exact_values(dice):
+    # Las pasadas que filtran candidatas no podan: el resultado es el de la búsqueda completa
+    pos = position_of(Board())
+    pruned = ExpectimaxSearch(depth=2).analyze(pos, "white", dice)
+    full = ExpectimaxSearch(depth=2, prune=False).analyze(pos, "white", dice)
+    assert pruned.play == full.play
+    assert pruned.equity == pytest.approx(full.equity)
+
+def test_two_ply_in_bearoff_finds_the_win_and_matches_unpruned():
+    board = bearoff_position()
+    win = ExpectimaxSearch(depth=2).analyze(board, "white", (5, 1))
+    assert win.equity == 1.0 and win.nodes < 100
+    dice = (4, 2)
+    pruned = ExpectimaxSearch(depth=2).analyze(board, "white", dice)
+    full = ExpectimaxSearch(depth=2, prune=False).analyze(board, "white", dice)
+    assert pruned.play == full.play and pruned.equity == pytest.approx(full.equity)
+    assert pruned.depth == 2 and -1.0 <= pruned.equity <= 1.0
+
+def test_forced_or_empty_play_skips_the_search():
+    b = CompactBoard(empty=True)
+    b.set_count_at(0, "white", 15)
+    for p in range(19, 25):
+        b.set_count_at(p, "black", 2)
+    b.set_count_at(1, "black", 3)
+    result = ExpectimaxSearch(depth=2).analyze(b, "white", (3, 5))
+    assert result.play == () and result.ranked == [((), result.equity)]
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        ExpectimaxSearch(depth=-1)
+    with pytest.raises(ValueError):
+        ExpectimaxSearch(candidates=(0,))
+    with pytest.raises(ValueError):
+        ExpectimaxSearch(time_limit=0)
+
+def test_time_limit_falls_back_to_the_last_complete_pass():
+    pos = position_of(Board())
+    static = ExpectimaxSearch(depth=0).analyze(pos, "white", (6, 5))
+    cut = ExpectimaxSearch(depth=2, time_limit=1e-9).analyze(pos, "white", (6, 5))
+    assert cut.depth == 0 and (cut.play, cut.equity) == (static.play, static.equity)
+
+def test_two_ply_decisions_take_under_a_second():
+    pos, color = position_of(Board()), "white"
+    search = ExpectimaxSearch(depth=2, time_limit=HINT_TIME_LIMIT)
+    for dice in [(6, 5), (4, 2), (3, 3, 3, 3), (6, 1)]:
+        result = search.analyze(pos, color, dice)
+        assert result.elapsed < 1.0 and result.depth >= 1
+        pos, color = apply_play(pos, color, result.play), "black" if color == "white" else "white"
+
+def test_game_analyze_and_hint_do_not_mutate_state():
+    game = BackgammonGame(Board(), Dice(7), (Player("W", "white"), Player("B", "black")),
+                          starting_color="white")
+    game.board.make_move("black", 1, 2)        # fuera del libro de aperturas
+    game.start_turn()
+    before = (game.board.snapshot(), game.state())
+    result = game.analyze(depth=1)
+    assert result.play in game.legal_plays()
+    hint = suggest_move(game, depth=1)
+    assert hint.startswith(format_play(result.play)) and "1-ply" in hint
+    assert (game.board.snapshot(), game.state()) == before
+
+def test_format_play():
+    assert format_play(((0, 3), (13, 5))) == "move bar 3, move 13 5"
+    assert format_play(()) == "sin movimientos posibles"
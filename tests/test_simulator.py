@@ -0,0 +1,137 @@
+import pytest
+from core.board import Board
+from core.dice import Dice
+from core.player import Player
+from core.game import BackgammonGame
+from sim import GreedyPolicy, RandomPolicy, SimStats, make_policy, play_game, run_games
+from sim.simulator import PHASES
+import run_selfplay
+
+
+def test_play_game_finishes_with_outcome_from_game():
+    timings = {}
+    record = play_game(RandomPolicy(1), RandomPolicy(2), seed=3, timings=timings)
+    assert record.winner in ("white", "black")
+    assert record.outcome in ("single", "gammon", "backgammon")
+    assert record.points == {"single": 1, "gammon": 2, "backgammon": 3}[record.outcome]
+    assert record.turns > 10
+    assert set(timings) == set(PHASES) and all(t >= 0 for t in timings.values())
+
+def test_fast_path_plays_the_same_game_as_validated_path():
+    for seed in (0, 1, 2):
+        fast = play_game(RandomPolicy(seed), RandomPolicy(seed + 10), seed=seed)
+        slow = play_game(RandomPolicy(seed), RandomPolicy(seed + 10), seed=seed,
+                         board_factory=Board, validate=True)
+        assert fast == slow
+
+def test_run_games_is_reproducible_and_stats_add_up():
+    a = run_games(6, RandomPolicy(5), RandomPolicy(6), seed=11)
+    b = run_games(6, RandomPolicy(5), RandomPolicy(6), seed=11)
+    assert (a.wins, a.outcomes, a.points, a.turns) == (b.wins, b.outcomes, b.points, b.turns)
+    assert a.games == 6 == sum(a.wins.values()) == sum(a.outcomes.values())
+    assert a.games_per_sec > 0
+    assert "partidas/s" in a.summary()
+
+def test_max_turns_leaves_game_unfinished():
+    record = play_game(RandomPolicy(0), RandomPolicy(0), seed=0, max_turns=3)
+    assert record.winner is None and record.turns == 3
+    stats = SimStats()
+    stats.add(record)
+    assert stats.unfinished == 1 and not stats.wins
+
+def test_greedy_beats_random():
+    stats = run_games(10, GreedyPolicy(), RandomPolicy(4), seed=2)
+    assert stats.wins["white"] >= 8
+
+def test_stats_merge():
+    a = run_games(2, RandomPolicy(1), RandomPolicy(2), seed=1)
+    b = run_games(3, RandomPolicy(1), RandomPolicy(2), seed=2)
+    games, turns = a.games + b.games, a.turns + b.turns
+    a.merge(b)
+    assert a.games == games and a.turns == turns
+    assert sum(a.wins.values()) == 5
+
+def test_make_policy_and_entry_script(capsys):
+    assert isinstance(make_policy("random", 1), RandomPolicy)
+    assert isinstance(make_policy("greedy"), GreedyPolicy)
+    with pytest.raises(ValueError):
+        make_policy("nope")
+    stats = run_selfplay.main(["--games", "2", "--seed", "4"])
+    assert stats.games == 2
+    out = capsys.readouterr().out
+    assert "Partidas: 2" in out
+    run_selfplay.main(["--games", "2", "--seed", "4", "--workers", "2", "--batch-size", "1"])
+    digest = [line for line in out.splitlines() if line.startswith("Digest")]
+    assert digest and digest[0] in capsys.readouterr().out
+
+def test_game_apply_play_validates_by_default():
+    dice = Dice()
+    game = BackgammonGame(Board(), dice, (Player("W", "white"), Player("B", "black")), starting_color="white")
+    dice.roll = lambda: dice.simulate_roll(6, 4)
+    game.start_turn()
+    game.apply_play(((8, 6), (6, 4)))
+    assert game.board.count_at(2, "white") == 2
+    assert not dice.has_moves()
+
+
+# ---------------- Granja multiproceso ----------------
+
+def test_game_seed_is_stable_and_distinct():
+    from sim import game_seed
+    assert game_seed(7, 0) == game_seed(7, 0)
+    assert len({game_seed(7, i) for i in range(100)}) == 100
+    assert game_seed(7, 1) != game_seed(8, 1)
+
+def test_pack_unpack_records_roundtrip():
+    from sim.farm import pack_records, unpack_records
+    records = [play_game(RandomPolicy(i), RandomPolicy(i), seed=i) for i in range(3)]
+    records.append(play_game(RandomPolicy(0), RandomPolicy(0), seed=0, max_turns=2))
+    data = pack_records(records)
+    assert len(data) == 8 * len(records)
+    assert unpack_records(data) == records
+
+def test_farm_results_do_not_depend_on_workers_or_batches():
+    from sim import run_farm
+    inline = run_farm(12, "random", "greedy", master_seed=5, workers=1, batch_size=5)
+    pooled = run_farm(12, "random", "greedy", master_seed=5, workers=2, batch_size=3)
+    assert inline.records == pooled.records
+    assert inline.digest() == pooled.digest()
+    assert inline.stats.games == 12 and inline.stats.wins == pooled.stats.wins
+    assert run_farm(12, "random", "greedy", master_seed=6, workers=1).digest() != inline.digest()
+
+def test_iter_farm_streams_batches_in_order():
+    from sim import iter_farm
+    starts = [start for start, records, _ in iter_farm(7, master_seed=1, workers=1, batch_size=3)]
+    assert starts == [0, 3, 6]
+    with pytest.raises(ValueError):
+        next(iter_farm(3, batch_size=0))
+
+
+# ---------------- Reinicio y pool de partidas ----------------
+
+def test_game_reset_returns_to_opening_in_place():
+    from core.compact_board import CompactBoard
+    for board in (Board(), CompactBoard()):
+        dice = Dice(1)
+        game = BackgammonGame(board, dice, (Player("W", "white"), Player("B", "black")))
+        key = board.zobrist_key()
+        game.start_turn()
+        game.apply_play(game.best_play())
+        game.reset(starting_color="black", dice_seed=3)
+        assert game.board is board and board.zobrist_key() == key
+        assert board.pip_count("white") == 167 and board.count_off("white") == 0
+        assert game.current_color == "black" and not game.game_over and dice.last_roll is None
+        assert dice.roll() == Dice(3).roll()
+
+def test_pool_reuses_games_and_plays_the_same_games():
+    from sim import GamePool
+    pool = GamePool(size=1)
+    with pool.game() as game:
+        assert len(pool) == 0
+    assert len(pool) == 1 and pool.acquire() is game and pool.created == 1
+    pool.release(game)
+    for seed in (0, 1):
+        fresh = play_game(RandomPolicy(seed), RandomPolicy(seed + 1), seed=seed)
+        pooled = play_game(RandomPolicy(seed), RandomPolicy(seed + 1), seed=seed, pool=pool)
+        assert fresh == pooled
+    assert pool.created == 1
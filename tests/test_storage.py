@@ -0,0 +1,86 @@
+import json
+import pytest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.player import Player
+from storage import (
+    StorageError, decode_game, encode_game, game_from_dict, game_to_dict, load_game, save_game,
+)
+
+
+def mid_turn_game():
+    dice = Dice(5)
+    game = BackgammonGame(Board(), dice, (Player("Ana", "white"), Player("Beto", "black")), starting_color="white")
+    dice.roll = lambda: dice.simulate_roll(6, 4)
+    game.start_turn()
+    game.apply_player_move(8, 6)         # queda el 4 por jugar
+    game.players["white"].add_score(2)
+    return game
+
+def assert_same_state(a, b):
+    assert a.board.snapshot() == b.board.snapshot()
+    assert a.board.zobrist_key() == b.board.zobrist_key()
+    assert (a.current_color, a.turn_number, a.game_over) == (b.current_color, b.turn_number, b.game_over)
+    assert a.state() == b.state()
+    assert (a.dice.last_roll, a.dice.available_moves, a.dice.used_moves) == \
+           (b.dice.last_roll, b.dice.available_moves, b.dice.used_moves)
+
+
+@pytest.mark.parametrize("name", ["game.json", "game.bgs"])
+def test_save_and_load_resume_mid_turn(tmp_path, name):
+    game = mid_turn_game()
+    path = str(tmp_path / name)
+    save_game(game, path)
+    loaded = load_game(path)
+    assert_same_state(game, loaded)
+    assert loaded.players["white"].name == "Ana" and loaded.players["white"].score == 2
+    # el turno sigue: se puede jugar el 4 que quedaba y terminar
+    loaded.apply_player_move(6, 4)
+    loaded.end_turn()
+    assert loaded.current_color == "black"
+
+def test_json_keeps_state_summary_and_position_id(tmp_path):
+    path = tmp_path / "game.json"
+    save_game(mid_turn_game(), str(path))
+    data = json.loads(path.read_text())
+    assert data["state"] == {"current_color": "white", "dice_values": [4], "moves_left": 1}
+    assert data["version"] == 1 and len(data["position_id"]) == 14
+
+def test_binary_roundtrip_in_place_and_finished_game():
+    game = mid_turn_game()
+    game._finalize_game("white")
+    target = BackgammonGame(CompactBoard(), Dice(), (Player("W", "white"), Player("B", "black")))
+    assert decode_game(encode_game(game), game=target) is target
+    assert_same_state(game, target)
+    assert (target.result.winner_color, target.result.outcome) == ("white", game.result.outcome)
+
+def test_invalid_data_raises_storage_error(tmp_path):
+    data = game_to_dict(mid_turn_game())
+    with pytest.raises(StorageError):
+        game_from_dict(dict(data, version=99))
+    broken = dict(data, board={"white": [1] * 26, "black": data["board"]["black"]})
+    with pytest.raises(StorageError):
+        game_from_dict(broken)
+    with pytest.raises(StorageError):
+        decode_game(b"BGSV" + bytes(5))
+    bad = tmp_path / "bad.json"
+    bad.write_text("[1, 2]")
+    with pytest.raises(StorageError):
+        load_game(str(bad))
+
+@pytest.mark.parametrize("name", ["game.json", "game.bgs"])
+def test_load_in_place_discards_undo_history(tmp_path, name):
+    dice = Dice()
+    game = BackgammonGame(Board(), dice, (Player("W", "white"), Player("B", "black")), starting_color="white")
+    dice.roll = lambda: dice.simulate_roll(6, 4)
+    game.start_turn()
+    path = str(tmp_path / name)
+    save_game(game, path)
+    saved = game.board.snapshot()
+    game.apply_player_move(24, 4)
+    assert game.can_undo()
+    assert load_game(path, game=game) is game
+    assert not game.can_undo() and not game.can_redo()
+    assert not game.undo_last_move() and game.board.snapshot() == saved
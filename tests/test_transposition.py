@@ -0,0 +1,71 @@
+import pytest
+from core.board import Board
+from core.movegen import position_of
+from core.search import ExpectimaxSearch, _root_key
+from core.transposition import (
+    ENTRY_BYTES, EXACT, LOWER, UPPER, TranspositionTable, dice_key, make_key,
+)
+
+
+def single_slot():
+    return TranspositionTable(max_bytes=ENTRY_BYTES, ways=1)
+
+
+def test_keys_depend_on_side_and_dice_but_not_dice_order():
+    pos = position_of(Board())
+    assert make_key(pos, "white", [3, 5]) == make_key(pos, "white", [5, 3])
+    assert make_key(pos, "white", [2, 2, 2, 2]) == make_key(pos, "white", [2, 2])
+    assert make_key(pos, "white") != make_key(pos, "black")
+    assert make_key(pos, "white", [1, 2]) != make_key(pos, "white")
+    assert len({dice_key([a, b]) for a in range(1, 7) for b in range(1, 7)}) == 21
+
+def test_capacity_follows_the_memory_budget():
+    table = TranspositionTable(max_bytes=ENTRY_BYTES * 100, ways=4)
+    assert table.capacity == 100 and table.buckets == 25
+    with pytest.raises(ValueError):
+        TranspositionTable(max_bytes=ENTRY_BYTES * 3, ways=4)
+
+def test_probe_respects_depth_and_bound_type():
+    table = TranspositionTable(max_bytes=ENTRY_BYTES * 64)
+    table.store(1, 2, 0.3, EXACT, ((8, 3),))
+    table.store(2, 2, 0.5, LOWER)
+    table.store(3, 2, -0.2, UPPER)
+    assert table.probe(1, 2, -1, 1) == 0.3 and table.probe(1, 1, -1, 1) == 0.3
+    assert table.probe(1, 3, -1, 1) is None                # más profundo que lo guardado
+    assert table.probe(2, 1, -1, 0.4) == 0.5 and table.probe(2, 1, -1, 0.6) is None
+    assert table.probe(3, 1, -0.1, 1) == -0.2 and table.probe(3, 1, -0.3, 1) is None
+    assert table.get(1).play == ((8, 3),) and table.get(99) is None
+    assert (table.probes, table.hits, len(table)) == (7, 4, 3)
+    assert table.hit_rate == pytest.approx(4 / 7)
+
+def test_depth_preferred_replacement_with_aging():
+    table = single_slot()
+    assert table.store(1, 3, 0.1)
+    assert not table.store(2, 1, 0.2)                     # menos profundo: se descarta
+    assert not table.store(1, 2, 0.3)                     # misma clave, menos profunda
+    assert table.get(1).value == 0.1 and table.rejected == 2
+    table.new_search()
+    assert table.store(2, 1, 0.2)                         # la vieja envejeció
+    assert table.get(1) is None and table.evictions == 1
+    assert table.stats()["used"] == 1
+
+def test_search_with_table_matches_and_reuses_work():
+    pos = position_of(Board())
+    plain = ExpectimaxSearch(depth=2).analyze(pos, "white", (4, 2))
+    table = TranspositionTable(max_bytes=4 * 1024 * 1024)
+    search = ExpectimaxSearch(depth=2, table=table)
+    first = search.analyze(pos, "white", (4, 2))
+    assert (first.play, first.equity) == (plain.play, pytest.approx(plain.equity))
+    assert table.hits > 0                                 # la pasada de 2-ply reusa la de 1-ply
+    again = search.analyze(pos, "white", (4, 2))
+    assert again.play == first.play and again.nodes < first.nodes
+    assert table.get(_root_key(pos, "white", (4, 2))).play == first.play
+
+def test_root_results_do_not_leak_into_best_replies():
+    pos = position_of(Board())
+    static = ExpectimaxSearch(depth=0)._best_reply(pos, "black", (6, 3))
+    search = ExpectimaxSearch(depth=2, table=TranspositionTable(max_bytes=4 * 1024 * 1024))
+    search.analyze(pos, "black", (6, 3))
+    search.analyze(pos, "black", (6,))                    # raíz a mitad de turno
+    assert search._best_reply(pos, "black", (6, 3)) == static
+    assert _root_key(pos, "black", (6,)) != _root_key(pos, "black", (6, 6))
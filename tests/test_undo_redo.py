@@ -0,0 +1,51 @@
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.player import Player
+
+
+def make_game(board=None, roll=(6, 4)):
+    dice = Dice()
+    game = BackgammonGame(board or Board(), dice, (Player("W", "white"), Player("B", "black")),
+                          starting_color="white")
+    dice.roll = lambda: dice.simulate_roll(*roll)
+    return game
+
+
+def test_undo_restores_board_dice_and_hit():
+    board = Board()
+    board.set_count_at(20, "black", 1)           # blot negro
+    game = make_game(board, roll=(4, 2))
+    game.start_turn()
+    before = (board.snapshot(), board.zobrist_key(), list(game.dice.available_moves))
+    game.apply_player_move(24, 4)                # captura en 20
+    game.apply_player_move(13, 2)
+    assert board.count_bar("black") == 1
+    assert game.undo_last_move() and game.undo_last_move()
+    assert (board.snapshot(), board.zobrist_key(), game.dice.available_moves) == before
+    assert game.dice.used_moves == [] and not game.undo_last_move()
+
+def test_redo_replays_and_new_move_clears_redo():
+    game = make_game()
+    game.start_turn()
+    game.apply_player_move(8, 6)
+    after = game.board.snapshot()
+    game.undo_last_move()
+    assert game.can_redo() and game.redo()
+    assert game.board.snapshot() == after and game.dice.available_moves == [4]
+    game.undo_last_move()
+    game.apply_player_move(13, 6)
+    assert not game.can_redo()
+
+def test_fast_path_moves_are_undoable_and_history_is_per_turn():
+    game = make_game(CompactBoard())
+    game.start_turn()
+    start = game.board.snapshot()
+    game.apply_play(((8, 6), (6, 4)), validate=False)
+    while game.undo_last_move():
+        pass
+    assert game.board.snapshot() == start and sorted(game.dice.available_moves) == [4, 6]
+    game.apply_play(((8, 6), (6, 4)), validate=False)
+    game.end_turn()
+    assert not game.can_undo() and not game.undo_last_move()
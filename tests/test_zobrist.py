@@ -0,0 +1,85 @@
+import random
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.checker import Checker
+from core.dice import Dice
+from core.player import Player
+from core.game import BackgammonGame
+from core.movegen import generate_play_positions, generate_plays, position_of
+from core.zobrist import board_key, position_key, point_key, side_key
+
+
+def test_initial_keys_match_full_recompute_and_across_boards():
+    b, cb = Board(), CompactBoard()
+    assert b.zobrist_key() == board_key(b) == cb.zobrist_key()
+    assert b.zobrist_key() != 0
+    assert CompactBoard(empty=True).zobrist_key() == 0
+
+def test_key_changes_and_returns_on_reversible_move():
+    b = Board()
+    start = b.zobrist_key()
+    b.move_checker("white", 8, 3)
+    assert b.zobrist_key() != start
+    assert b.zobrist_key() == b.recompute_zobrist_key()
+    # 5 -> 8 no es un movimiento blanco: devolvemos la ficha "a mano"
+    b.remove_checker(5)
+    b.place_checker(Checker("white", 8), 8)
+    assert b.zobrist_key() == start
+
+def test_transpositions_share_the_same_key():
+    a, b = Board(), Board()
+    a.move_checker("white", 24, 3)
+    a.move_checker("white", 21, 1)
+    b.move_checker("white", 24, 1)
+    b.move_checker("white", 23, 3)
+    assert a.zobrist_key() == b.zobrist_key()
+
+def test_hits_reentry_bear_off_and_set_count_keep_key_in_sync():
+    for cls in (Board, CompactBoard):
+        b = cls()
+        b.set_count_at(5, "black", 1)
+        b.move_checker("white", 8, 3)                  # captura
+        assert b.zobrist_key() == b.recompute_zobrist_key()
+        b.reenter_checker("black", 3)
+        assert b.zobrist_key() == b.recompute_zobrist_key()
+        for p in range(7, 25):
+            b.set_count_at(p, "white", 0)
+        b.set_count_at(0, "white", 0)
+        b.bear_off_checker("white", 6, 6)
+        assert b.zobrist_key() == b.recompute_zobrist_key()
+
+def test_random_games_keep_incremental_key_equal_to_recompute():
+    rng = random.Random(4)
+    for cls in (Board, CompactBoard):
+        board, color = cls(), "white"
+        for _ in range(120):
+            a, d = rng.randint(1, 6), rng.randint(1, 6)
+            play = rng.choice(generate_plays(board, color, [a] * 4 if a == d else [a, d]))
+            for from_pos, steps in play:
+                if from_pos == 0:
+                    board.reenter_checker(color, steps)
+                else:
+                    board.move_or_bear_off(color, from_pos, steps)
+            assert board.zobrist_key() == board_key(board)
+            if board.count_off(color) == 15:
+                break
+            color = "black" if color == "white" else "white"
+
+def test_position_key_of_generated_positions():
+    b = Board()
+    keys = {position_key(pos) for _, pos in generate_play_positions(b, "white", [6, 1])}
+    assert len(keys) == len(generate_plays(b, "white", [6, 1]))
+    assert position_key(position_of(b)) == b.zobrist_key()
+
+def test_point_key_handles_out_of_range_counts():
+    assert point_key("white", 3, 0) == 0
+    assert point_key("white", 3, 16) != point_key("white", 3, 17)
+
+def test_game_position_key_includes_side_to_move():
+    players = (Player("W", "white"), Player("B", "black"))
+    white = BackgammonGame(Board(), Dice(), players, starting_color="white")
+    black = BackgammonGame(Board(), Dice(), players, starting_color="black")
+    assert white.position_key() ^ black.position_key() == side_key("black")
+    # sin zobrist_key en el tablero se recalcula desde cero
+    white.board.zobrist_key = None
+    assert white.position_key() == board_key(white.board)